@@ -1 +1,9 @@
 from app.adapters.driven.models.customer_model import CustomerModel  # noqa: F401
+from app.adapters.driven.models.customer_outbox_model import (  # noqa: F401
+    CustomerOutboxDeadLetterModel,
+    CustomerOutboxModel,
+)
+from app.adapters.driven.models.login_throttle_model import (  # noqa: F401
+    LoginThrottleBucketModel,
+)
+from app.adapters.driven.models.refresh_token_model import RefreshTokenModel  # noqa: F401
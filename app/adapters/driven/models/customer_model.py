@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Boolean, Column, Index, Integer, String, func
 from app.shared.mixins.timestamp_mixin import TimestampMixin
 from database import Base
 
@@ -9,6 +9,13 @@ class CustomerModel(TimestampMixin, Base):
     """
 
     __tablename__ = "customers"
+    __table_args__ = (
+        # paginação keyset (GET /api/client)
+        Index("ix_customers_created_at_id", "created_at", "id"),
+        Index("ix_customers_active_created_at_id", "active", "created_at", "id"),
+        # feed incremental (GET /api/client/changes)
+        Index("ix_customers_updated_at_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
@@ -16,6 +23,18 @@ class CustomerModel(TimestampMixin, Base):
     email = Column(String, unique=True, nullable=False)
     active = Column(Boolean, default=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
 
     def __repr__(self):
         return f"<Customer(id={self.id}, cpf={self.cpf})>"
+
+
+# filtro por prefixo: lower(name) LIKE 'abc%'
+Index(
+    "ix_customers_lower_name",
+    func.lower(CustomerModel.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
+
+# GIN gin_trgm_ops em name/email (busca) exigem a extensão pg_trgm e existem
+# só via migration 9b1e6f3a2c58; create_all (testes em SQLite) não os cria.
@@ -0,0 +1,72 @@
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from database import Base
+
+
+class CustomerOutboxModel(Base):
+    """
+    Eventos de cliente ainda não entregues. A linha é gravada na transação da
+    alteração e apagada pelo relay depois da entrega.
+    Sem FK para ``customers``: o evento de exclusão sobrevive ao cliente.
+    """
+
+    __tablename__ = "customer_outbox"
+    __table_args__ = (
+        # lote do relay: available_at <= now() ORDER BY id
+        Index("ix_customer_outbox_available_at_id", "available_at", "id"),
+    )
+
+    # BIGINT no Postgres; no SQLite só INTEGER PRIMARY KEY é autoincremento
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    event_type = Column(String(40), nullable=False)
+    customer_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # próxima tentativa; sobe com backoff a cada falha de entrega
+    available_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<CustomerOutbox(id={self.id}, type={self.event_type})>"
+
+
+class CustomerOutboxDeadLetterModel(Base):
+    """
+    Eventos que estouraram ``OUTBOX_MAX_ATTEMPTS``. Saem do outbox para não
+    travar a fila; ficam aqui, com o último erro, para análise e reenvio manual.
+    """
+
+    __tablename__ = "customer_outbox_dead_letters"
+
+    # mesmo id do outbox: o consumidor deduplica por ele num reenvio
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=False,
+    )
+    event_type = Column(String(40), nullable=False)
+    customer_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
+    failed_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CustomerOutboxDeadLetter(id={self.id}, type={self.event_type})>"
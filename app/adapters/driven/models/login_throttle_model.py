@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Float, String
+from database import Base
+
+
+class LoginThrottleBucketModel(Base):
+    """
+    Estado compartilhado dos token buckets de login (entre workers/tasks).
+    ``key`` já vem com hash; não guardamos CPF/e-mail/IP em claro.
+    """
+
+    __tablename__ = "login_throttle_buckets"
+
+    key = Column(String(64), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    refilled_at = Column(Float, nullable=False)  # epoch em segundos
+
+    def __repr__(self):
+        return f"<LoginThrottleBucket(key={self.key}, tokens={self.tokens})>"
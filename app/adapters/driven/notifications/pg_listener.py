@@ -0,0 +1,106 @@
+import logging
+import select
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PgNotificationListener:
+    """
+    ``LISTEN`` num canal do Postgres em uma thread própria, com conexão
+    dedicada (fora do pool) em autocommit. Cada payload vai para
+    ``on_payload``; a cada (re)conexão ``on_connect`` é chamado, já que
+    notificações emitidas enquanto estava desconectado se perderam.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        on_payload: Callable[[str], None],
+        on_connect: Optional[Callable[[], None]] = None,
+        poll_seconds: float = 5.0,
+        max_backoff_seconds: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.on_payload = on_payload
+        self.on_connect = on_connect
+        self.poll_seconds = poll_seconds
+        self.max_backoff = max_backoff_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.connected = False
+        self.connects = 0
+        self.notifications = 0
+        self.last_error: Optional[str] = None
+
+    # ---------- ciclo de vida ----------
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"listen-{self.channel}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ---------- loop ----------
+    def _connect(self):
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return conn
+
+    def _drain(self, conn) -> None:
+        conn.poll()
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            self.notifications += 1
+            try:
+                self.on_payload(notify.payload)
+            except Exception:
+                logger.exception("Falha ao processar notificação de %s", self.channel)
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                self.connected = True
+                self.connects += 1
+                backoff = 1.0
+                if self.on_connect:
+                    self.on_connect()
+                while not self._stop.is_set():
+                    # sem notificação no intervalo: só confere o _stop
+                    if select.select([conn], [], [], self.poll_seconds)[0]:
+                        self._drain(conn)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("LISTEN %s interrompido: %s", self.channel, e)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+            finally:
+                self.connected = False
+                if conn is not None:
+                    conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "connected": self.connected,
+            "connects": self.connects,
+            "notifications": self.notifications,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,256 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.adapters.driven.models.customer_outbox_model import (
+    CustomerOutboxDeadLetterModel,
+    CustomerOutboxModel,
+)
+from app.adapters.driven.repositories.customer_outbox import OUTBOX_ENABLED
+from app.adapters.driven.repositories.customer_queries import ts
+from app.domain.ports.event_sink import EventSink, OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# com o outbox ligado, cada worker roda um relay (SKIP LOCKED divide o trabalho)
+OUTBOX_RELAY_ENABLED = (
+    os.getenv("OUTBOX_RELAY_ENABLED", str(OUTBOX_ENABLED)).lower() == "true"
+)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "1"))
+OUTBOX_MAX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_MAX_BACKOFF_SECONDS", "300"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "10"))
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite devolve sem fuso; o banco grava em UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class OutboxRelay:
+    """
+    Drena ``customer_outbox`` em lotes para um ``EventSink``, numa thread.
+
+    Cada lote é lido com ``FOR UPDATE SKIP LOCKED``: vários workers/réplicas
+    drenam em paralelo sem pegar as mesmas linhas. Entregue, o lote é
+    apagado na mesma transação.
+
+    Se o sink recusar o lote, os eventos vão um a um até o primeiro que
+    falhar: esse ganha ``attempts + 1`` e backoff exponencial, e os que ainda
+    não foram tentados neste lote esperam o mesmo prazo, sem contar tentativa
+    (o sink provavelmente está fora). Depois de ``max_attempts`` o evento vai
+    para ``customer_outbox_dead_letters``.
+
+    A entrega é "ao menos uma vez" e sem ordem garantida: eventos fora do lote
+    (inclusive do mesmo cliente) seguem saindo durante o backoff, e relays em
+    paralelo entregam lotes fora de sequência. O consumidor deduplica pelo
+    ``id`` e compara ``data.updated_at`` para descartar estado mais velho.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sink: EventSink,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+        max_backoff_seconds: float = OUTBOX_MAX_BACKOFF_SECONDS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.session_factory = session_factory
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_backoff = max_backoff_seconds
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.published = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.retried_events = 0
+        self.dead_lettered = 0
+        self.last_lag_seconds: Optional[float] = None
+        self.max_lag_seconds = 0.0
+        self.last_publish_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    # ---------- ciclo de vida ----------
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="outbox-relay", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                drained = self.drain_once()
+            except Exception as e:
+                # banco fora do ar etc.; o sink tem tratamento próprio
+                self.last_error = str(e)
+                logger.warning("Relay do outbox interrompido: %s", e)
+                drained = 0
+            if drained < self.batch_size:
+                self._stop.wait(self.poll_seconds)
+
+    # ---------- lote ----------
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(2 ** (attempts - 1), self.max_backoff))
+
+    def _publish(self, events: List[OutboxEvent]) -> Tuple[int, Optional[Exception]]:
+        """Quantos eventos do início saíram, e o erro que parou a entrega."""
+        try:
+            self.sink.publish(events)
+            return len(events), None
+        except Exception as e:
+            if len(events) == 1:
+                return 0, e
+        # isola o evento que o sink recusa (poison) do resto do lote
+        for index, event in enumerate(events):
+            try:
+                self.sink.publish([event])
+            except Exception as e:
+                return index, e
+        return len(events), None
+
+    def _reschedule(
+        self,
+        session: Session,
+        rows: List[CustomerOutboxModel],
+        error: Exception,
+        now: datetime,
+    ) -> bool:
+        """
+        Agenda o retry de ``rows[0]`` e adia os não tentados do lote; True se
+        o evento foi para a DLQ.
+        """
+        failed, waiting = rows[0], rows[1:]
+        failed.attempts += 1
+        failed.last_error = str(error)[:500]
+        if failed.attempts >= self.max_attempts:
+            session.add(
+                CustomerOutboxDeadLetterModel(
+                    id=failed.id,
+                    event_type=failed.event_type,
+                    customer_id=failed.customer_id,
+                    payload=failed.payload,
+                    created_at=failed.created_at,
+                    attempts=failed.attempts,
+                    last_error=failed.last_error,
+                )
+            )
+            session.delete(failed)
+            return True
+        failed.available_at = now + self._backoff(failed.attempts)
+        for row in waiting:
+            row.available_at = failed.available_at
+        return False
+
+    def drain_once(self) -> int:
+        """Entrega no máximo um lote; devolve quantos eventos saíram."""
+        with self.session_factory() as session:
+            dialect = session.get_bind().dialect.name
+            now = self.clock()
+            rows: List[CustomerOutboxModel] = list(
+                session.scalars(
+                    select(CustomerOutboxModel)
+                    .where(
+                        ts(CustomerOutboxModel.available_at, dialect)
+                        <= ts(now, dialect)
+                    )
+                    .order_by(CustomerOutboxModel.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            if not rows:
+                session.commit()
+                return 0
+
+            events = [
+                OutboxEvent(
+                    id=r.id,
+                    type=r.event_type,
+                    customer_id=r.customer_id,
+                    payload=r.payload,
+                    created_at=_utc(r.created_at),
+                    attempts=r.attempts,
+                )
+                for r in rows
+            ]
+            started = time.perf_counter()
+            sent, error = self._publish(events)
+            if sent:
+                session.execute(
+                    delete(CustomerOutboxModel).where(
+                        CustomerOutboxModel.id.in_([r.id for r in rows[:sent]])
+                    )
+                )
+            dead = False
+            if error is not None:
+                dead = self._reschedule(session, rows[sent:], error, now)
+            session.commit()
+
+        delivered = self.clock()
+        with self._lock:
+            if error is not None:
+                self.failed_batches += 1
+                self.retried_events += len(rows) - sent - dead
+                self.dead_lettered += dead
+                self.last_error = str(error)
+            if sent:
+                lag = max(
+                    (delivered - e.created_at).total_seconds() for e in events[:sent]
+                )
+                self.published += sent
+                self.batches += 1
+                self.last_publish_ms = round((time.perf_counter() - started) * 1000, 3)
+                self.last_lag_seconds = round(lag, 3)
+                self.max_lag_seconds = max(self.max_lag_seconds, self.last_lag_seconds)
+        if error is not None:
+            if dead:
+                logger.error(
+                    "Evento %d do outbox foi para a DLQ após %d tentativas: %s",
+                    events[sent].id,
+                    self.max_attempts,
+                    error,
+                )
+            else:
+                logger.warning(
+                    "Falha ao entregar %d eventos: %s", len(rows) - sent, error
+                )
+        return sent
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._thread is not None,
+                "sink": type(self.sink).__name__,
+                "published": self.published,
+                "batches": self.batches,
+                "failed_batches": self.failed_batches,
+                "retried_events": self.retried_events,
+                "dead_lettered": self.dead_lettered,
+                # criação -> entrega do evento mais antigo do último lote
+                "last_lag_seconds": self.last_lag_seconds,
+                "max_lag_seconds": self.max_lag_seconds,
+                "last_publish_ms": self.last_publish_ms,
+                "last_error": self.last_error,
+            }
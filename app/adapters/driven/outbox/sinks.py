@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+import urllib.request
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+from app.domain.ports.event_sink import EventSink, OutboxEvent
+
+# webhook | file | memory; sem padrão: com o relay ligado, um destino esquecido
+# (ou "memory" em produção) apagaria os eventos do outbox sem entregá-los
+OUTBOX_SINK = os.getenv("OUTBOX_SINK", "")
+OUTBOX_WEBHOOK_URL = os.getenv("OUTBOX_WEBHOOK_URL", "")
+OUTBOX_WEBHOOK_TIMEOUT_SECONDS = float(os.getenv("OUTBOX_WEBHOOK_TIMEOUT_SECONDS", "5"))
+OUTBOX_FILE_PATH = os.getenv("OUTBOX_FILE_PATH", "customer-events.ndjson")
+
+
+def _dumps(events: Sequence[OutboxEvent]) -> List[str]:
+    return [
+        json.dumps(e.to_message(), ensure_ascii=False, separators=(",", ":"))
+        for e in events
+    ]
+
+
+class WebhookSink:
+    """``POST`` do lote como array JSON; qualquer resposta fora de 2xx é falha."""
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = OUTBOX_WEBHOOK_TIMEOUT_SECONDS,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        if not url:
+            raise ValueError("OUTBOX_WEBHOOK_URL não configurada")
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        body = ("[" + ",".join(_dumps(events)) + "]").encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers=self.headers, method="POST"
+        )
+        # HTTPError (4xx/5xx) e URLError sobem para o relay, que agenda retry
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class FileSink:
+    """Acrescenta um evento por linha (NDJSON) e faz ``fsync`` por lote."""
+
+    def __init__(self, path: str = OUTBOX_FILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        lines = "".join(line + "\n" for line in _dumps(events))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class InMemoryBrokerSink:
+    """
+    Substituto local de um broker: guarda as últimas mensagens e repassa
+    cada lote aos assinantes deste processo. Para dev e testes.
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self.messages: Deque[dict] = deque(maxlen=maxlen)
+        self._subscribers: List[Callable[[Sequence[OutboxEvent]], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Sequence[OutboxEvent]], None]) -> None:
+        self._subscribers.append(callback)
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        for callback in self._subscribers:
+            callback(events)
+        with self._lock:
+            self.messages.extend(e.to_message() for e in events)
+
+
+def build_sink(name: str = OUTBOX_SINK) -> EventSink:
+    if not name:
+        raise ValueError(
+            "OUTBOX_SINK é obrigatório com o relay do outbox ligado "
+            "(webhook | file | memory)"
+        )
+    if name == "webhook":
+        return WebhookSink(OUTBOX_WEBHOOK_URL)
+    if name == "file":
+        return FileSink()
+    if name == "memory":
+        return InMemoryBrokerSink()
+    raise ValueError(f"Destino de eventos desconhecido: {name}")
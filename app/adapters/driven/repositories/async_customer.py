@@ -0,0 +1,295 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.driven.models.customer_model import CustomerModel
+from app.adapters.driven.repositories import customer_outbox, customer_queries
+from app.adapters.driven.repositories.customer import (
+    CustomerRepository,
+    duplicate_error,
+    rejected_batch_error,
+)
+from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports.async_customer_repository_port import (
+    AsyncCustomerRepositoryPort,
+)
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
+
+# mesmas conversões do repositório síncrono
+_to_domain = CustomerRepository._to_domain
+_sanitize_cpf = CustomerRepository._sanitize_cpf
+
+
+class AsyncCustomerRepository(AsyncCustomerRepositoryPort):
+    """Implementação SQLAlchemy (asyncio/asyncpg) da porta assíncrona."""
+
+    def __init__(self, session: AsyncSession, outbox: Optional[bool] = None):
+        self.session = session
+        self.outbox = customer_outbox.enabled(outbox)
+
+    async def _emit(self, statement) -> None:
+        if self.outbox and statement is not None:
+            await self.session.execute(statement)
+
+    async def _first(self, *criteria) -> Optional[Customer]:
+        result = await self.session.execute(
+            select(CustomerModel).where(*criteria).limit(1)
+        )
+        model = result.scalars().first()
+        return _to_domain(model) if model else None
+
+    # ---------- C ----------
+    async def create(self, customer: Customer) -> Customer:
+        statement = (
+            insert(CustomerModel)
+            .values(
+                name=customer.name,
+                cpf=_sanitize_cpf(customer.cpf.value),
+                email=customer.email.value,
+                password_hash=customer.password_hash,
+                active=customer.active,
+            )
+            .returning(CustomerModel)
+        )
+        try:
+            result = await self.session.execute(statement)
+            created = _to_domain(result.scalar_one())
+            await self._emit(
+                customer_outbox.insert_events(customer_outbox.CREATED, [created])
+            )
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise duplicate_error(e) or e
+        return created
+
+    async def bulk_create(self, customers: Sequence[Customer]) -> int:
+        """INSERT multi-linha numa transação (sem COPY no asyncpg por aqui)."""
+        if not customers:
+            return 0
+        try:
+            await self.session.execute(
+                insert(CustomerModel),
+                [
+                    {
+                        "name": c.name,
+                        "cpf": _sanitize_cpf(c.cpf.value),
+                        "email": c.email.value,
+                        "password_hash": c.password_hash,
+                        "active": c.active,
+                    }
+                    for c in customers
+                ],
+            )
+            if self.outbox:
+                created = await self._find_many(
+                    CustomerModel.cpf, {_sanitize_cpf(c.cpf.value) for c in customers}
+                )
+                await self._emit(
+                    customer_outbox.insert_events(customer_outbox.CREATED, created)
+                )
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise duplicate_error(e) or rejected_batch_error(e) from e
+        return len(customers)
+
+    # ---------- R ----------
+    async def find_by_id(self, customer_id: int) -> Optional[Customer]:
+        model = await self.session.get(CustomerModel, customer_id)
+        return _to_domain(model) if model else None
+
+    async def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        return await self._first(CustomerModel.cpf == _sanitize_cpf(cpf))
+
+    async def find_by_email(self, email: str) -> Optional[Customer]:
+        return await self._first(CustomerModel.email == email)
+
+    async def _find_many(self, column, values: set) -> List[Customer]:
+        if not values:
+            return []
+        dialect = self.session.bind.dialect.name
+        result = await self.session.scalars(
+            select(CustomerModel).where(
+                customer_queries.any_of(column, values, dialect)
+            )
+        )
+        return [_to_domain(m) for m in result]
+
+    async def find_many_by_ids(self, ids: Iterable[int]) -> List[Customer]:
+        return await self._find_many(CustomerModel.id, set(ids))
+
+    async def find_many_by_cpfs(self, cpfs: Iterable[str]) -> List[Customer]:
+        return await self._find_many(
+            CustomerModel.cpf, {_sanitize_cpf(c) for c in cpfs}
+        )
+
+    async def find_existing_keys(
+        self, cpfs: Iterable[str], emails: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        digits = {_sanitize_cpf(c) for c in cpfs}
+        emails = set(emails)
+        if not digits and not emails:
+            return set(), set()
+        result = await self.session.execute(
+            select(CustomerModel.cpf, CustomerModel.email).where(
+                or_(CustomerModel.cpf.in_(digits), CustomerModel.email.in_(emails))
+            )
+        )
+        rows = result.all()
+        return (
+            {cpf for cpf, _ in rows if cpf in digits},
+            {email for _, email in rows if email in emails},
+        )
+
+    async def get_view(self, customer_id: int) -> Optional[CustomerView]:
+        result = await self.session.execute(
+            customer_queries.view_query(CustomerModel.id == customer_id)
+        )
+        row = result.first()
+        return CustomerView(*row) if row else None
+
+    async def get_version(self, customer_id: int) -> Optional[datetime]:
+        result = await self.session.execute(customer_queries.version_query(customer_id))
+        return result.scalar_one_or_none()
+
+    async def get_view_by_cpf(self, cpf: str) -> Optional[CustomerView]:
+        result = await self.session.execute(
+            customer_queries.view_query(CustomerModel.cpf == _sanitize_cpf(cpf))
+        )
+        row = result.first()
+        return CustomerView(*row) if row else None
+
+    async def _find_views(self, column, values: set) -> List[CustomerView]:
+        if not values:
+            return []
+        dialect = self.session.bind.dialect.name
+        result = await self.session.execute(
+            customer_queries.view_query(
+                customer_queries.any_of(column, values, dialect)
+            )
+        )
+        return customer_queries.to_views(result)
+
+    async def find_views_by_ids(self, ids: Iterable[int]) -> List[CustomerView]:
+        return await self._find_views(CustomerModel.id, set(ids))
+
+    async def find_views_by_cpfs(self, cpfs: Iterable[str]) -> List[CustomerView]:
+        return await self._find_views(
+            CustomerModel.cpf, {_sanitize_cpf(c) for c in cpfs}
+        )
+
+    async def list_all(self) -> List[Customer]:
+        result = await self.session.execute(select(CustomerModel))
+        return [_to_domain(m) for m in result.scalars()]
+
+    async def list_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+    ) -> Page[CustomerView]:
+        dialect = self.session.bind.dialect.name
+        result = await self.session.execute(
+            customer_queries.page_query(filters, limit, after, dialect)
+        )
+        return customer_queries.to_page(result.all(), limit)
+
+    async def list_changes(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        dialect = self.session.bind.dialect.name
+        result = await self.session.execute(
+            customer_queries.changes_query(after, limit, until, dialect)
+        )
+        return customer_queries.to_changes(result.all(), limit)
+
+    async def search(self, term: str, limit: int) -> List[CustomerView]:
+        dialect = self.session.bind.dialect.name
+        result = await self.session.execute(
+            customer_queries.search_query(term, limit, dialect)
+        )
+        return customer_queries.to_views(result)
+
+    async def estimate_count(self, filters: CustomerFilter) -> int:
+        return await self.session.run_sync(customer_queries.estimate_count, filters)
+
+    # ---------- U ----------
+    async def update(self, customer: Customer) -> Customer:
+        model = await self.session.get(CustomerModel, customer.id)
+        if not model:
+            raise ValueError("Customer not found")
+
+        deactivated = model.active and not customer.active
+        model.name = customer.name
+        model.email = customer.email.value
+        model.cpf = _sanitize_cpf(customer.cpf.value)
+        model.active = customer.active
+        model.token_version = customer.token_version
+
+        await self.session.flush()
+        await self.session.refresh(model)
+        updated = _to_domain(model)
+        await self._emit(
+            customer_outbox.insert_events(
+                customer_outbox.update_event(deactivated), [updated]
+            )
+        )
+        await self.session.commit()
+        return updated
+
+    async def update_fields(
+        self, cpf: str, changes: Dict[str, Any]
+    ) -> Optional[Customer]:
+        if not changes:
+            return await self.find_by_cpf(cpf)
+        previous, statement = customer_queries.update_fields_statements(
+            _sanitize_cpf(cpf), changes, self.session.bind.dialect.name
+        )
+        try:
+            before = None
+            if previous is not None:
+                before = (await self.session.execute(previous)).first()
+            row = (await self.session.execute(statement)).first()
+            updated = _to_domain(row[0]) if row else None
+            if updated is not None:
+                was_active = (row[1:] or before)[-3]
+                event = customer_outbox.update_event(was_active and not updated.active)
+                if customer_queries.ends_sessions(row[1:] or before, row[0]):
+                    await self.session.execute(
+                        customer_queries.revoke_sessions_statement(updated.id)
+                    )
+                await self._emit(customer_outbox.insert_events(event, [updated]))
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise duplicate_error(e) or e
+        return updated
+
+    async def update_password_hash(self, customer_id: int, password_hash: str) -> None:
+        await self.session.execute(
+            update(CustomerModel)
+            .where(CustomerModel.id == customer_id)
+            .values(password_hash=password_hash)
+        )
+        await self.session.commit()
+
+    # ---------- D ----------
+    async def delete(self, customer_id: int) -> None:
+        model = await self.session.get(CustomerModel, customer_id)
+        if model:
+            await self.session.delete(model)
+            await self._emit(customer_outbox.insert_deleted(customer_id))
+            await self.session.commit()
@@ -0,0 +1,170 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports.customer_repository_port import CustomerRepositoryPort
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
+from app.shared.handles.customer_cache import MISS, CustomerCache
+
+_sanitize_cpf = CustomerRepository._sanitize_cpf
+
+
+class CachingCustomerRepository(CustomerRepositoryPort):
+    """
+    Decorator read-through sobre outro ``CustomerRepositoryPort``.
+
+    ``find_by_id``/``find_by_cpf``/``find_by_email`` passam pelo cache
+    (inclusive "não encontrado", com TTL curto); escritas vão direto ao
+    repositório e invalidam as chaves do cliente. Basta derrubar ``id:<id>``
+    para que ponteiros cpf/email antigos deixem de valer.
+    Listagens, projeções (``*view*``), lotes e contagens não são cacheados.
+    """
+
+    def __init__(self, inner: CustomerRepositoryPort, cache: CustomerCache):
+        self.inner = inner
+        self.cache = cache
+
+    # ---------- helpers ----------
+    def _read(self, cached: Any, key: str, load) -> Optional[Customer]:
+        if cached == MISS:
+            return None
+        if cached is not None:
+            return cached
+        customer = load()
+        if customer is None:
+            self.cache.put_missing(key)
+        else:
+            self.cache.put(customer)
+        return customer
+
+    def _forget(self, customer: Customer) -> None:
+        self.cache.invalidate(*self.cache.keys_for(customer))
+
+    # ---------- C ----------
+    def create(self, customer: Customer) -> Customer:
+        created = self.inner.create(customer)
+        # derruba o "não existe" guardado para este CPF/e-mail
+        self._forget(created)
+        return created
+
+    def bulk_create(self, customers: Sequence[Customer]) -> int:
+        imported = self.inner.bulk_create(customers)
+        keys = set()
+        for customer in customers:
+            keys.add(self.cache.cpf_key(_sanitize_cpf(customer.cpf.value)))
+            keys.add(self.cache.email_key(customer.email.value))
+        if keys:
+            self.cache.invalidate(*keys)
+        return imported
+
+    # ---------- R ----------
+    def find_by_id(self, customer_id: int) -> Optional[Customer]:
+        return self._read(
+            self.cache.find_by_id(customer_id),
+            self.cache.id_key(customer_id),
+            lambda: self.inner.find_by_id(customer_id),
+        )
+
+    def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        digits = _sanitize_cpf(cpf)
+        return self._read(
+            self.cache.find_by_cpf(digits),
+            self.cache.cpf_key(digits),
+            lambda: self.inner.find_by_cpf(digits),
+        )
+
+    def find_by_email(self, email: str) -> Optional[Customer]:
+        return self._read(
+            self.cache.find_by_email(email),
+            self.cache.email_key(email),
+            lambda: self.inner.find_by_email(email),
+        )
+
+    def find_many_by_ids(self, ids: Iterable[int]) -> Iterable[Customer]:
+        return self.inner.find_many_by_ids(ids)
+
+    def find_many_by_cpfs(self, cpfs: Iterable[str]) -> Iterable[Customer]:
+        return self.inner.find_many_by_cpfs(cpfs)
+
+    def get_view(self, customer_id: int) -> Optional[CustomerView]:
+        return self.inner.get_view(customer_id)
+
+    def get_version(self, customer_id: int) -> Optional[datetime]:
+        return self.inner.get_version(customer_id)
+
+    def get_view_by_cpf(self, cpf: str) -> Optional[CustomerView]:
+        return self.inner.get_view_by_cpf(cpf)
+
+    def find_views_by_ids(self, ids: Iterable[int]) -> List[CustomerView]:
+        return self.inner.find_views_by_ids(ids)
+
+    def find_views_by_cpfs(self, cpfs: Iterable[str]) -> List[CustomerView]:
+        return self.inner.find_views_by_cpfs(cpfs)
+
+    def find_existing_keys(
+        self, cpfs: Iterable[str], emails: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        return self.inner.find_existing_keys(cpfs, emails)
+
+    def list_all(self) -> Iterable[Customer]:
+        return self.inner.list_all()
+
+    def list_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+    ) -> Page[CustomerView]:
+        return self.inner.list_page(filters, limit, after)
+
+    def list_changes(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        return self.inner.list_changes(after, limit, until)
+
+    def search(self, term: str, limit: int) -> List[CustomerView]:
+        return self.inner.search(term, limit)
+
+    def estimate_count(self, filters: CustomerFilter) -> int:
+        return self.inner.estimate_count(filters)
+
+    # ---------- U ----------
+    def update(self, customer: Customer) -> Customer:
+        updated = self.inner.update(customer)
+        # ponteiros cpf/email antigos apontam para o id e deixam de conferir
+        self._forget(updated)
+        return updated
+
+    def update_fields(self, cpf: str, changes: Dict[str, Any]) -> Optional[Customer]:
+        digits = _sanitize_cpf(cpf)
+        keys = {self.cache.cpf_key(digits)}
+        # o novo CPF/e-mail pode estar no cache negativo
+        if "cpf" in changes:
+            keys.add(self.cache.cpf_key(changes["cpf"]))
+        if "email" in changes:
+            keys.add(self.cache.email_key(changes["email"]))
+        updated = self.inner.update_fields(cpf, changes)
+        if updated is not None:
+            keys.add(self.cache.id_key(updated.id))
+            keys.add(self.cache.email_key(updated.email.value))
+        self.cache.invalidate(*keys)
+        return updated
+
+    def update_password_hash(self, customer_id: int, password_hash: str) -> None:
+        self.inner.update_password_hash(customer_id, password_hash)
+        self.cache.invalidate(self.cache.id_key(customer_id))
+
+    # ---------- D ----------
+    def delete(self, customer_id: int) -> None:
+        self.inner.delete(customer_id)
+        self.cache.invalidate(self.cache.id_key(customer_id))
@@ -1,21 +1,71 @@
+import csv
+import io
 import re
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.adapters.driven.models.customer_model import CustomerModel
+from app.adapters.driven.repositories import customer_outbox, customer_queries
 from app.domain.entities.customer import Customer
-from app.domain.ports.customer_repository_port import CustomerRepositoryPort
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports.customer_repository_port import (
+    CustomerRepositoryPort,
+    DuplicateCustomerError,
+)
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
 
 _DIGITS_RE = re.compile(r"\D+")
+# colunas gravadas pelo bulk_create (as demais ficam com o default do banco)
+_BULK_COLUMNS = ("name", "cpf", "email", "password_hash", "active")
+
+
+def duplicate_error(error: IntegrityError) -> Optional[DuplicateCustomerError]:
+    """
+    Traduz a violação de ``UNIQUE`` em cpf/email. PostgreSQL informa o nome da
+    constraint (``customers_cpf_key``); SQLite só a mensagem
+    (``UNIQUE constraint failed: customers.cpf``).
+    """
+    diag = getattr(error.orig, "diag", None)
+    source = getattr(diag, "constraint_name", None) or str(error.orig)
+    for field in ("cpf", "email"):
+        if field in source:
+            return DuplicateCustomerError(field)
+    return None
+
+
+def rejected_batch_error(error: IntegrityError) -> ValueError:
+    """Outras restrições (NOT NULL, CHECK...) no ``bulk_create``."""
+    return ValueError(f"Lote rejeitado pelo banco: {error.orig}")
 
 
 class CustomerRepository(CustomerRepositoryPort):
     """Implementação SQLAlchemy da porta CustomerRepositoryPort."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, outbox: Optional[bool] = None):
         self.session = session
+        # grava eventos em customer_outbox junto com cada escrita
+        self.outbox = customer_outbox.enabled(outbox)
 
     # ---------- helpers ----------
     @staticmethod
@@ -23,14 +73,20 @@ class CustomerRepository(CustomerRepositoryPort):
         return Customer(
             id=model.id,
             name=model.name,
-            cpf=CPF(model.cpf),
-            email=Email(model.email),
+            # valores vindos do banco já foram validados na escrita
+            cpf=CPF.trusted(model.cpf),
+            email=Email.trusted(model.email),
             active=model.active,
+            token_version=model.token_version,
             created_at=model.created_at,
             updated_at=model.updated_at,
             password_hash=model.password_hash,
         )
 
+    def _emit(self, statement) -> None:
+        if self.outbox and statement is not None:
+            self.session.execute(statement)
+
     @staticmethod
     def _sanitize_cpf(raw_cpf: str) -> str:
         """Mantém somente dígitos para persistir/consultar."""
@@ -38,16 +94,83 @@ class CustomerRepository(CustomerRepositoryPort):
 
     # ---------- C ----------
     def create(self, customer: Customer) -> Customer:
-        model = CustomerModel(
-            name=customer.name,
-            cpf=self._sanitize_cpf(customer.cpf.value),
-            email=customer.email.value,
-            password_hash=customer.password_hash,
+        """
+        Um ``INSERT ... RETURNING`` e o commit: a unicidade fica a cargo das
+        constraints, sem SELECTs prévios nem ``refresh``.
+        """
+        statement = (
+            insert(CustomerModel)
+            .values(
+                name=customer.name,
+                cpf=self._sanitize_cpf(customer.cpf.value),
+                email=customer.email.value,
+                password_hash=customer.password_hash,
+                active=customer.active,
+            )
+            .returning(CustomerModel)
         )
-        self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
-        return self._to_domain(model)
+        try:
+            # converte antes do commit, que expiraria os atributos
+            created = self._to_domain(self.session.execute(statement).scalar_one())
+            self._emit(
+                customer_outbox.insert_events(customer_outbox.CREATED, [created])
+            )
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise duplicate_error(e) or e
+        return created
+
+    def bulk_create(self, customers: Sequence[Customer]) -> int:
+        """
+        Grava o lote numa transação: ``COPY`` no PostgreSQL (psycopg2), INSERT
+        multi-linha nos demais. Qualquer violação de restrição desfaz o lote
+        inteiro e vira ``ValueError`` (``DuplicateCustomerError`` em cpf/email).
+        """
+        if not customers:
+            return 0
+        rows = [
+            (
+                c.name,
+                self._sanitize_cpf(c.cpf.value),
+                c.email.value,
+                c.password_hash,
+                c.active,
+            )
+            for c in customers
+        ]
+        try:
+            if self.session.get_bind().dialect.driver == "psycopg2":
+                self._copy_rows(rows)
+            else:
+                self.session.execute(
+                    insert(CustomerModel),
+                    [dict(zip(_BULK_COLUMNS, row)) for row in rows],
+                )
+            if self.outbox:
+                # COPY não devolve ids: relê o lote (uma consulta) para os eventos
+                created = self._find_many(CustomerModel.cpf, {row[1] for row in rows})
+                self._emit(
+                    customer_outbox.insert_events(customer_outbox.CREATED, created)
+                )
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise duplicate_error(e) or rejected_batch_error(e) from e
+        return len(rows)
+
+    def _copy_rows(self, rows: List[tuple]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY customers ({', '.join(_BULK_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
 
     # ---------- R ----------
     def find_by_id(self, customer_id: int) -> Optional[Customer]:
@@ -71,10 +194,161 @@ class CustomerRepository(CustomerRepositoryPort):
         )
         return self._to_domain(model) if model else None
 
+    @property
+    def _dialect(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _find_many(self, column, values: set) -> List[Customer]:
+        if not values:
+            return []
+        models = self.session.scalars(
+            select(CustomerModel).where(
+                customer_queries.any_of(column, values, self._dialect)
+            )
+        )
+        return [self._to_domain(m) for m in models]
+
+    def find_many_by_ids(self, ids: Iterable[int]) -> List[Customer]:
+        """Busca vários ids com uma única consulta (ordem não garantida)."""
+        return self._find_many(CustomerModel.id, set(ids))
+
+    def find_many_by_cpfs(self, cpfs: Iterable[str]) -> List[Customer]:
+        """Busca vários CPFs com uma única consulta (ordem não garantida)."""
+        return self._find_many(CustomerModel.cpf, {self._sanitize_cpf(c) for c in cpfs})
+
+    def find_existing_keys(
+        self, cpfs: Iterable[str], emails: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """CPFs e e-mails (dentre os informados) que já existem, numa só consulta."""
+        digits = {self._sanitize_cpf(c) for c in cpfs}
+        emails = set(emails)
+        if not digits and not emails:
+            return set(), set()
+        rows = self.session.execute(
+            select(CustomerModel.cpf, CustomerModel.email).where(
+                or_(CustomerModel.cpf.in_(digits), CustomerModel.email.in_(emails))
+            )
+        ).all()
+        return (
+            {cpf for cpf, _ in rows if cpf in digits},
+            {email for _, email in rows if email in emails},
+        )
+
+    def _view(self, *criteria) -> Optional[CustomerView]:
+        row = self.session.execute(customer_queries.view_query(*criteria)).first()
+        return CustomerView(*row) if row else None
+
+    def get_view(self, customer_id: int) -> Optional[CustomerView]:
+        return self._view(CustomerModel.id == customer_id)
+
+    def get_version(self, customer_id: int) -> Optional[datetime]:
+        return self.session.execute(
+            customer_queries.version_query(customer_id)
+        ).scalar_one_or_none()
+
+    def get_view_by_cpf(self, cpf: str) -> Optional[CustomerView]:
+        return self._view(CustomerModel.cpf == self._sanitize_cpf(cpf))
+
+    def _find_views(self, column, values: set) -> List[CustomerView]:
+        if not values:
+            return []
+        return customer_queries.to_views(
+            self.session.execute(
+                customer_queries.view_query(
+                    customer_queries.any_of(column, values, self._dialect)
+                )
+            )
+        )
+
+    def find_views_by_ids(self, ids: Iterable[int]) -> List[CustomerView]:
+        return self._find_views(CustomerModel.id, set(ids))
+
+    def find_views_by_cpfs(self, cpfs: Iterable[str]) -> List[CustomerView]:
+        return self._find_views(
+            CustomerModel.cpf, {self._sanitize_cpf(c) for c in cpfs}
+        )
+
     def list_all(self) -> List[Customer]:
         """Implementação requerida pela interface."""
         return [self._to_domain(m) for m in self.session.query(CustomerModel).all()]
 
+    def list_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+    ) -> Page[CustomerView]:
+        dialect = self.session.get_bind().dialect.name
+        rows = self.session.execute(
+            customer_queries.page_query(filters, limit, after, dialect)
+        ).all()
+        return customer_queries.to_page(rows, limit)
+
+    def list_changes(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        rows = self.session.execute(
+            customer_queries.changes_query(after, limit, until, self._dialect)
+        ).all()
+        return customer_queries.to_changes(rows, limit)
+
+    def search(self, term: str, limit: int) -> List[CustomerView]:
+        return customer_queries.to_views(
+            self.session.execute(
+                customer_queries.search_query(term, limit, self._dialect)
+            )
+        )
+
+    def estimate_count(self, filters: CustomerFilter) -> int:
+        return customer_queries.estimate_count(self.session, filters)
+
+    def stream_export(
+        self, filters: CustomerFilter, batch_size: int = 1000
+    ) -> Iterator[Sequence[tuple]]:
+        """
+        Linhas de ``EXPORT_COLUMNS`` em lotes de ``batch_size``, lidas por cursor
+        do lado do servidor (``yield_per``): a memória não cresce com a tabela.
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            # snapshot único para o export inteiro
+            self.session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+        result = self.session.execute(
+            customer_queries.export_query(filters, dialect).execution_options(
+                yield_per=batch_size
+            )
+        )
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    def token_versions_changed_since(
+        self, since: Optional[datetime]
+    ) -> List[Tuple[int, int, bool, datetime]]:
+        """
+        (id, token_version, active, updated_at) para o mapa de revogação.
+
+        Sem ``since`` traz apenas quem já teve tokens revogados ou está inativo;
+        com ``since`` traz tudo que mudou desde então (carga incremental).
+        """
+        query = self.session.query(
+            CustomerModel.id,
+            CustomerModel.token_version,
+            CustomerModel.active,
+            CustomerModel.updated_at,
+        )
+        if since is None:
+            query = query.filter(
+                or_(CustomerModel.token_version > 0, CustomerModel.active.is_(False))
+            )
+        else:
+            query = query.filter(CustomerModel.updated_at >= since)
+        return [tuple(row) for row in query.all()]
+
     # alias opcional – remove se não precisar de compatibilidade
     find_all = list_all
 
@@ -84,18 +358,62 @@ class CustomerRepository(CustomerRepositoryPort):
         if not model:
             raise ValueError("Customer not found")
 
+        deactivated = model.active and not customer.active
         model.name = customer.name
         model.email = customer.email.value
         model.cpf = self._sanitize_cpf(customer.cpf.value)
         model.active = customer.active
+        model.token_version = customer.token_version
 
+        self.session.flush()
+        updated = self._to_domain(model)
+        self._emit(
+            customer_outbox.insert_events(
+                customer_outbox.update_event(deactivated), [updated]
+            )
+        )
+        self.session.commit()
+        return updated
+
+    def update_fields(self, cpf: str, changes: Dict[str, Any]) -> Optional[Customer]:
+        """Aplica ``changes`` num único ``UPDATE ... RETURNING``; ``None`` se o CPF não existe."""
+        if not changes:
+            return self.find_by_cpf(cpf)
+        previous, statement = customer_queries.update_fields_statements(
+            self._sanitize_cpf(cpf), changes, self.session.get_bind().dialect.name
+        )
+        try:
+            before = None
+            if previous is not None:
+                before = self.session.execute(previous).first()
+            row = self.session.execute(statement).first()
+            updated = self._to_domain(row[0]) if row else None
+            if updated is not None:
+                was_active = (row[1:] or before)[-3]
+                event = customer_outbox.update_event(was_active and not updated.active)
+                if customer_queries.ends_sessions(row[1:] or before, row[0]):
+                    self.session.execute(
+                        customer_queries.revoke_sessions_statement(updated.id)
+                    )
+                self._emit(customer_outbox.insert_events(event, [updated]))
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise duplicate_error(e) or e
+        return updated
+
+    def update_password_hash(self, customer_id: int, password_hash: str) -> None:
+        self.session.execute(
+            update(CustomerModel)
+            .where(CustomerModel.id == customer_id)
+            .values(password_hash=password_hash)
+        )
         self.session.commit()
-        self.session.refresh(model)
-        return self._to_domain(model)
 
     # ---------- D ----------
     def delete(self, customer_id: int) -> None:
         model = self.session.query(CustomerModel).get(customer_id)
         if model:
             self.session.delete(model)
+            self._emit(customer_outbox.insert_deleted(customer_id))
             self.session.commit()
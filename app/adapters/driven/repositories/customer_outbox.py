@@ -0,0 +1,55 @@
+"""
+Linhas do outbox de clientes, gravadas pelos repositórios síncrono e
+assíncrono na mesma transação da alteração (ver ``outbox/relay.py``).
+"""
+
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import Insert, insert
+
+from app.adapters.driven.models.customer_outbox_model import CustomerOutboxModel
+from app.domain.entities.customer import Customer
+
+# false = nenhuma linha é gravada (sem relay, o outbox só cresceria)
+OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "false").lower() == "true"
+
+CREATED = "customer.created"
+UPDATED = "customer.updated"
+DEACTIVATED = "customer.deactivated"
+DELETED = "customer.deleted"
+
+
+def enabled(flag: Optional[bool]) -> bool:
+    return OUTBOX_ENABLED if flag is None else flag
+
+
+def update_event(deactivated: bool) -> str:
+    return DEACTIVATED if deactivated else UPDATED
+
+
+def payload(customer: Customer) -> Dict[str, Any]:
+    """Estado do cliente depois da alteração, sem ``password_hash``."""
+    return {
+        "id": customer.id,
+        "name": customer.name,
+        "cpf": customer.cpf.value,
+        "email": customer.email.value,
+        "active": customer.active,
+        "token_version": customer.token_version,
+        "updated_at": customer.updated_at.isoformat() if customer.updated_at else None,
+    }
+
+
+def insert_events(event_type: str, customers: Iterable[Customer]) -> Optional[Insert]:
+    rows = [
+        {"event_type": event_type, "customer_id": c.id, "payload": payload(c)}
+        for c in customers
+    ]
+    return insert(CustomerOutboxModel).values(rows) if rows else None
+
+
+def insert_deleted(customer_id: int) -> Insert:
+    return insert(CustomerOutboxModel).values(
+        event_type=DELETED, customer_id=customer_id, payload={"id": customer_id}
+    )
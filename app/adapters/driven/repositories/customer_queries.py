@@ -0,0 +1,371 @@
+"""
+Consultas de leitura de ``customers`` compartilhadas pelos repositórios
+síncrono e assíncrono.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    ARRAY,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+
+from app.adapters.driven.models.customer_model import CustomerModel
+from app.adapters.driven.models.refresh_token_model import RefreshTokenModel
+from app.domain.entities.customer_view import CustomerView
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
+
+# Estatística do planner (ANALYZE/autovacuum): custo zero, mas aproximada.
+# ``-1`` = tabela nunca analisada.
+PG_RELTUPLES = text("SELECT reltuples FROM pg_class WHERE oid = 'customers'::regclass")
+
+
+def ts(value: Any, dialect: str) -> Any:
+    """
+    No SQLite o timestamp é texto e ``now()`` grava sem microssegundos, então
+    comparar com um parâmetro ``datetime`` falha até na igualdade. Normaliza
+    os dois lados com ``datetime()``; nos demais bancos não mexe.
+    """
+    return func.datetime(value) if dialect == "sqlite" else value
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _like_prefix(prefix: str) -> str:
+    return _escape_like(prefix).lower() + "%"
+
+
+# Colunas de ``CustomerView``, na ordem dos campos do dataclass
+VIEW_COLUMNS = (
+    CustomerModel.id,
+    CustomerModel.name,
+    CustomerModel.cpf,
+    CustomerModel.email,
+    CustomerModel.active,
+    CustomerModel.token_version,
+    CustomerModel.created_at,
+    CustomerModel.updated_at,
+)
+
+
+def any_of(column, values: Collection, dialect: str):
+    """
+    ``column = ANY(:array)`` no PostgreSQL: um único parâmetro, então o texto
+    do SQL (e o plano preparado) não muda com o tamanho do lote. Nos demais
+    bancos, ``IN (...)``.
+    """
+    if dialect == "postgresql":
+        return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
+    return column.in_(values)
+
+
+def view_query(*criteria) -> Select:
+    return select(*VIEW_COLUMNS).where(*criteria)
+
+
+def version_query(customer_id: int) -> Select:
+    # só a PK e updated_at: nada de linha inteira para validar uma ETag
+    return select(CustomerModel.updated_at).where(CustomerModel.id == customer_id)
+
+
+def to_views(rows) -> List[CustomerView]:
+    return [CustomerView(*row) for row in rows]
+
+
+def apply_filters(query: Select, filters: CustomerFilter, dialect: str) -> Select:
+    created = ts(CustomerModel.created_at, dialect)
+    updated = ts(CustomerModel.updated_at, dialect)
+
+    if filters.active is not None:
+        query = query.where(CustomerModel.active.is_(filters.active))
+    if filters.created_from is not None:
+        query = query.where(created >= ts(filters.created_from, dialect))
+    if filters.created_to is not None:
+        query = query.where(created < ts(filters.created_to, dialect))
+    if filters.updated_from is not None:
+        query = query.where(updated >= ts(filters.updated_from, dialect))
+    if filters.updated_to is not None:
+        query = query.where(updated < ts(filters.updated_to, dialect))
+    if filters.name_prefix:
+        # casa com o índice funcional lower(name) text_pattern_ops
+        query = query.where(
+            func.lower(CustomerModel.name).like(
+                _like_prefix(filters.name_prefix), escape="/"
+            )
+        )
+    return query
+
+
+def page_query(
+    filters: CustomerFilter,
+    limit: int,
+    after: Optional[PageCursor],
+    dialect: str,
+) -> Select:
+    """
+    Keyset em ``(created_at, id)``: busca ``limit + 1`` linhas para saber se há
+    próxima página sem ``OFFSET`` nem ``COUNT``.
+    """
+    query = apply_filters(select(*VIEW_COLUMNS), filters, dialect)
+    if after is not None:
+        query = query.where(
+            tuple_(ts(CustomerModel.created_at, dialect), CustomerModel.id)
+            > tuple_(ts(after.created_at, dialect), after.id)
+        )
+    return query.order_by(CustomerModel.created_at, CustomerModel.id).limit(limit + 1)
+
+
+# Colunas exportadas (nunca o password_hash), na ordem do CSV
+EXPORT_COLUMNS = (
+    CustomerModel.id,
+    CustomerModel.name,
+    CustomerModel.cpf,
+    CustomerModel.email,
+    CustomerModel.active,
+    CustomerModel.created_at,
+    CustomerModel.updated_at,
+)
+
+
+def search_query(term: str, limit: int, dialect: str) -> Select:
+    """
+    Busca por trecho de nome ou e-mail, mais relevantes primeiro.
+
+    PostgreSQL: ``ILIKE '%termo%'`` e ``termo <% name`` (palavra parecida, tolera
+    erro de digitação) usam os índices GIN ``gin_trgm_ops``; a ordem é pela
+    similaridade de trigramas. Demais bancos: ``LIKE`` sem índice, prefixo
+    antes de trecho.
+    """
+    term = term.strip()
+    pattern = "%" + _escape_like(term.lower()) + "%"
+    name, email = CustomerModel.name, CustomerModel.email
+
+    if dialect == "postgresql":
+        query = select(*VIEW_COLUMNS).where(
+            or_(
+                name.ilike(pattern, escape="/"),
+                email.ilike(pattern, escape="/"),
+                literal(term).bool_op("<%")(name),
+            )
+        )
+        rank = func.greatest(
+            func.word_similarity(term, name), func.similarity(term, email)
+        )
+        return query.order_by(rank.desc(), CustomerModel.id).limit(limit)
+
+    lower_name, lower_email = func.lower(name), func.lower(email)
+    prefix = _like_prefix(term)
+    query = select(*VIEW_COLUMNS).where(
+        or_(
+            lower_name.like(pattern, escape="/"),
+            lower_email.like(pattern, escape="/"),
+        )
+    )
+    rank = case(
+        (lower_name.like(prefix, escape="/"), 0),
+        (lower_email.like(prefix, escape="/"), 1),
+        else_=2,
+    )
+    return query.order_by(rank, lower_name, CustomerModel.id).limit(limit)
+
+
+def export_query(filters: CustomerFilter, dialect: str) -> Select:
+    query = apply_filters(select(*EXPORT_COLUMNS), filters, dialect)
+    return query.order_by(CustomerModel.created_at, CustomerModel.id)
+
+
+def update_fields_statements(
+    cpf: str, changes: Dict[str, Any], dialect: str
+) -> Tuple[Optional[Select], Update]:
+    """
+    ``UPDATE customers SET ... WHERE cpf = :cpf RETURNING *`` com os campos de
+    ``changes``. O ``token_version`` sobe 1 para cada mudança de nome, CPF ou
+    e-mail e para a desativação, comparando com os valores antigos da linha.
+    O nome entra porque a verificação de token responde com as claims do JWT.
+
+    O ``RETURNING`` traz também ``active``, CPF e e-mail anteriores (o evento
+    de desativação só sai na transição; ver ``ends_sessions``). No PostgreSQL
+    eles vêm de uma subconsulta ``FOR UPDATE`` no ``FROM``, no mesmo comando;
+    o SQLite não deixa o ``RETURNING`` ler tabelas do ``FROM``, então lá
+    devolvemos também um ``SELECT`` para rodar antes, na mesma transação.
+    Linhas do ``UPDATE``: ``(CustomerModel, active, cpf, email)`` anteriores
+    ou só ``(CustomerModel,)``; as do ``SELECT``: ``(id, active, cpf, email)``.
+    """
+    values: Dict[str, Any] = {}
+    revocations = []
+    if "name" in changes:
+        values["name"] = changes["name"]
+        revocations.append(case((CustomerModel.name != changes["name"], 1), else_=0))
+    if "cpf" in changes:
+        values["cpf"] = changes["cpf"]
+        revocations.append(case((CustomerModel.cpf != changes["cpf"], 1), else_=0))
+    if "email" in changes:
+        values["email"] = changes["email"]
+        revocations.append(case((CustomerModel.email != changes["email"], 1), else_=0))
+    if "active" in changes:
+        values["active"] = changes["active"]
+        if not changes["active"]:
+            revocations.append(case((CustomerModel.active.is_(True), 1), else_=0))
+    if revocations:
+        values["token_version"] = CustomerModel.token_version + sum(revocations)
+
+    previous_row = aliased(CustomerModel)
+    previous = (
+        select(
+            previous_row.id, previous_row.active, previous_row.cpf, previous_row.email
+        )
+        .where(previous_row.cpf == cpf)
+        .with_for_update()
+    )
+    statement = update(CustomerModel).values(**values)
+    if dialect == "postgresql":
+        old = previous.subquery("previous")
+        statement = statement.where(CustomerModel.id == old.c.id).returning(
+            CustomerModel,
+            old.c.active.label("was_active"),
+            old.c.cpf.label("was_cpf"),
+            old.c.email.label("was_email"),
+        )
+        previous = None
+    else:
+        statement = statement.where(CustomerModel.cpf == cpf).returning(CustomerModel)
+    # o RETURNING já traz a linha nova; nada a sincronizar na sessão
+    statement = statement.execution_options(
+        synchronize_session=False, populate_existing=True
+    )
+    return previous, statement
+
+
+def ends_sessions(previous: Sequence, updated: CustomerModel) -> bool:
+    """
+    ``previous`` termina em ``(active, cpf, email)`` de antes do ``UPDATE``.
+    Trocar CPF ou e-mail (credenciais do login) ou desativar o cliente encerra
+    as sessões de refresh, além de subir o ``token_version``.
+    """
+    was_active, was_cpf, was_email = previous[-3:]
+    return (
+        updated.cpf != was_cpf
+        or updated.email != was_email
+        or (was_active and not updated.active)
+    )
+
+
+def revoke_sessions_statement(customer_id: int) -> Update:
+    """Revoga os refresh tokens ainda válidos do cliente."""
+    return (
+        update(RefreshTokenModel)
+        .where(
+            RefreshTokenModel.customer_id == customer_id,
+            RefreshTokenModel.revoked_at.is_(None),
+        )
+        .values(revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def count_query(filters: CustomerFilter, dialect: str) -> Select:
+    query = select(func.count()).select_from(CustomerModel)
+    return apply_filters(query, filters, dialect)
+
+
+def estimate_count(session: Session, filters: CustomerFilter) -> int:
+    """
+    Total aproximado para a listagem.
+
+    - PostgreSQL sem filtros: ``pg_class.reltuples``;
+    - PostgreSQL com filtros: linhas estimadas pelo ``EXPLAIN`` (não executa);
+    - demais bancos (SQLite nos testes): ``COUNT(*)``.
+
+    Recebe uma ``Session`` síncrona; o repositório assíncrono chama via
+    ``AsyncSession.run_sync``.
+    """
+    dialect = session.get_bind().dialect
+    if dialect.name != "postgresql":
+        return session.execute(count_query(filters, dialect.name)).scalar_one()
+
+    if filters.is_empty:
+        reltuples = session.execute(PG_RELTUPLES).scalar()
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    query = apply_filters(select(CustomerModel.id), filters, dialect.name)
+    compiled = query.compile(dialect=dialect)
+    params = (
+        tuple(compiled.params[name] for name in compiled.positiontup)
+        if compiled.positional
+        else compiled.params
+    )
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        .scalar()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def changes_query(
+    after: Optional[ChangeCursor],
+    limit: int,
+    until: Optional[datetime],
+    dialect: str,
+) -> Select:
+    """
+    Linhas alteradas depois de ``after``, em ordem ``(updated_at, id)``
+    (índice ``ix_customers_updated_at_id``). ``until`` corta as alterações
+    recentes demais: uma transação ainda aberta pode gravar um ``updated_at``
+    anterior ao de linhas já entregues, e o consumidor a perderia.
+    """
+    updated = ts(CustomerModel.updated_at, dialect)
+    query = select(*VIEW_COLUMNS)
+    if after is not None:
+        query = query.where(
+            tuple_(updated, CustomerModel.id)
+            > tuple_(ts(after.updated_at, dialect), after.id)
+        )
+    if until is not None:
+        query = query.where(updated <= ts(until, dialect))
+    return query.order_by(updated, CustomerModel.id).limit(limit + 1)
+
+
+def to_changes(rows: Sequence, limit: int) -> Page[CustomerView]:
+    items = to_views(rows[:limit])
+    next_cursor = (
+        ChangeCursor(items[-1].updated_at, items[-1].id)
+        if len(rows) > limit and items
+        else None
+    )
+    return Page(items, next_cursor)
+
+
+def to_page(rows: Sequence, limit: int) -> Page[CustomerView]:
+    """Separa a linha extra do ``limit + 1`` e monta o cursor da próxima página."""
+    items = to_views(rows[:limit])
+    next_cursor = (
+        PageCursor(items[-1].created_at, items[-1].id)
+        if len(rows) > limit and items
+        else None
+    )
+    return Page(items, next_cursor)
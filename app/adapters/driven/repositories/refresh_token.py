@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.adapters.driven.models.refresh_token_model import RefreshTokenModel
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.ports.refresh_token_repository_port import RefreshTokenRepositoryPort
+
+
+class RefreshTokenRepository(RefreshTokenRepositoryPort):
+    """Implementação SQLAlchemy da porta RefreshTokenRepositoryPort."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # ---------- helpers ----------
+    @staticmethod
+    def _to_domain(model: RefreshTokenModel) -> RefreshToken:
+        return RefreshToken(
+            id=model.id,
+            customer_id=model.customer_id,
+            token_hash=model.token_hash,
+            family_id=model.family_id,
+            expires_at=model.expires_at,
+            used_at=model.used_at,
+            revoked_at=model.revoked_at,
+            created_at=model.created_at,
+        )
+
+    # ---------- C ----------
+    def create(self, token: RefreshToken) -> RefreshToken:
+        model = RefreshTokenModel(
+            customer_id=token.customer_id,
+            token_hash=token.token_hash,
+            family_id=token.family_id,
+            expires_at=token.expires_at,
+        )
+        self.session.add(model)
+        self.session.commit()
+        token.id = model.id
+        return token
+
+    # ---------- R ----------
+    def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        model = (
+            self.session.query(RefreshTokenModel)
+            .filter(RefreshTokenModel.token_hash == token_hash)
+            .first()
+        )
+        return self._to_domain(model) if model else None
+
+    # ---------- U ----------
+    def mark_used(self, token_id: int) -> bool:
+        result = self.session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.id == token_id,
+                RefreshTokenModel.used_at.is_(None),
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(used_at=datetime.now(timezone.utc))
+        )
+        self.session.commit()
+        return result.rowcount == 1
+
+    def revoke_family(self, family_id: str) -> None:
+        self.session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.family_id == family_id,
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        self.session.commit()
@@ -0,0 +1,92 @@
+import random
+import time
+from typing import Callable, List, Sequence
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.adapters.driven.models.login_throttle_model import LoginThrottleBucketModel
+from app.shared.handles.rate_limiter import (
+    LOGIN_THROTTLE_BUCKET_TTL_SECONDS,
+    LOGIN_THROTTLE_PRUNE_EVERY,
+    BucketRequest,
+    take_tokens,
+)
+
+
+class DatabaseBucketStore:
+    """
+    ``BucketStore`` com estado no Postgres, compartilhado por todos os workers.
+    As linhas dos baldes ficam travadas (``SELECT ... FOR UPDATE``, sempre na
+    ordem das chaves, para dois workers não se travarem) durante a conta.
+
+    Baldes parados há mais de ``ttl_seconds`` já estão cheios, igual a não
+    existir; em média uma a cada ``prune_every`` chamadas de ``take`` apaga
+    esses baldes, para a tabela não crescer com cada IP/identificador já visto.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        clock: Callable[[], float] = time.time,
+        ttl_seconds: float = LOGIN_THROTTLE_BUCKET_TTL_SECONDS,
+        prune_every: int = LOGIN_THROTTLE_PRUNE_EVERY,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.session = session
+        self.clock = clock
+        self.ttl_seconds = ttl_seconds
+        self.prune_every = prune_every
+        self.rng = rng
+
+    def prune(self) -> int:
+        """Apaga os baldes parados há mais de ``ttl_seconds``."""
+        cutoff = self.clock() - self.ttl_seconds
+        result = self.session.execute(
+            delete(LoginThrottleBucketModel).where(
+                LoginThrottleBucketModel.refilled_at < cutoff
+            )
+        )
+        self.session.commit()
+        return result.rowcount or 0
+
+    def _take_once(self, requests: Sequence[BucketRequest]) -> List[float]:
+        models = {
+            key: self.session.get(LoginThrottleBucketModel, key, with_for_update=True)
+            for key in sorted({key for key, _, _ in requests})
+        }
+        states, waits = take_tokens(
+            [
+                (models[key].tokens, models[key].refilled_at) if models[key] else None
+                for key, _, _ in requests
+            ],
+            self.clock(),
+            [(capacity, rate) for _, capacity, rate in requests],
+        )
+        for (key, _, _), (tokens, refilled_at) in zip(requests, states):
+            model = models[key]
+            if model is None:
+                models[key] = LoginThrottleBucketModel(
+                    key=key, tokens=tokens, refilled_at=refilled_at
+                )
+                self.session.add(models[key])
+            else:
+                model.tokens = tokens
+                model.refilled_at = refilled_at
+        self.session.commit()
+        return waits
+
+    def take(self, key: str, capacity: float, rate: float) -> float:
+        return self.take_many([(key, capacity, rate)])[0]
+
+    def take_many(self, requests: Sequence[BucketRequest]) -> List[float]:
+        try:
+            waits = self._take_once(requests)
+        except IntegrityError:
+            # outro worker criou o mesmo balde ao mesmo tempo
+            self.session.rollback()
+            waits = self._take_once(requests)
+        if self.prune_every > 0 and self.rng() * self.prune_every < 1:
+            self.prune()
+        return waits
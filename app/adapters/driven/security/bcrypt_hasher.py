@@ -3,8 +3,14 @@ from app.domain.ports.password_hasher import PasswordHasher
 
 
 class BcryptPasswordHasher(PasswordHasher):
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
     def hash(self, plain: str) -> str:
-        return bcrypt.using(rounds=12).hash(plain)
+        return bcrypt.using(rounds=self.rounds).hash(plain)
 
     def verify(self, plain: str, hashed: str) -> bool:
         return bcrypt.verify(plain, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return bcrypt.using(rounds=self.rounds).needs_update(hashed)
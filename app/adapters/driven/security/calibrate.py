@@ -0,0 +1,80 @@
+"""
+Calibra o custo do hash de senha para a CPU onde o serviço roda.
+
+    python -m app.adapters.driven.security.calibrate --scheme bcrypt --target-ms 250
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import replace
+from typing import Iterable, List, Tuple
+
+from app.adapters.driven.security.policy_hasher import HashPolicy, PolicyPasswordHasher
+
+
+def measure_ms(policy: HashPolicy, samples: int = 3) -> float:
+    hasher = PolicyPasswordHasher(policy)
+    hasher.hash("warm-up")  # carrega o backend fora da medição
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _candidates(base: HashPolicy) -> Iterable[HashPolicy]:
+    if base.scheme == "bcrypt":
+        return (replace(base, rounds=r) for r in range(4, 32))
+    return (replace(base, time_cost=t) for t in range(1, 64))
+
+
+def calibrate(
+    scheme: str = "bcrypt", target_ms: float = 250, samples: int = 3
+) -> Tuple[HashPolicy, List[Tuple[HashPolicy, float]]]:
+    """
+    Sobe o custo até passar de ``target_ms`` e devolve o maior que ficou abaixo
+    (ou o mínimo, se nem ele couber), junto com as medições.
+    """
+    chosen = None
+    measured = []
+    for policy in _candidates(replace(HashPolicy.from_env(), scheme=scheme)):
+        ms = measure_ms(policy, samples)
+        measured.append((policy, ms))
+        if ms > target_ms:
+            break
+        chosen = policy
+    return chosen or measured[0][0], measured
+
+
+def _env_lines(policy: HashPolicy) -> List[str]:
+    lines = [f"PASSWORD_HASH_SCHEME={policy.scheme}"]
+    if policy.scheme == "bcrypt":
+        lines.append(f"PASSWORD_HASH_ROUNDS={policy.rounds}")
+    else:
+        lines += [
+            f"ARGON2_TIME_COST={policy.time_cost}",
+            f"ARGON2_MEMORY_COST={policy.memory_cost}",
+            f"ARGON2_PARALLELISM={policy.parallelism}",
+        ]
+    return lines
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    chosen, measured = calibrate(args.scheme, args.target_ms, args.samples)
+    for policy, ms in measured:
+        cost = policy.rounds if policy.scheme == "bcrypt" else policy.time_cost
+        print(f"custo={cost:<3} {ms:8.1f} ms")
+    print("\n# variáveis recomendadas")
+    print("\n".join(_env_lines(chosen)))
+
+
+if __name__ == "__main__":
+    main()
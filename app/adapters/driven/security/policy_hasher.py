@@ -0,0 +1,82 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from passlib.context import CryptContext
+
+SUPPORTED_SCHEMES = ("bcrypt", "argon2")
+
+
+@dataclass(frozen=True, slots=True)
+class HashPolicy:
+    """Algoritmo e custo usados para gerar novos hashes de senha."""
+
+    scheme: str = "bcrypt"
+    rounds: int = 12  # bcrypt: log2 das iterações
+    time_cost: int = 3  # argon2id: passes
+    memory_cost: int = 65536  # argon2id: KiB
+    parallelism: int = 4  # argon2id: lanes
+
+    def __post_init__(self) -> None:
+        if self.scheme not in SUPPORTED_SCHEMES:
+            raise ValueError(f"Esquema de hash não suportado: {self.scheme}")
+
+    @classmethod
+    def from_env(cls) -> "HashPolicy":
+        return cls(
+            scheme=os.getenv("PASSWORD_HASH_SCHEME", "bcrypt"),
+            rounds=int(os.getenv("PASSWORD_HASH_ROUNDS", "12")),
+            time_cost=int(os.getenv("ARGON2_TIME_COST", "3")),
+            memory_cost=int(os.getenv("ARGON2_MEMORY_COST", "65536")),
+            parallelism=int(os.getenv("ARGON2_PARALLELISM", "4")),
+        )
+
+
+def _build_context(policy: HashPolicy) -> CryptContext:
+    # todos os esquemas continuam aceitos na verificação; só o default gera hash
+    schemes = [policy.scheme] + [s for s in SUPPORTED_SCHEMES if s != policy.scheme]
+    return CryptContext(
+        schemes=schemes,
+        default=policy.scheme,
+        deprecated="auto",
+        bcrypt__rounds=policy.rounds,
+        argon2__type="ID",
+        argon2__time_cost=policy.time_cost,
+        argon2__memory_cost=policy.memory_cost,
+        argon2__parallelism=policy.parallelism,
+    )
+
+
+class PolicyPasswordHasher:
+    """
+    Hasher configurado por uma ``HashPolicy`` (bcrypt ou argon2id).
+
+    ``needs_rehash`` indica hashes gerados com outro esquema ou custo, para que
+    o login os atualize de forma transparente.
+    """
+
+    def __init__(self, policy: HashPolicy = HashPolicy()):
+        self.policy = policy
+        self._context = _build_context(policy)
+
+    # o CryptContext não é picklable; reconstrói a partir da política
+    # (necessário para rodar dentro do ProcessPoolPasswordHasher)
+    def __getstate__(self):
+        return self.policy
+
+    def __setstate__(self, policy: HashPolicy) -> None:
+        self.__init__(policy)
+
+    def hash(self, plain: str) -> str:
+        return self._context.hash(plain)
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        return self._context.verify(plain, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._context.needs_update(hashed)
+
+
+@lru_cache(maxsize=1)
+def default_hasher() -> PolicyPasswordHasher:
+    return PolicyPasswordHasher(HashPolicy.from_env())
@@ -0,0 +1,147 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Optional
+
+from app.domain.ports.password_hasher import PasswordHasher
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "0"))
+PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "5"))
+
+
+class HasherBusyError(RuntimeError):
+    """Fila do pool de hashing cheia; o request deve ser rejeitado (503)."""
+
+
+class HasherTimeoutError(TimeoutError):
+    """O hash não terminou dentro do timeout configurado."""
+
+
+class ProcessPoolPasswordHasher:
+    """
+    Executa o hasher "de verdade" (``inner``) num ``ProcessPoolExecutor``.
+
+    O bcrypt é CPU puro: em processos separados ele escala pelos núcleos e não
+    prende as threads de request. A fila é limitada em ``max_pending``
+    (excedente recebe ``HasherBusyError``) e cada operação tem ``timeout``.
+    """
+
+    def __init__(
+        self,
+        inner: PasswordHasher,
+        max_workers: int = PASSWORD_HASH_WORKERS or (os.cpu_count() or 1),
+        max_pending: Optional[int] = PASSWORD_HASH_MAX_PENDING or None,
+        timeout: float = PASSWORD_HASH_TIMEOUT_SECONDS,
+    ):
+        self.inner = inner
+        self.max_workers = max_workers
+        self.max_pending = max_pending or max_workers * 8
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    # ---------- pool ----------
+    def _executor(self) -> ProcessPoolExecutor:
+        # criado sob demanda: nada de processos filhos só por importar o módulo
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _done(self, future: Future) -> None:
+        # chamado também para futures canceladas (shutdown) ou com exceção
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled():
+                self.cancelled += 1
+            elif future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusyError("Serviço de autenticação sobrecarregado")
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            self.submitted += 1
+            executor = self._executor()
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self.pending -= 1
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _wait(self, future: Future):
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            with self._lock:
+                self.timeouts += 1
+            raise HasherTimeoutError("Tempo esgotado ao processar a senha")
+
+    async def _await(self, future: Future):
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise HasherTimeoutError("Tempo esgotado ao processar a senha")
+
+    # ---------- PasswordHasher ----------
+    def hash(self, plain: str) -> str:
+        return self._wait(self._submit(self.inner.hash, plain))
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        return self._wait(self._submit(self.inner.verify, plain, hashed))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        # só inspeciona o prefixo do hash; não vale a ida ao pool
+        return self.inner.needs_rehash(hashed)
+
+    # ---------- AsyncPasswordHasher ----------
+    async def hash_async(self, plain: str) -> str:
+        return await self._await(self._submit(self.inner.hash, plain))
+
+    async def verify_async(self, plain: str, hashed: str) -> bool:
+        return await self._await(self._submit(self.inner.verify, plain, hashed))
+
+    # ---------- operação ----------
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
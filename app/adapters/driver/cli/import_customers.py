@@ -0,0 +1,127 @@
+"""
+Importa clientes em massa a partir de NDJSON ou CSV (name,cpf,email,password).
+
+    python -m app.adapters.driver.cli.import_customers clientes.csv --workers 8
+
+Linhas rejeitadas vão para o relatório (NDJSON: line, cpf, detail).
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import IO, Iterable, Iterator
+
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.adapters.driven.security.policy_hasher import default_hasher
+from app.domain.services.import_customers_service import (
+    ImportCustomersService,
+    ImportReport,
+    ImportRow,
+)
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+FIELDS = ("name", "cpf", "email", "password")
+
+
+def _row(line: int, record) -> ImportRow:
+    if not isinstance(record, dict):
+        return ImportRow(line, error="Linha não é um objeto JSON.")
+    values = {f: record.get(f) for f in FIELDS}
+    if not all(isinstance(v, str) for v in values.values()):
+        return ImportRow(line, error=f"Campos obrigatórios: {', '.join(FIELDS)}.")
+    return ImportRow(line, **values)
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[ImportRow]:
+    for number, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            yield ImportRow(number, error="JSON inválido.")
+            continue
+        yield _row(number, record)
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[ImportRow]:
+    reader = csv.DictReader(lines)
+    missing = set(FIELDS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Cabeçalho sem as colunas: {', '.join(sorted(missing))}")
+    for record in reader:
+        # line_num conta linhas físicas; a linha 1 é o cabeçalho
+        yield _row(reader.line_num, record)
+
+
+def write_report(report: ImportReport, out: IO[str]) -> None:
+    for error in report.errors:
+        out.write(
+            json.dumps(
+                {"line": error.line, "cpf": error.cpf, "detail": error.detail},
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="arquivo .ndjson/.jsonl ou .csv ('-' = stdin)")
+    parser.add_argument("--format", choices=["ndjson", "csv"])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processos para o hash das senhas (0 = no próprio processo)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--report", help="arquivo do relatório (padrão: stderr)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    reader = read_csv if fmt == "csv" else read_ndjson
+
+    from database import SessionLocal
+
+    pool = (
+        ProcessPoolExecutor(
+            args.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        if args.workers > 0
+        else nullcontext()
+    )
+    source = (
+        nullcontext(sys.stdin)
+        if args.path == "-"
+        else open(args.path, encoding="utf-8", newline="")
+    )
+    with source as lines, pool as executor, SessionLocal() as session:
+        service = ImportCustomersService(
+            CustomerRepository(session),
+            default_hasher(),
+            executor=executor,
+            chunk_size=args.chunk_size,
+        )
+        try:
+            report = service.execute(reader(lines))
+        except ValueError as e:
+            parser.error(str(e))
+
+    with (
+        open(args.report, "w", encoding="utf-8")
+        if args.report
+        else nullcontext(sys.stderr) as out
+    ):
+        write_report(report, out)
+    print(f"total={report.total} importados={report.imported} falhas={report.failed}")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
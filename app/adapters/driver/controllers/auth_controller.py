@@ -1,21 +1,114 @@
+from typing import Dict, List, Optional, Tuple
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.adapters.driven.repositories.customer import CustomerRepository
-from app.adapters.driver.controllers.schemas import TokenVerifyOut, TokenVerifyIn
+from app.adapters.driver.controllers import fast_json
+from app.adapters.driver.controllers.schemas import (
+    TokenBatchItemOut,
+    TokenBatchVerifyIn,
+    TokenVerifyIn,
+    TokenVerifyOut,
+)
 from app.adapters.driver.dependencies import get_db
+from app.domain.entities.customer_view import CustomerView
 from app.domain.value_objects.cpf import CPF
 from app.shared.handles.jwt_user import verify_jwt
+from app.shared.handles.token_cache import token_cache
+from app.shared.handles.token_revocation import token_revocations
 
 router = APIRouter()
 
 
+# ---------- helpers ----------
+def _decode(token: str) -> Tuple[dict, CPF]:
+    """Valida o token e devolve (payload, CPF)."""
+    if not token:
+        raise HTTPException(400, "Token ausente")
+
+    try:
+        payload = verify_jwt(token)
+    except ValueError as e:
+        raise HTTPException(401, str(e))
+
+    cpf_value = payload.get("cpf")
+    if not cpf_value:
+        raise HTTPException(400, "Token não contém CPF")
+    try:
+        return payload, CPF(cpf_value)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+def _check_version(payload: dict, current: int, active: bool) -> None:
+    if not active:
+        raise HTTPException(404, "Cliente não encontrado ou inativo")
+    version = payload.get("ver")
+    if version is not None and version < current:
+        raise HTTPException(401, "Token revogado")
+
+
+def _cache(token: str, payload: dict, result: dict) -> dict:
+    token_cache.put(token, payload.get("exp"), result)
+    return result
+
+
+def _from_claims(token: str, payload: dict, cpf: CPF) -> Optional[dict]:
+    """
+    Responde apenas com as claims quando o token traz ``id``/``ver`` e o mapa de
+    revogação (já atualizado) confirma a versão. ``None`` = precisa do banco.
+
+    Token mais novo que o mapa (emitido por outro worker logo após uma troca de
+    e-mail/CPF/nome) também vai ao banco: o mapa pode estar até
+    ``refresh_seconds`` atrasado e não serve para recusá-lo.
+    """
+    if payload.get("ver") is None or not all(
+        payload.get(k) for k in ("id", "name", "email")
+    ):
+        return None
+
+    current, active = token_revocations.lookup(payload["id"])
+    if payload["ver"] > current:
+        return None
+    _check_version(payload, current, active)
+    token_revocations.record_claims_hit()
+    result = fast_json.verified_token(
+        payload["id"], payload["name"], cpf.formatted(), payload["email"]
+    )
+    return _cache(token, payload, result)
+
+
+def _to_verified(token: str, payload: dict, customer: Optional[CustomerView]) -> dict:
+    if not customer:
+        raise HTTPException(404, "Cliente não encontrado ou inativo")
+    _check_version(payload, customer.token_version, customer.active)
+
+    result = fast_json.verified_token(
+        customer.id, customer.name, customer.formatted_cpf, customer.email
+    )
+    return _cache(token, payload, result)
+
+
+def _batch_item(
+    customer: Optional[dict] = None, error: Optional[HTTPException] = None
+) -> dict:
+    """Corpo de ``TokenBatchItemOut``."""
+    return {
+        "ok": error is None,
+        "customer": customer,
+        "status_code": error.status_code if error else None,
+        "detail": error.detail if error else None,
+    }
+
+
+# ---------- endpoints ----------
 @router.post(
     "",
     response_model=TokenVerifyOut,
     responses={
         400: {"description": "Token ausente ou mal-formado"},
-        401: {"description": "Token inválido ou expirado"},
+        401: {"description": "Token inválido, expirado ou revogado"},
         404: {"description": "Cliente não encontrado ou inativo"},
     },
 )
@@ -24,27 +117,71 @@ def verify_token(body: TokenVerifyIn, db: Session = Depends(get_db)):
     if not body.token:
         raise HTTPException(400, "Token ausente")
 
-    # 2) Decodificar
-    try:
-        payload = verify_jwt(body.token)
-    except ValueError as e:
-        raise HTTPException(401, str(e))
+    # 2) Token já verificado recentemente?
+    cached = token_cache.get(body.token)
+    if cached is not None:
+        return fast_json.respond(cached)
 
-    # 3) Pegar CPF do payload
-    cpf_value = payload.get("cpf")
-    if not cpf_value:
-        raise HTTPException(400, "Token não contém CPF")
+    # 3) Decodificar e extrair CPF
+    payload, cpf = _decode(body.token)
 
-    # 4) Consultar no repositório
+    # 4) Token versionado: responde sem consultar o cliente
     repo = CustomerRepository(db)
-    customer = repo.find_by_cpf(CPF(cpf_value).value)
-    if not customer or not customer.active:
-        raise HTTPException(404, "Cliente não encontrado ou inativo")
+    token_revocations.refresh_if_stale(repo.token_versions_changed_since)
+    verified = _from_claims(body.token, payload, cpf)
+    if verified is not None:
+        return fast_json.respond(verified)
 
-    # 5) OK
-    return TokenVerifyOut(
-        id=customer.id,
-        name=customer.name,
-        cpf=customer.cpf.formatted(),
-        email=customer.email.value,
-    )
+    # 5) Consultar no repositório
+    customer = repo.get_view_by_cpf(cpf.value)
+
+    # 6) OK
+    return fast_json.respond(_to_verified(body.token, payload, customer))
+
+
+@router.post(
+    "/batch",
+    response_model=List[TokenBatchItemOut],
+    summary="Verifica vários tokens com uma única consulta ao banco",
+)
+def verify_tokens_batch(body: TokenBatchVerifyIn, db: Session = Depends(get_db)):
+    """
+    Retorna um item por token, na mesma ordem do request. Cada item traz o
+    cliente (`customer`) ou o erro que `POST /api/auth` devolveria
+    (`status_code` + `detail`).
+    """
+    results: List[dict] = [None] * len(body.tokens)
+    pending: Dict[int, Tuple[dict, str]] = {}
+
+    repo = CustomerRepository(db)
+    token_revocations.refresh_if_stale(repo.token_versions_changed_since)
+
+    # 1) Cache + decodificação + claims versionadas
+    for i, token in enumerate(body.tokens):
+        cached = token_cache.get(token) if token else None
+        if cached is not None:
+            results[i] = _batch_item(customer=cached)
+            continue
+        try:
+            payload, cpf = _decode(token)
+            verified = _from_claims(token, payload, cpf)
+            if verified is not None:
+                results[i] = _batch_item(customer=verified)
+            else:
+                pending[i] = (payload, cpf.value)
+        except HTTPException as e:
+            results[i] = _batch_item(error=e)
+
+    # 2) Uma única consulta para todos os CPFs restantes
+    cpfs = {cpf for _, cpf in pending.values()}
+    found = {c.cpf: c for c in repo.find_views_by_cpfs(cpfs)}
+
+    # 3) Monta a resposta
+    for i, (payload, cpf) in pending.items():
+        try:
+            verified = _to_verified(body.tokens[i], payload, found.get(cpf))
+            results[i] = _batch_item(customer=verified)
+        except HTTPException as e:
+            results[i] = _batch_item(error=e)
+
+    return fast_json.respond(results)
@@ -1,39 +1,129 @@
-from typing import List
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.adapters.driven.repositories.customer import CustomerRepository
-from app.adapters.driven.security.bcrypt_hasher import BcryptPasswordHasher
+from app.adapters.driven.repositories.refresh_token import RefreshTokenRepository
+from app.adapters.driven.repositories.throttle_bucket import DatabaseBucketStore
+from app.adapters.driven.security.process_pool_hasher import (
+    HasherBusyError,
+    HasherTimeoutError,
+)
+from app.adapters.driver.controllers import fast_json, http_cache
+from app.adapters.driver.controllers.customer_export import (
+    MEDIA_TYPES,
+    stream_customers,
+)
 from app.adapters.driver.controllers.schemas import (
+    CustomerChangeOut,
+    CustomerBatchGetIn,
+    CustomerBatchItemOut,
     CustomerOut,
     CustomerIn,
     CustomersOut,
     CustomerIdentifyOut,
     CustomerUpdateIn,
     AuthIn,
+    RefreshIn,
 )
 from app.domain.entities.customer import Customer
-from app.adapters.driver.dependencies import get_db
+from app.adapters.driver.dependencies import (
+    get_customer_repository,
+    get_db,
+    get_session_factory,
+    password_hasher as hasher,
+)
+from app.domain.ports import CustomerRepositoryPort
+from app.domain.services._async import call
 from app.domain.services.create_customer_service import CreateCustomerService
-from app.domain.services.identify_customer_service import IdentifyCustomerService
+from app.domain.services.get_customers_service import GetCustomersService
+from app.domain.services.identify_customer_service import (
+    IdentifyCustomerService,
+    build_access_token,
+)
 from app.domain.services.list_customers_service import ListCustomersService
+from app.domain.services.refresh_session_service import RefreshSessionService
 from app.domain.services.update_customer_service import UpdateCustomerService
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
+from app.domain.value_objects.page import ChangeCursor, CustomerFilter, PageCursor
+from app.shared.handles.rate_limiter import (
+    LOGIN_THROTTLE_BACKEND,
+    login_throttle,
+    resolve_client_ip,
+    trusted_proxies,
+)
+from app.shared.handles.token_cache import token_cache
+from app.shared.handles.token_revocation import token_revocations
 
 router = APIRouter()
-hasher = BcryptPasswordHasher()
+
+# GET /changes só entrega alterações mais velhas que isto (ver changes_query)
+CHANGES_SAFETY_LAG_SECONDS = float(os.getenv("CHANGES_SAFETY_LAG_SECONDS", "5"))
+
+_HASHER_UNAVAILABLE = {
+    503: {"description": "Pool de hashing de senhas sobrecarregado ou lento"}
+}
 
 
 # ---------- helpers ----------
-def _to_response(entity: Customer) -> CustomerOut:
-    return CustomerOut(
-        id=entity.id,
-        name=entity.name,
-        cpf=entity.cpf.formatted(),
-        email=entity.email.value,
-        active=entity.active,
+def _sessions(db: Session) -> RefreshSessionService:
+    return RefreshSessionService(RefreshTokenRepository(db), CustomerRepository(db))
+
+
+async def _throttle_login(request: Request, identifier: str, db: Session) -> None:
+    """Rejeita (429) antes de qualquer bcrypt quando o balde esvaziou."""
+    client_ip = resolve_client_ip(
+        request.client.host if request.client else "",
+        request.headers.get("x-forwarded-for"),
+        trusted_proxies,
+    )
+    if LOGIN_THROTTLE_BACKEND == "database":
+        retry_after = await run_in_threadpool(
+            login_throttle.check, identifier, client_ip, DatabaseBucketStore(db)
+        )
+    else:
+        retry_after = login_throttle.check(identifier, client_ip)
+
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Muitas tentativas de login. Tente novamente mais tarde.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def _customer_filter(
+    active: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    updated_from: Optional[datetime] = None,
+    updated_to: Optional[datetime] = None,
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=100),
+) -> CustomerFilter:
+    """Filtros comuns à listagem e ao export; intervalos de data são ``[from, to)``."""
+    return CustomerFilter(
+        active=active,
+        created_from=created_from,
+        created_to=created_to,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        name_prefix=name_prefix,
     )
 
 
@@ -73,11 +163,15 @@ def _to_response(entity: Customer) -> CustomerOut:
                     }
                 }
             },
-        }
+        },
+        **_HASHER_UNAVAILABLE,
     },
 )
-def create_customer(payload: CustomerIn, db: Session = Depends(get_db)):
-    service = CreateCustomerService(CustomerRepository(db), hasher)
+async def create_customer(
+    payload: CustomerIn,
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    service = CreateCustomerService(repo, hasher)
 
     try:
         cpf_vo = CPF(payload.cpf)
@@ -90,44 +184,255 @@ def create_customer(payload: CustomerIn, db: Session = Depends(get_db)):
             email=email_vo,
             password_hash="",
         )
-        created = service.execute(customer, payload.password)
-        return _to_response(created)
+        created = await service.execute_async(customer, payload.password)
+        return fast_json.respond(fast_json.customer_entity(created), status_code=201)
 
     except ValueError as e:
         # Formato inválido ou duplicidade detectada pelo service
         raise HTTPException(status_code=400, detail=str(e))
+    except (HasherBusyError, HasherTimeoutError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.get(
+    "",
+    response_model=List[CustomersOut],
+    responses={
+        400: {"description": "Cursor inválido"},
+        304: {"description": "Página não modificada (`If-None-Match`)"},
+    },
+)
+async def list_customers(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="`X-Next-Cursor` da página anterior"
+    ),
+    filters: CustomerFilter = Depends(_customer_filter),
+    include_total: bool = Query(
+        False, description="Inclui `X-Total-Count-Estimate` (aproximado)"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    """
+    Lista clientes ordenados por `(created_at, id)`, paginando por cursor.
+
+    Enquanto houver mais resultados, a resposta traz `X-Next-Cursor` e
+    `Link: <...>; rel="next"`. Os intervalos de data são `[from, to)`.
+    Com `If-None-Match` igual à `ETag` da página, responde 304 sem corpo.
+    """
+    try:
+        after = PageCursor.decode(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    service = ListCustomersService(repo)
+    page = await service.execute_page_async(filters, limit, after, include_total)
+
+    if page.next_cursor is not None:
+        token = page.next_cursor.encode()
+        response.headers["X-Next-Cursor"] = token
+        next_url = request.url.include_query_params(cursor=token)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    if page.total_estimate is not None:
+        response.headers["X-Total-Count-Estimate"] = str(page.total_estimate)
+
+    etag = http_cache.collection_etag(
+        ((c.id, c.updated_at) for c in page.items),
+        page.next_cursor.encode() if page.next_cursor else "",
+    )
+    if http_cache.not_modified(if_none_match, etag):
+        # a página foi lida, mas nada é serializado nem enviado
+        return http_cache.not_modified_response("customer_list", etag)
+    http_cache.set_cache_headers(response, "customer_list", etag)
+    return fast_json.respond([fast_json.customer_item(c) for c in page.items], response)
+
+
+@router.post(
+    "/batch-get",
+    response_model=List[CustomerBatchItemOut],
+    summary="Busca vários clientes por id ou CPF com uma única consulta",
+)
+async def batch_get_customers(
+    body: CustomerBatchGetIn,
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    """
+    Um item por chave, na ordem do request. Chaves inexistentes voltam com
+    `found: false` (sem 404); clientes inativos vêm com `active: false`.
+    """
+    service = GetCustomersService(repo)
+    if body.ids is not None:
+        keys = [str(i) for i in body.ids]
+        views = await service.by_ids(body.ids)
+    else:
+        keys = body.cpfs
+        views = await service.by_cpfs(body.cpfs)
+    return fast_json.respond(
+        [
+            {
+                "key": key,
+                "found": view is not None,
+                "customer": fast_json.customer(view) if view else None,
+            }
+            for key, view in zip(keys, views)
+        ]
+    )
+
+
+@router.get("/search", response_model=List[CustomersOut])
+async def search_customers(
+    response: Response,
+    q: str = Query(
+        ..., min_length=2, max_length=100, description="Trecho do nome ou e-mail"
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    """
+    Busca por trecho do nome ou do e-mail (sem diferenciar maiúsculas), os
+    mais relevantes primeiro. No PostgreSQL tolera pequenos erros de digitação.
+    """
+    views = await ListCustomersService(repo).search_async(q, limit)
+    http_cache.set_cache_headers(response, "customer_search", None)
+    return fast_json.respond([fast_json.customer_item(v) for v in views], response)
 
 
-@router.get("", response_model=List[CustomersOut])
-def list_customers(db: Session = Depends(get_db)):
-    service = ListCustomersService(CustomerRepository(db))
-    customers = service.execute()
-    return [
-        CustomersOut(
-            id=c.id,
-            name=c.name,
-            cpf=c.cpf.formatted(),
-            email=c.email.value,
-            active=c.active,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
+@router.get(
+    "/changes",
+    response_model=List[CustomerChangeOut],
+    responses={400: {"description": "Cursor inválido"}},
+)
+async def list_customer_changes(
+    request: Request,
+    response: Response,
+    since: Optional[str] = Query(
+        None, description="`X-Next-Cursor` da última chamada; vazio = desde o início"
+    ),
+    limit: int = Query(500, ge=1, le=1000),
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    """
+    Feed incremental para réplicas: clientes alterados depois de `since`, em
+    ordem `(updated_at, id)`. Desativados voltam como tombstone
+    (`deleted: true`, sem `customer`).
+
+    Guarde `X-Next-Cursor` e mande de volta em `since`; enquanto
+    `X-Has-More` for `true`, chame de novo sem esperar. Alterações dos
+    últimos segundos só aparecem na chamada seguinte.
+    """
+    try:
+        after = ChangeCursor.decode(since) if since else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    until = None
+    if CHANGES_SAFETY_LAG_SECONDS > 0:
+        until = datetime.now(timezone.utc) - timedelta(
+            seconds=CHANGES_SAFETY_LAG_SECONDS
         )
-        for c in customers
-    ]
+    page = await ListCustomersService(repo).execute_changes_async(after, limit, until)
+
+    last = page.items[-1] if page.items else None
+    resume = ChangeCursor(last.updated_at, last.id) if last else after
+    if resume is not None:
+        response.headers["X-Next-Cursor"] = resume.encode()
+    response.headers["X-Has-More"] = "true" if page.next_cursor else "false"
+    if page.next_cursor is not None:
+        next_url = request.url.include_query_params(since=resume.encode())
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+    return fast_json.respond(
+        [
+            {
+                "id": v.id,
+                "updated_at": v.updated_at,
+                "deleted": not v.active,
+                "customer": fast_json.customer_item(v) if v.active else None,
+            }
+            for v in page.items
+        ],
+        response,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Um cliente por linha (NDJSON) ou CSV com cabeçalho",
+            "content": {media: {} for media in MEDIA_TYPES.values()},
+        }
+    },
+)
+def export_customers(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    filters: CustomerFilter = Depends(_customer_filter),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+):
+    """
+    Export completo em streaming, na ordem `(created_at, id)`. A leitura usa
+    cursor do lado do servidor, então a memória não depende do tamanho da
+    tabela. Aceita os mesmos filtros da listagem.
+    """
+    return StreamingResponse(
+        stream_customers(session_factory, filters, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="customers.{fmt}"'},
+    )
 
 
 @router.post(
     "/auth/login",
     response_model=CustomerIdentifyOut,
-    responses={400: {"description": "Credenciais inválidas"}},
+    responses={
+        400: {"description": "Credenciais inválidas"},
+        429: {"description": "Muitas tentativas; ver header Retry-After"},
+        **_HASHER_UNAVAILABLE,
+    },
 )
-def login(payload: AuthIn, db: Session = Depends(get_db)):
-    service = IdentifyCustomerService(CustomerRepository(db), hasher)
+async def login(
+    payload: AuthIn,
+    request: Request,
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+    db: Session = Depends(get_db),
+):
+    await _throttle_login(request, payload.identifier, db)
+
+    service = IdentifyCustomerService(repo, hasher)
     try:
-        token = service.execute(payload.identifier, payload.password)
-        return CustomerIdentifyOut(jwt=token)
+        customer = await service.authenticate_async(
+            payload.identifier, payload.password
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except (HasherBusyError, HasherTimeoutError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return CustomerIdentifyOut(
+        jwt=build_access_token(customer),
+        refresh_token=await run_in_threadpool(_sessions(db).start, customer),
+    )
+
+
+@router.post(
+    "/auth/refresh",
+    response_model=CustomerIdentifyOut,
+    responses={401: {"description": "Refresh token inválido, expirado ou reutilizado"}},
+)
+def refresh_session(payload: RefreshIn, db: Session = Depends(get_db)):
+    """
+    Renova o access token sem nova verificação de senha. O refresh token
+    enviado é consumido e um novo é devolvido (rotação).
+    """
+    try:
+        access, refresh = _sessions(db).rotate(payload.refresh_token)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    return CustomerIdentifyOut(jwt=access, refresh_token=refresh)
 
 
 @router.put(
@@ -173,28 +478,22 @@ def login(payload: AuthIn, db: Session = Depends(get_db)):
         },
     },
 )
-def update_customer(
+async def update_customer(
     cpf: str,
     payload: CustomerUpdateIn,
-    db: Session = Depends(get_db),
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
 ):
     """
     Atualiza dados de um cliente identificado pelo **CPF** (11 dígitos ou com máscara).
 
     Campos permitidos no body: `name`, `email`, `cpf`, `active`.
     """
-    service = UpdateCustomerService(CustomerRepository(db))
+    service = UpdateCustomerService(repo, [token_cache, token_revocations])
     updates = payload.model_dump(exclude_unset=True)
 
     try:
-        updated = service.execute(cpf, updates)
-        return CustomerOut(
-            id=updated.id,
-            name=updated.name,
-            cpf=updated.cpf.formatted(),
-            email=updated.email.value,
-            active=updated.active,
-        )
+        updated = await service.execute_async(cpf, updates)
+        return fast_json.respond(fast_json.customer_entity(updated))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -204,10 +503,12 @@ def update_customer(
 
 
 @router.delete("/{cpf}", status_code=status.HTTP_204_NO_CONTENT)
-def deactivate_customer(cpf: str, db: Session = Depends(get_db)):
-    service = UpdateCustomerService(CustomerRepository(db))
+async def deactivate_customer(
+    cpf: str, repo: CustomerRepositoryPort = Depends(get_customer_repository)
+):
+    service = UpdateCustomerService(repo, [token_cache, token_revocations])
     try:
-        service.execute(cpf, {"active": False})
+        await service.execute_async(cpf, {"active": False})
         return None
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -224,12 +525,29 @@ def deactivate_customer(cpf: str, db: Session = Depends(get_db)):
             "content": {
                 "application/json": {"example": {"detail": "Cliente não encontrado"}}
             },
-        }
+        },
+        304: {"description": "Não modificado (`If-None-Match` confere com a ETag)"},
     },
 )
-def get_customer_by_id(user_id: int, db: Session = Depends(get_db)):
-    repo = CustomerRepository(db)
-    customer = repo.find_by_id(user_id)
-    if not customer:
+async def get_customer_by_id(
+    user_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    repo: CustomerRepositoryPort = Depends(get_customer_repository),
+):
+    if if_none_match:
+        # revalidação: só updated_at, sem montar nem serializar o cliente
+        version = await call(repo.get_version, user_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Cliente não encontrado")
+        etag = http_cache.resource_etag(user_id, version)
+        if http_cache.not_modified(if_none_match, etag):
+            return http_cache.not_modified_response("customer", etag)
+
+    view = await call(repo.get_view, user_id)
+    if not view:
         raise HTTPException(status_code=404, detail="Cliente não encontrado")
-    return _to_response(customer)
+    # a ETag sai da linha devolvida, mesmo que tenha mudado desde a checagem
+    etag = http_cache.resource_etag(view.id, view.updated_at)
+    http_cache.set_cache_headers(response, "customer", etag)
+    return fast_json.respond(fast_json.customer(view), response)
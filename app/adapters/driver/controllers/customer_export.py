@@ -0,0 +1,98 @@
+"""
+Serialização do export de clientes (``GET /api/client/export``).
+
+Cada lote lido do banco vira um único chunk da resposta; nada além do lote
+atual fica em memória.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.domain.value_objects.cpf import format_cpf
+from app.domain.value_objects.page import CustomerFilter
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+FIELDS = ("id", "name", "cpf", "email", "active", "created_at", "updated_at")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+Batch = Sequence[tuple]
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _record(row: tuple) -> tuple:
+    id_, name, cpf, email, active, created_at, updated_at = row
+    return (
+        id_,
+        name,
+        # sem CPF.trusted: o export inteiro passaria pelo cache de instâncias
+        format_cpf(cpf),
+        email,
+        active,
+        _iso(created_at),
+        _iso(updated_at),
+    )
+
+
+# Planilhas executam células que começam assim (CSV/formula injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_safe(value: object) -> object:
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_record(row: tuple) -> tuple:
+    return tuple(_csv_safe(value) for value in _record(row))
+
+
+def ndjson_chunks(batches: Iterable[Batch]) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(FIELDS, _record(row))), ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode()
+
+
+def csv_chunks(batches: Iterable[Batch]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDS)
+    # cabeçalho sai antes da primeira consulta: primeiro byte imediato
+    yield buffer.getvalue().encode()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_csv_record(row) for row in batch)
+        yield buffer.getvalue().encode()
+
+
+def stream_customers(
+    session_factory: Callable[[], Session],
+    filters: CustomerFilter,
+    fmt: str,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """
+    Gerador síncrono (o Starlette itera em threadpool) dono da sessão: ela só
+    fecha quando o último chunk foi enviado ou o cliente desconectou.
+    """
+    session = session_factory()
+    try:
+        batches = CustomerRepository(session).stream_export(filters, batch_size)
+        encode = csv_chunks if fmt == "csv" else ndjson_chunks
+        yield from encode(batches)
+    finally:
+        session.close()
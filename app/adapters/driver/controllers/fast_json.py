@@ -0,0 +1,88 @@
+"""
+Respostas JSON montadas direto de dados já confiáveis (``CustomerView``,
+entidades persistidas, claims verificadas).
+
+Devolver um ``Response`` faz o FastAPI pular o ``response_model``: sem criar
+o modelo Pydantic por item nem validar de novo cada ``EmailStr``. O
+``response_model`` continua na rota só para o OpenAPI. Serialização com
+``orjson`` quando instalado; senão, ``json`` da biblioteca padrão.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+
+from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # mesmo formato do Pydantic: UTC sai com "Z"
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"{type(value).__name__} não é serializável em JSON")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def respond(
+    content: Any, response: Optional[Response] = None, status_code: int = 200
+) -> FastJSONResponse:
+    """``response``: o ``Response`` injetado na rota, para levar seus headers."""
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+
+# ---------- corpos (mesmos campos de CustomerOut/CustomersOut/TokenVerifyOut) ----------
+def customer(view: CustomerView) -> Dict[str, Any]:
+    return {
+        "id": view.id,
+        "name": view.name,
+        "cpf": view.formatted_cpf,
+        "email": view.email,
+        "active": view.active,
+    }
+
+
+def customer_item(view: CustomerView) -> Dict[str, Any]:
+    return {
+        **customer(view),
+        "created_at": view.created_at,
+        "updated_at": view.updated_at,
+    }
+
+
+def customer_entity(entity: Customer) -> Dict[str, Any]:
+    return {
+        "id": entity.id,
+        "name": entity.name,
+        "cpf": entity.cpf.formatted(),
+        "email": entity.email.value,
+        "active": entity.active,
+    }
+
+
+def verified_token(id_: int, name: str, cpf: str, email: str) -> Dict[str, Any]:
+    return {"id": id_, "name": name, "cpf": cpf, "email": email}
@@ -0,0 +1,71 @@
+"""
+ETag/``If-None-Match`` e ``Cache-Control`` dos endpoints de leitura.
+
+A ETag é forte e sai só de ``(id, updated_at)``: toda escrita em
+``customers`` passa pelo ``onupdate`` de ``updated_at``, então a mesma ETag
+significa o mesmo corpo.
+"""
+
+import hashlib
+import os
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Response
+
+# Por rota. Os dados são pessoais (CPF/e-mail): nada de cache compartilhado
+# por padrão, e ``no-cache`` força a revalidação (barata, com 304).
+CACHE_CONTROL = {
+    "customer": os.getenv("CACHE_CONTROL_CUSTOMER", "private, no-cache"),
+    "customer_list": os.getenv("CACHE_CONTROL_CUSTOMER_LIST", "private, no-cache"),
+    "customer_search": os.getenv("CACHE_CONTROL_CUSTOMER_SEARCH", "no-store"),
+}
+
+
+def _digest(parts: Iterable[Tuple[int, Optional[datetime]]], extra: str = "") -> str:
+    h = hashlib.blake2b(digest_size=12)
+    for id_, updated_at in parts:
+        h.update(f"{id_}:{updated_at.isoformat() if updated_at else ''};".encode())
+    h.update(extra.encode())
+    return f'"{h.hexdigest()}"'
+
+
+def resource_etag(id_: int, updated_at: Optional[datetime]) -> str:
+    return _digest([(id_, updated_at)])
+
+
+def collection_etag(
+    items: Iterable[Tuple[int, Optional[datetime]]], extra: str = ""
+) -> str:
+    """ETag de uma página: itens na ordem e ``extra`` (ex.: o próximo cursor)."""
+    return _digest(items, extra)
+
+
+def not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparação fraca, como pede o RFC 9110 para ``If-None-Match``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_headers(route: str, etag: str) -> dict:
+    headers = {"ETag": etag}
+    if CACHE_CONTROL.get(route):
+        headers["Cache-Control"] = CACHE_CONTROL[route]
+    return headers
+
+
+def not_modified_response(route: str, etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(route, etag))
+
+
+def set_cache_headers(response: Response, route: str, etag: Optional[str]) -> None:
+    if etag is not None:
+        response.headers["ETag"] = etag
+    if CACHE_CONTROL.get(route):
+        response.headers["Cache-Control"] = CACHE_CONTROL[route]
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from app.shared.handles import jwt_user
+from app.shared.handles.jwt_keys import JWKS_MAX_AGE_SECONDS
+
+router = APIRouter()
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    summary="Chaves públicas para validar os JWTs localmente",
+)
+def get_jwks(response: Response):
+    response.headers["Cache-Control"] = (
+        f"public, max-age={JWKS_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={JWKS_MAX_AGE_SECONDS}"
+    )
+    return jwt_user.keyring.jwks()
@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+import database
+from app.adapters.driver.dependencies import (
+    change_listener,
+    outbox_relay,
+    password_hasher,
+)
+from app.shared.handles.customer_cache import customer_cache
+from app.shared.handles.customer_changes import customer_changes
+from app.shared.handles.pool_metrics import pool_stats
+from app.shared.handles.rate_limiter import login_throttle
+from app.shared.handles.token_cache import token_cache
+from app.shared.handles.token_revocation import token_revocations
+
+router = APIRouter()
+
+
+@router.get("", summary="Métricas internas em memória deste worker")
+def get_metrics():
+    metrics = {
+        "token_cache": token_cache.stats(),
+        "customer_cache": customer_cache.stats(),
+        "token_revocations": token_revocations.stats(),
+        "login_throttle": login_throttle.stats(),
+        "db_pool": {"sync": pool_stats(database.engine)},
+    }
+    if database.async_engine is not None:
+        metrics["db_pool"]["async"] = pool_stats(database.async_engine.sync_engine)
+    if change_listener is not None:
+        metrics["customer_changes"] = {
+            **customer_changes.stats(),
+            "listener": change_listener.stats(),
+        }
+    if outbox_relay is not None:
+        metrics["outbox_relay"] = outbox_relay.stats()
+    if hasattr(password_hasher, "metrics"):
+        metrics["password_hasher"] = password_hasher.metrics()
+    return metrics
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, constr
+from pydantic import BaseModel, EmailStr, Field, constr, model_validator
 
 CPF_PATTERN = r"^\d{3}\.?\d{3}\.?\d{3}\-?\d{2}$"
 
@@ -37,8 +37,41 @@ class CustomersOut(CustomerOut):
     updated_at: Optional[datetime]
 
 
+class CustomerChangeOut(BaseModel):
+    id: int
+    updated_at: datetime
+    deleted: bool  # tombstone: cliente desativado, sem dados pessoais
+    customer: Optional[CustomersOut] = None
+
+
+class CustomerBatchGetIn(BaseModel):
+    """Exatamente um dos dois: ``ids`` ou ``cpfs``."""
+
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=500)
+    cpfs: Optional[List[constr(pattern=CPF_PATTERN)]] = Field(
+        None, min_length=1, max_length=500
+    )
+
+    @model_validator(mode="after")
+    def _one_key_kind(self):
+        if (self.ids is None) == (self.cpfs is None):
+            raise ValueError("Informe ids ou cpfs (apenas um deles).")
+        return self
+
+
+class CustomerBatchItemOut(BaseModel):
+    key: str  # id ou CPF, como veio no request
+    found: bool
+    customer: Optional[CustomerOut] = None
+
+
 class CustomerIdentifyOut(BaseModel):
     jwt: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshIn(BaseModel):
+    refresh_token: str = Field(min_length=1)
 
 
 class TokenVerifyIn(BaseModel):
@@ -52,6 +85,17 @@ class TokenVerifyOut(BaseModel):
     email: EmailStr
 
 
+class TokenBatchVerifyIn(BaseModel):
+    tokens: List[str] = Field(min_length=1, max_length=500)
+
+
+class TokenBatchItemOut(BaseModel):
+    ok: bool
+    customer: Optional[TokenVerifyOut] = None
+    status_code: Optional[int] = None
+    detail: Optional[str] = None
+
+
 class AuthIn(BaseModel):
     identifier: str  # cpf OU email
     password: constr(min_length=8)
@@ -1,6 +1,36 @@
-from typing import Iterator
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import SessionLocal
+from database import (
+    DB_ASYNC,
+    SQLALCHEMY_DATABASE_URL,
+    SessionLocal,
+    get_async_session_factory,
+)
+
+from app.adapters.driven.repositories.async_customer import AsyncCustomerRepository
+from app.adapters.driven.notifications.pg_listener import PgNotificationListener
+from app.adapters.driven.outbox.relay import OUTBOX_RELAY_ENABLED, OutboxRelay
+from app.adapters.driven.outbox.sinks import build_sink
+from app.adapters.driven.repositories.cached_customer import (
+    CachingCustomerRepository,
+)
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.adapters.driven.security.policy_hasher import default_hasher
+from app.adapters.driven.security.process_pool_hasher import (
+    PASSWORD_HASH_WORKERS,
+    ProcessPoolPasswordHasher,
+)
+from app.domain.ports import CustomerRepositoryPort
+from app.domain.ports.password_hasher import PasswordHasher
+from app.shared.handles.customer_cache import customer_cache
+from app.shared.handles.customer_changes import (
+    CUSTOMER_CHANGES_CHANNEL,
+    CUSTOMER_CHANGES_LISTEN,
+    customer_changes,
+)
 
 
 def get_db() -> Iterator[Session]:
@@ -9,3 +39,76 @@ def get_db() -> Iterator[Session]:
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Para respostas em streaming: o ``get_db`` fecha a sessão antes do corpo ser
+    enviado, então o gerador abre (e fecha) a própria sessão.
+    """
+    return SessionLocal
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+def get_sync_customer_repository(
+    db: Session = Depends(get_db),
+) -> CustomerRepositoryPort:
+    repo = CustomerRepository(db)
+    if customer_cache.enabled:
+        return CachingCustomerRepository(repo, customer_cache)
+    return repo
+
+
+def get_async_customer_repository(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncCustomerRepository:
+    return AsyncCustomerRepository(db)
+
+
+# DB_ASYNC escolhe a implementação injetada nos endpoints de clientes
+get_customer_repository = (
+    get_async_customer_repository if DB_ASYNC else get_sync_customer_repository
+)
+
+
+def build_password_hasher() -> PasswordHasher:
+    """PASSWORD_HASH_WORKERS > 0 liga o pool de processos; 0 = hash inline."""
+    inner = default_hasher()
+    if PASSWORD_HASH_WORKERS > 0:
+        return ProcessPoolPasswordHasher(inner, max_workers=PASSWORD_HASH_WORKERS)
+    return inner
+
+
+password_hasher = build_password_hasher()
+
+
+def build_change_listener() -> Optional[PgNotificationListener]:
+    """CUSTOMER_CHANGES_LISTEN=true: invalida o estado local com o LISTEN do banco."""
+    if not CUSTOMER_CHANGES_LISTEN:
+        return None
+    return PgNotificationListener(
+        SQLALCHEMY_DATABASE_URL,
+        CUSTOMER_CHANGES_CHANNEL,
+        on_payload=customer_changes.publish,
+        on_connect=customer_changes.resync,
+    )
+
+
+change_listener = build_change_listener()
+
+
+def build_outbox_relay() -> Optional[OutboxRelay]:
+    """
+    OUTBOX_RELAY_ENABLED=true: entrega os eventos de customer_outbox.
+    Sem OUTBOX_SINK a aplicação não sobe (``build_sink`` levanta).
+    """
+    if not OUTBOX_RELAY_ENABLED:
+        return None
+    return OutboxRelay(SessionLocal, build_sink())
+
+
+outbox_relay = build_outbox_relay()
@@ -15,6 +15,7 @@ class Customer:
     email: Email
     password_hash: str
     active: bool = True
+    token_version: int = 0
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.domain.value_objects.cpf import format_cpf
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerView:
+    """
+    Projeção somente leitura do cliente (sem ``password_hash``), montada
+    direto das linhas do banco, sem ORM nem value objects.
+    A ordem dos campos é a das colunas selecionadas pelo repositório.
+    """
+
+    id: int
+    name: str
+    cpf: str  # 11 dígitos
+    email: str
+    active: bool
+    token_version: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @property
+    def formatted_cpf(self) -> str:
+        return format_cpf(self.cpf)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class RefreshToken:
+    """Refresh token opaco; só o hash (SHA-256) é persistido."""
+
+    id: Optional[int]
+    customer_id: int
+    token_hash: str
+    family_id: str
+    expires_at: datetime
+    used_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    @property
+    def spent(self) -> bool:
+        return self.used_at is not None or self.revoked_at is not None
@@ -1 +1,5 @@
-from .customer_repository_port import CustomerRepositoryPort  # noqa: F401
+from .customer_repository_port import (  # noqa: F401
+    CustomerRepositoryPort,
+    DuplicateCustomerError,
+)
+from .async_customer_repository_port import AsyncCustomerRepositoryPort  # noqa: F401
@@ -0,0 +1,116 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
+
+
+class AsyncCustomerRepositoryPort(ABC):
+    """Versão assíncrona de ``CustomerRepositoryPort`` (mesmos contratos)."""
+
+    # ---------- C ----------
+    @abstractmethod
+    async def create(self, customer: Customer) -> Customer: ...
+
+    @abstractmethod
+    async def bulk_create(self, customers: Sequence[Customer]) -> int: ...
+
+    # ---------- R ----------
+    @abstractmethod
+    async def find_by_id(self, customer_id: int) -> Optional[Customer]: ...
+
+    @abstractmethod
+    async def find_by_cpf(self, cpf: str) -> Optional[Customer]: ...
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Customer]: ...
+
+    @abstractmethod
+    async def find_many_by_ids(self, ids: Iterable[int]) -> Iterable[Customer]: ...
+
+    @abstractmethod
+    async def find_many_by_cpfs(self, cpfs: Iterable[str]) -> Iterable[Customer]: ...
+
+    @abstractmethod
+    async def find_existing_keys(
+        self, cpfs: Iterable[str], emails: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]: ...
+
+    # leituras somente das colunas de CustomerView, sem montar o ORM
+    @abstractmethod
+    async def get_view(self, customer_id: int) -> Optional[CustomerView]: ...
+
+    @abstractmethod
+    async def get_version(self, customer_id: int) -> Optional[datetime]:
+        """Só o ``updated_at`` (validação de ETag); ``None`` se não existe."""
+
+    @abstractmethod
+    async def get_view_by_cpf(self, cpf: str) -> Optional[CustomerView]: ...
+
+    @abstractmethod
+    async def find_views_by_ids(self, ids: Iterable[int]) -> List[CustomerView]: ...
+
+    @abstractmethod
+    async def find_views_by_cpfs(self, cpfs: Iterable[str]) -> List[CustomerView]: ...
+
+    @abstractmethod
+    async def list_all(self) -> Iterable[Customer]: ...
+
+    @abstractmethod
+    async def list_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+    ) -> Page[CustomerView]: ...
+
+    @abstractmethod
+    async def list_changes(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        """
+        Clientes com ``updated_at`` depois de ``after`` (inclusive os
+        desativados), em ordem ``(updated_at, id)``, sem passar de ``until``.
+        """
+
+    @abstractmethod
+    async def search(self, term: str, limit: int) -> List[CustomerView]:
+        """Clientes cujo nome ou e-mail contém ``term``, mais relevantes primeiro."""
+
+    @abstractmethod
+    async def estimate_count(self, filters: CustomerFilter) -> int: ...
+
+    # ---------- U ----------
+    @abstractmethod
+    async def update(self, customer: Customer) -> Customer: ...
+
+    @abstractmethod
+    async def update_fields(
+        self, cpf: str, changes: Dict[str, Any]
+    ) -> Optional[Customer]:
+        """
+        Atualiza numa só operação os campos de ``changes`` (name, cpf, email,
+        active) do cliente com esse CPF e devolve o resultado (``None`` se não
+        existe). Soma 1 ao ``token_version`` para cada troca efetiva de CPF ou
+        e-mail e para a desativação. Conflito: ``DuplicateCustomerError``.
+        """
+
+    @abstractmethod
+    async def update_password_hash(
+        self, customer_id: int, password_hash: str
+    ) -> None: ...
+
+    # ---------- D ----------
+    @abstractmethod
+    async def delete(self, customer_id: int) -> None: ...
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from app.domain.entities.customer import Customer
+
+
+class CustomerChangeListener(Protocol):
+    """Recebe o cliente já persistido após uma alteração."""
+
+    def customer_changed(self, customer: Customer) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerChange:
+    """
+    Alteração de cliente vinda de outro processo (notificação do banco).
+
+    Traz só o necessário para invalidar estado local; ``old_cpf``/``old_email``
+    vêm preenchidos em updates, para derrubar as chaves antigas.
+    """
+
+    op: str  # INSERT | UPDATE | DELETE
+    id: int
+    cpf: str
+    email: str
+    active: bool
+    token_version: int
+    old_cpf: Optional[str] = None
+    old_email: Optional[str] = None
+
+
+class CustomerChangeSubscriber(Protocol):
+    def customer_change_notified(self, change: CustomerChange) -> None: ...
+
+    def drop_local_state(self) -> None:
+        """
+        Notificações podem ter sido perdidas (reconexão): descarta o que este
+        processo guarda. Estado compartilhado (Redis) e métricas ficam.
+        """
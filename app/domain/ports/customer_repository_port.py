@@ -1,14 +1,34 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
+
+
+class DuplicateCustomerError(ValueError):
+    """Violação de unicidade no banco; ``field`` é ``"cpf"`` ou ``"email"``."""
+
+    def __init__(self, field: str):
+        super().__init__(f"{field} já cadastrado")
+        self.field = field
 
 
 class CustomerRepositoryPort(ABC):
     # ---------- C ----------
     @abstractmethod
-    def create(self, customer: Customer) -> Customer: ...
+    def create(self, customer: Customer) -> Customer:
+        """Insere e devolve o cliente; CPF/e-mail repetido: ``DuplicateCustomerError``."""
+
+    @abstractmethod
+    def bulk_create(self, customers: Sequence[Customer]) -> int: ...
 
     # ---------- R ----------
     @abstractmethod
@@ -20,13 +40,80 @@ class CustomerRepositoryPort(ABC):
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Customer]: ...
 
+    @abstractmethod
+    def find_many_by_ids(self, ids: Iterable[int]) -> Iterable[Customer]: ...
+
+    @abstractmethod
+    def find_many_by_cpfs(self, cpfs: Iterable[str]) -> Iterable[Customer]: ...
+
+    @abstractmethod
+    def find_existing_keys(
+        self, cpfs: Iterable[str], emails: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]: ...
+
+    # leituras somente das colunas de CustomerView, sem montar o ORM
+    @abstractmethod
+    def get_view(self, customer_id: int) -> Optional[CustomerView]: ...
+
+    @abstractmethod
+    def get_version(self, customer_id: int) -> Optional[datetime]:
+        """Só o ``updated_at`` (validação de ETag); ``None`` se não existe."""
+
+    @abstractmethod
+    def get_view_by_cpf(self, cpf: str) -> Optional[CustomerView]: ...
+
+    @abstractmethod
+    def find_views_by_ids(self, ids: Iterable[int]) -> List[CustomerView]: ...
+
+    @abstractmethod
+    def find_views_by_cpfs(self, cpfs: Iterable[str]) -> List[CustomerView]: ...
+
     @abstractmethod
     def list_all(self) -> Iterable[Customer]: ...
 
+    @abstractmethod
+    def list_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+    ) -> Page[CustomerView]: ...
+
+    @abstractmethod
+    def list_changes(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        """
+        Clientes com ``updated_at`` depois de ``after`` (inclusive os
+        desativados), em ordem ``(updated_at, id)``, sem passar de ``until``.
+        """
+
+    @abstractmethod
+    def search(self, term: str, limit: int) -> List[CustomerView]:
+        """Clientes cujo nome ou e-mail contém ``term``, mais relevantes primeiro."""
+
+    @abstractmethod
+    def estimate_count(self, filters: CustomerFilter) -> int: ...
+
     # ---------- U ----------
     @abstractmethod
     def update(self, customer: Customer) -> Customer: ...
 
+    @abstractmethod
+    def update_fields(self, cpf: str, changes: Dict[str, Any]) -> Optional[Customer]:
+        """
+        Atualiza numa só operação os campos de ``changes`` (name, cpf, email,
+        active) do cliente com esse CPF e devolve o resultado (``None`` se não
+        existe). Soma 1 ao ``token_version`` para cada troca efetiva de CPF ou
+        e-mail e para a desativação. Conflito: ``DuplicateCustomerError``.
+        """
+
+    @abstractmethod
+    def update_password_hash(self, customer_id: int, password_hash: str) -> None: ...
+
     # ---------- D ----------
     @abstractmethod
     def delete(self, customer_id: int) -> None: ...
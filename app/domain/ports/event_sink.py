@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Protocol, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEvent:
+    """
+    Evento de cliente gravado no outbox na mesma transação da alteração.
+
+    A entrega é "ao menos uma vez": o mesmo ``id`` pode chegar de novo depois
+    de uma falha, então o consumidor deve deduplicar por ele.
+    """
+
+    id: int
+    type: str  # customer.created | customer.updated | customer.deactivated | ...
+    customer_id: int
+    payload: Dict[str, Any]
+    created_at: datetime
+    attempts: int = 0
+
+    def to_message(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "customer_id": self.customer_id,
+            "occurred_at": self.created_at.isoformat(),
+            "data": self.payload,
+        }
+
+
+class EventSink(Protocol):
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        """Entrega o lote inteiro ou levanta exceção (o lote volta para a fila)."""
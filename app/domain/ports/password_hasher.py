@@ -4,3 +4,11 @@ from typing import Protocol
 class PasswordHasher(Protocol):
     def hash(self, plain: str) -> str: ...
     def verify(self, plain: str, hashed: str) -> bool: ...
+    def needs_rehash(self, hashed: str) -> bool: ...
+
+
+class AsyncPasswordHasher(PasswordHasher, Protocol):
+    """Hasher que também pode ser aguardado sem ocupar a thread do request."""
+
+    async def hash_async(self, plain: str) -> str: ...
+    async def verify_async(self, plain: str, hashed: str) -> bool: ...
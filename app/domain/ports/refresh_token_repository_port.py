@@ -0,0 +1,20 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenRepositoryPort(ABC):
+    @abstractmethod
+    def create(self, token: RefreshToken) -> RefreshToken: ...
+
+    @abstractmethod
+    def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]: ...
+
+    @abstractmethod
+    def mark_used(self, token_id: int) -> bool:
+        """Marca como usado; ``False`` se já estava usado/revogado (corrida)."""
+
+    @abstractmethod
+    def revoke_family(self, family_id: str) -> None: ...
@@ -0,0 +1,31 @@
+import inspect
+from typing import Any, Callable
+
+from anyio import to_thread
+
+from app.domain.ports.password_hasher import PasswordHasher
+
+
+# Trabalho síncrono vai para o threadpool do AnyIO, o mesmo dos handlers
+# ``def`` (40 tokens), e não para o executor padrão do loop, que tem
+# min(32, CPUs + 4) threads: 5 numa task de 1 vCPU.
+async def call(fn: Callable, *args) -> Any:
+    """
+    Aguarda ``fn(*args)``: corrotinas direto, funções síncronas (I/O bloqueante
+    de repositório) numa thread para não travar o event loop.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    return await to_thread.run_sync(fn, *args)
+
+
+async def hash_password(hasher: PasswordHasher, plain: str) -> str:
+    if hasattr(hasher, "hash_async"):
+        return await hasher.hash_async(plain)
+    return await to_thread.run_sync(hasher.hash, plain)
+
+
+async def verify_password(hasher: PasswordHasher, plain: str, hashed: str) -> bool:
+    if hasattr(hasher, "verify_async"):
+        return await hasher.verify_async(plain, hashed)
+    return await to_thread.run_sync(hasher.verify, plain, hashed)
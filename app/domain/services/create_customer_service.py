@@ -1,10 +1,21 @@
 from app.domain.entities.customer import Customer
-from app.domain.ports import CustomerRepositoryPort
+from app.domain.ports import CustomerRepositoryPort, DuplicateCustomerError
 from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.services._async import call, hash_password
 from app.domain.value_objects.cpf import CPF
 
+_DUPLICATE_MESSAGES = {
+    "cpf": "CPF já cadastrado no sistema.",
+    "email": "E-mail já cadastrado no sistema.",
+}
+
 
 class CreateCustomerService:
+    """
+    Cadastro sem consultas prévias: a duplicidade vem das constraints UNIQUE
+    no INSERT. O hash (caro) só roda depois das validações baratas.
+    """
+
     def __init__(self, repo: CustomerRepositoryPort, hasher: PasswordHasher):
         self.repo = repo
         self.hasher = hasher
@@ -13,13 +24,24 @@ class CreateCustomerService:
     def _digits_only(cpf: str) -> str:
         return "".join(ch for ch in cpf if ch.isdigit())
 
-    def execute(self, customer: Customer, plain_password: str) -> Customer:
-        if self.repo.find_by_cpf(customer.cpf.value):
-            raise ValueError("CPF já cadastrado no sistema.")
-        if self.repo.find_by_email(customer.email.value):
-            raise ValueError("E-mail já cadastrado no sistema.")
+    def _prepare(self, customer: Customer, plain_password: str) -> None:
         if len(plain_password) < 8:
             raise ValueError("Senha muito curta (mínimo 8 caracteres).")
-        customer.password_hash = self.hasher.hash(plain_password)
         customer.cpf = CPF(self._digits_only(customer.cpf.value))
-        return self.repo.create(customer)
+
+    def execute(self, customer: Customer, plain_password: str) -> Customer:
+        self._prepare(customer, plain_password)
+        customer.password_hash = self.hasher.hash(plain_password)
+        try:
+            return self.repo.create(customer)
+        except DuplicateCustomerError as e:
+            raise ValueError(_DUPLICATE_MESSAGES[e.field])
+
+    async def execute_async(self, customer: Customer, plain_password: str) -> Customer:
+        """Igual a ``execute``, sem bloquear o event loop no hash da senha."""
+        self._prepare(customer, plain_password)
+        customer.password_hash = await hash_password(self.hasher, plain_password)
+        try:
+            return await call(self.repo.create, customer)
+        except DuplicateCustomerError as e:
+            raise ValueError(_DUPLICATE_MESSAGES[e.field])
@@ -0,0 +1,31 @@
+import re
+from typing import List, Optional, Sequence, Union
+
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports import AsyncCustomerRepositoryPort, CustomerRepositoryPort
+from app.domain.services._async import call
+
+_NON_DIGITS = re.compile(r"\D+")
+
+
+class GetCustomersService:
+    """
+    Busca em lote para chamadas entre serviços: uma consulta para todos os
+    ids (ou CPFs) e a resposta na ordem pedida, com ``None`` onde não existe.
+    """
+
+    def __init__(
+        self, repo: Union[CustomerRepositoryPort, AsyncCustomerRepositoryPort]
+    ):
+        self.repo = repo
+
+    async def by_ids(self, ids: Sequence[int]) -> List[Optional[CustomerView]]:
+        found = {v.id: v for v in await call(self.repo.find_views_by_ids, set(ids))}
+        return [found.get(i) for i in ids]
+
+    async def by_cpfs(self, cpfs: Sequence[str]) -> List[Optional[CustomerView]]:
+        digits = [_NON_DIGITS.sub("", c) for c in cpfs]
+        found = {
+            v.cpf: v for v in await call(self.repo.find_views_by_cpfs, set(digits))
+        }
+        return [found.get(d) for d in digits]
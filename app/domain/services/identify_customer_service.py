@@ -1,15 +1,33 @@
+import logging
+
+from app.domain.entities.customer import Customer
 from app.domain.ports import CustomerRepositoryPort
 from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.services._async import call, hash_password, verify_password
 from app.domain.value_objects.cpf import CPF
 from app.shared.handles.jwt_user import create_access_token
 
+logger = logging.getLogger(__name__)
+
+
+def build_access_token(customer: Customer) -> str:
+    payload = {
+        "id": customer.id,
+        "cpf": customer.cpf.value,
+        "email": customer.email.value,
+        "name": customer.name,
+        "role": "customer",
+        "ver": customer.token_version,
+    }
+    return create_access_token(payload)
+
 
 class IdentifyCustomerService:
     def __init__(self, repo: CustomerRepositoryPort, hasher: PasswordHasher):
         self.repo = repo
         self.hasher = hasher
 
-    def execute(self, identifier: str, password: str) -> str:
+    def authenticate(self, identifier: str, password: str) -> Customer:
         customer = self.repo.find_by_email(identifier) or self.repo.find_by_cpf(
             CPF(identifier).value
         )
@@ -19,11 +37,34 @@ class IdentifyCustomerService:
         if not self.hasher.verify(password, customer.password_hash):
             raise ValueError("Credenciais inválidas.")
 
-        payload = {
-            "id": customer.id,
-            "cpf": customer.cpf.value,
-            "email": customer.email.value,
-            "name": customer.name,
-            "role": "customer",
-        }
-        return create_access_token(payload)
+        if self.hasher.needs_rehash(customer.password_hash):
+            try:
+                new_hash = self.hasher.hash(password)
+                self.repo.update_password_hash(customer.id, new_hash)
+                customer.password_hash = new_hash
+            except Exception:  # rehash é oportunista; não derruba o login
+                logger.warning("Falha ao atualizar hash do cliente %s", customer.id)
+        return customer
+
+    async def authenticate_async(self, identifier: str, password: str) -> Customer:
+        """Igual a ``authenticate``, sem bloquear o event loop no bcrypt."""
+        customer = await call(self.repo.find_by_email, identifier)
+        if not customer:
+            customer = await call(self.repo.find_by_cpf, CPF(identifier).value)
+        if not customer or not customer.active:
+            raise ValueError("Usuário não encontrado ou inativo.")
+
+        if not await verify_password(self.hasher, password, customer.password_hash):
+            raise ValueError("Credenciais inválidas.")
+
+        if self.hasher.needs_rehash(customer.password_hash):
+            try:
+                new_hash = await hash_password(self.hasher, password)
+                await call(self.repo.update_password_hash, customer.id, new_hash)
+                customer.password_hash = new_hash
+            except Exception:  # rehash é oportunista; não derruba o login
+                logger.warning("Falha ao atualizar hash do cliente %s", customer.id)
+        return customer
+
+    def execute(self, identifier: str, password: str) -> str:
+        return build_access_token(self.authenticate(identifier, password))
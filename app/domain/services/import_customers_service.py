@@ -0,0 +1,171 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.entities.customer import Customer
+from app.domain.ports import CustomerRepositoryPort, DuplicateCustomerError
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+
+
+@dataclass(slots=True)
+class ImportRow:
+    """Uma linha do arquivo de importação (``line`` começa em 1)."""
+
+    line: int
+    name: Optional[str] = None
+    cpf: Optional[str] = None
+    email: Optional[str] = None
+    password: Optional[str] = None
+    error: Optional[str] = None  # erro de parsing detectado pelo leitor
+
+
+@dataclass(slots=True)
+class RowError:
+    line: int
+    detail: str
+    cpf: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ImportReport:
+    total: int = 0
+    imported: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+class ImportCustomersService:
+    """
+    Importação em massa: valida o lote inteiro, checa duplicidade contra o
+    banco com uma consulta por lote, gera os hashes em paralelo (``executor``)
+    e grava o lote de uma vez (``bulk_create``).
+
+    Linhas com problema não interrompem a importação; vão para o relatório.
+    """
+
+    def __init__(
+        self,
+        repo: CustomerRepositoryPort,
+        hasher: PasswordHasher,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ):
+        self.repo = repo
+        self.hasher = hasher
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    # ---------- validação ----------
+    @staticmethod
+    def _validate(row: ImportRow) -> Customer:
+        if row.error:
+            raise ValueError(row.error)
+        name = (row.name or "").strip()
+        if not 2 <= len(name) <= 150:
+            raise ValueError("Nome deve ter entre 2 e 150 caracteres.")
+        cpf = CPF(row.cpf or "")
+        email = Email((row.email or "").strip())
+        if len(row.password or "") < 8:
+            raise ValueError("Senha muito curta (mínimo 8 caracteres).")
+        return Customer(id=None, name=name, cpf=cpf, email=email, password_hash="")
+
+    def _hash_all(self, passwords: List[str]) -> List[str]:
+        if self.executor is None:
+            return [self.hasher.hash(p) for p in passwords]
+        return list(self.executor.map(self.hasher.hash, passwords, chunksize=16))
+
+    # ---------- lote ----------
+    def _import_chunk(self, rows: List[ImportRow], report: ImportReport) -> None:
+        valid: Dict[int, Tuple[Customer, ImportRow]] = {}
+        seen_cpfs, seen_emails = set(), set()
+
+        for row in rows:
+            try:
+                customer = self._validate(row)
+            except ValueError as e:
+                report.errors.append(RowError(row.line, str(e), row.cpf))
+                continue
+            if customer.cpf.value in seen_cpfs:
+                report.errors.append(
+                    RowError(row.line, "CPF duplicado no arquivo.", row.cpf)
+                )
+            elif customer.email.value in seen_emails:
+                report.errors.append(
+                    RowError(row.line, "E-mail duplicado no arquivo.", row.cpf)
+                )
+            else:
+                seen_cpfs.add(customer.cpf.value)
+                seen_emails.add(customer.email.value)
+                valid[row.line] = (customer, row)
+
+        # duplicidade contra o banco antes de gastar CPU com hash
+        self._drop_existing(valid, report)
+        if not valid:
+            return
+
+        hashes = self._hash_all([row.password for _, row in valid.values()])
+        for (customer, _), password_hash in zip(valid.values(), hashes):
+            customer.password_hash = password_hash
+
+        try:
+            report.imported += self.repo.bulk_create([c for c, _ in valid.values()])
+            return
+        except DuplicateCustomerError:
+            # outro processo gravou um dos CPFs/e-mails depois da checagem
+            self._drop_existing(valid, report)
+        except ValueError as e:
+            self._fail_chunk(valid, report, e)
+            return
+        if not valid:
+            return
+        try:
+            report.imported += self.repo.bulk_create([c for c, _ in valid.values()])
+        except ValueError as e:
+            # nova corrida ou outra restrição: o lote vai para o relatório
+            self._fail_chunk(valid, report, e)
+
+    @staticmethod
+    def _fail_chunk(
+        valid: Dict[int, Tuple[Customer, ImportRow]],
+        report: ImportReport,
+        error: Exception,
+    ) -> None:
+        # o relatório sempre traz o CPF como veio no arquivo
+        detail = f"Lote não gravado: {error}"
+        for line, (_, row) in valid.items():
+            report.errors.append(RowError(line, detail, row.cpf))
+
+    def _drop_existing(
+        self, valid: Dict[int, Tuple[Customer, ImportRow]], report: ImportReport
+    ) -> None:
+        if not valid:
+            return
+        cpfs, emails = self.repo.find_existing_keys(
+            [c.cpf.value for c, _ in valid.values()],
+            [c.email.value for c, _ in valid.values()],
+        )
+        for line, (customer, row) in list(valid.items()):
+            if customer.cpf.value in cpfs:
+                detail = "CPF já cadastrado no sistema."
+            elif customer.email.value in emails:
+                detail = "E-mail já cadastrado no sistema."
+            else:
+                continue
+            report.errors.append(RowError(line, detail, row.cpf))
+            del valid[line]
+
+    # ---------- entrada ----------
+    def execute(self, rows: Iterable[ImportRow]) -> ImportReport:
+        report = ImportReport()
+        iterator: Iterator[ImportRow] = iter(rows)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            report.total += len(chunk)
+            self._import_chunk(chunk, report)
+        report.errors.sort(key=lambda e: e.line)
+        return report
@@ -1,12 +1,67 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
 from app.domain.entities.customer import Customer
-from app.domain.ports import CustomerRepositoryPort
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports import AsyncCustomerRepositoryPort, CustomerRepositoryPort
+from app.domain.services._async import call
+from app.domain.value_objects.page import (
+    ChangeCursor,
+    CustomerFilter,
+    Page,
+    PageCursor,
+)
 
 
 class ListCustomersService:
-    def __init__(self, repo: CustomerRepositoryPort):
+    def __init__(
+        self, repo: Union[CustomerRepositoryPort, AsyncCustomerRepositoryPort]
+    ):
         self.repo = repo
 
     def execute(self) -> List[Customer]:
         return list(self.repo.list_all())
+
+    async def execute_async(self) -> List[Customer]:
+        return list(await call(self.repo.list_all))
+
+    # ---------- paginado ----------
+    def execute_page(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+        include_total: bool = False,
+    ) -> Page[CustomerView]:
+        page = self.repo.list_page(filters, limit, after)
+        if include_total:
+            page.total_estimate = self.repo.estimate_count(filters)
+        return page
+
+    async def execute_page_async(
+        self,
+        filters: CustomerFilter,
+        limit: int,
+        after: Optional[PageCursor] = None,
+        include_total: bool = False,
+    ) -> Page[CustomerView]:
+        page = await call(self.repo.list_page, filters, limit, after)
+        if include_total:
+            page.total_estimate = await call(self.repo.estimate_count, filters)
+        return page
+
+    # ---------- feed de alterações ----------
+    async def execute_changes_async(
+        self,
+        after: Optional[ChangeCursor],
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> Page[CustomerView]:
+        return await call(self.repo.list_changes, after, limit, until)
+
+    # ---------- busca ----------
+    def search(self, term: str, limit: int) -> List[CustomerView]:
+        return self.repo.search(term, limit)
+
+    async def search_async(self, term: str, limit: int) -> List[CustomerView]:
+        return await call(self.repo.search, term, limit)
@@ -0,0 +1,81 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from app.domain.entities.customer import Customer
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.ports import CustomerRepositoryPort
+from app.domain.ports.refresh_token_repository_port import RefreshTokenRepositoryPort
+from app.domain.services.identify_customer_service import build_access_token
+from app.shared.handles.jwt_user import REFRESH_TOKEN_EXPIRE_DAYS
+
+
+class RefreshSessionService:
+    """
+    Sessões deslizantes com refresh tokens opacos e rotativos.
+
+    Cada uso gera um novo refresh token da mesma família e invalida o anterior.
+    Reapresentar um token já usado derruba a família inteira (reuso = vazamento).
+    """
+
+    def __init__(
+        self,
+        tokens: RefreshTokenRepositoryPort,
+        customers: CustomerRepositoryPort,
+        ttl: timedelta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ):
+        self.tokens = tokens
+        self.customers = customers
+        self.ttl = ttl
+
+    @staticmethod
+    def _hash(raw: str) -> str:
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _aware(value: datetime) -> datetime:
+        # SQLite devolve datetimes sem fuso; gravamos sempre em UTC
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+    def _issue(self, customer_id: int, family_id: Optional[str] = None) -> str:
+        raw = secrets.token_urlsafe(32)
+        self.tokens.create(
+            RefreshToken(
+                id=None,
+                customer_id=customer_id,
+                token_hash=self._hash(raw),
+                family_id=family_id or secrets.token_hex(16),
+                expires_at=self._now() + self.ttl,
+            )
+        )
+        return raw
+
+    def start(self, customer: Customer) -> str:
+        """Abre uma nova sessão (família) e devolve o refresh token."""
+        return self._issue(customer.id)
+
+    def rotate(self, raw_token: str) -> Tuple[str, str]:
+        """Troca o refresh token por (novo access token, novo refresh token)."""
+        current = self.tokens.find_by_hash(self._hash(raw_token))
+        if not current:
+            raise ValueError("Refresh token inválido.")
+
+        if current.spent or not self.tokens.mark_used(current.id):
+            self.tokens.revoke_family(current.family_id)
+            raise ValueError("Refresh token reutilizado; sessão encerrada.")
+
+        if self._aware(current.expires_at) <= self._now():
+            raise ValueError("Refresh token expirado.")
+
+        customer = self.customers.find_by_id(current.customer_id)
+        if not customer or not customer.active:
+            self.tokens.revoke_family(current.family_id)
+            raise ValueError("Usuário não encontrado ou inativo.")
+
+        access = build_access_token(customer)
+        return access, self._issue(customer.id, current.family_id)
@@ -1,14 +1,37 @@
+from typing import Any, Dict, Iterable, Union
+
 from app.domain.entities.customer import Customer
-from app.domain.ports import CustomerRepositoryPort
+from app.domain.ports import (
+    AsyncCustomerRepositoryPort,
+    CustomerRepositoryPort,
+    DuplicateCustomerError,
+)
+from app.domain.ports.customer_change_listener import CustomerChangeListener
+from app.domain.services._async import call
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
 
+_DUPLICATE_MESSAGES = {
+    "cpf": "CPF já cadastrado.",
+    "email": "E-mail já cadastrado.",
+}
+
 
 class UpdateCustomerService:
+    """
+    Atualização parcial por CPF num único ``UPDATE ... RETURNING`` do
+    repositório; unicidade e revogação de tokens ficam a cargo do banco.
+    """
+
     _allowed = {"cpf", "name", "email", "active"}
 
-    def __init__(self, repo: CustomerRepositoryPort):
+    def __init__(
+        self,
+        repo: Union[CustomerRepositoryPort, AsyncCustomerRepositoryPort],
+        listeners: Iterable[CustomerChangeListener] = (),
+    ):
         self.repo = repo
+        self.listeners = list(listeners)
 
     @staticmethod
     def _digits_only(cpf: str) -> str:
@@ -19,34 +42,41 @@ class UpdateCustomerService:
         if extra:
             raise ValueError(f"Campos inválidos: {', '.join(extra)}")
 
+    @staticmethod
+    def _changes(updates: dict) -> Dict[str, Any]:
+        """Valida os valores recebidos e normaliza CPF/e-mail para gravação."""
+        changes = dict(updates)
+        if "cpf" in changes:
+            changes["cpf"] = CPF(changes["cpf"]).value
+        if "email" in changes:
+            changes["email"] = Email(changes["email"]).value
+        return changes
+
+    def _notify(self, updated: Customer) -> Customer:
+        for listener in self.listeners:
+            listener.customer_changed(updated)
+        return updated
+
     def execute(self, cpf: str, updates: dict) -> Customer:
         self._validate_updates(updates)
-
-        # cliente existente
-        cust = self.repo.find_by_cpf(self._digits_only(cpf))
-        if not cust:
+        try:
+            updated = self.repo.update_fields(
+                self._digits_only(cpf), self._changes(updates)
+            )
+        except DuplicateCustomerError as e:
+            raise ValueError(_DUPLICATE_MESSAGES[e.field])
+        if not updated:
             raise ValueError("Cliente não encontrado.")
+        return self._notify(updated)
 
-        # CPF
-        if "cpf" in updates:
-            new_cpf = CPF(updates["cpf"])
-            if self.repo.find_by_cpf(new_cpf.value) and new_cpf.value != cust.cpf.value:
-                raise ValueError("CPF já cadastrado.")
-            cust.cpf = new_cpf
-
-        # e-mail
-        if "email" in updates:
-            new_email = Email(updates["email"])
-            if (
-                self.repo.find_by_email(new_email.value)
-                and new_email.value != cust.email.value
-            ):
-                raise ValueError("E-mail já cadastrado.")
-            cust.email = new_email
-
-        if "name" in updates:
-            cust.name = updates["name"]
-        if "active" in updates:
-            cust.active = updates["active"]
-
-        return self.repo.update(cust)
+    async def execute_async(self, cpf: str, updates: dict) -> Customer:
+        self._validate_updates(updates)
+        try:
+            updated = await call(
+                self.repo.update_fields, self._digits_only(cpf), self._changes(updates)
+            )
+        except DuplicateCustomerError as e:
+            raise ValueError(_DUPLICATE_MESSAGES[e.field])
+        if not updated:
+            raise ValueError("Cliente não encontrado.")
+        return self._notify(updated)
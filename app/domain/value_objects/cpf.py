@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 _DIGITS_RE = re.compile(r"\D+")
@@ -11,6 +12,11 @@ def _calc_digit(seq: str) -> str:
     return "0" if resto < 2 else str(11 - resto)
 
 
+def format_cpf(digits: str) -> str:
+    """``12345678909`` -> ``123.456.789-09``; não valida nem cria ``CPF``."""
+    return f"{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}"
+
+
 @dataclass(frozen=True, slots=True)
 class CPF:
     """CPF sempre armazenado como 11 dígitos."""
@@ -28,9 +34,24 @@ class CPF:
         if digits[-2:] != _calc_digit(digits[:9]) + _calc_digit(digits[:10]):
             raise ValueError("CPF inválido (dígitos verificadores)")
 
+    @classmethod
+    def trusted(cls, digits: str) -> CPF:
+        """
+        CPF lido do banco, já validado na gravação: não revalida. Instâncias
+        repetidas são reaproveitadas (o objeto é imutável).
+        Não usar com entrada externa.
+        """
+        return _trusted_cpf(digits)
+
     def formatted(self) -> str:
-        v = self.value
-        return f"{v[:3]}.{v[3:6]}.{v[6:9]}-{v[9:]}"
+        return format_cpf(self.value)
 
     def __str__(self) -> str:
         return self.formatted()
+
+
+@lru_cache(maxsize=65536)
+def _trusted_cpf(digits: str) -> CPF:
+    cpf = object.__new__(CPF)
+    object.__setattr__(cpf, "value", digits)
+    return cpf
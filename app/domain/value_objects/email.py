@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -13,5 +14,17 @@ class Email:
         if not _EMAIL_RE.match(self.value):
             raise ValueError("E-mail inválido")
 
+    @classmethod
+    def trusted(cls, value: str) -> Email:
+        """E-mail lido do banco: não revalida e reaproveita instâncias repetidas."""
+        return _trusted_email(value)
+
     def __str__(self) -> str:
         return self.value
+
+
+@lru_cache(maxsize=65536)
+def _trusted_email(value: str) -> Email:
+    email = object.__new__(Email)
+    object.__setattr__(email, "value", value)
+    return email
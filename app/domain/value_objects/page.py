@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def _encode(at: datetime, id_: int) -> str:
+    raw = json.dumps([at.isoformat(), id_]).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode(token: str) -> Tuple[datetime, int]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        at, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(at), int(id_)
+    except (ValueError, TypeError):
+        raise ValueError("Cursor inválido")
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """Posição opaca de paginação keyset: ``(created_at, id)`` do último item."""
+
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        return _encode(self.created_at, self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        return cls(*_decode(token))
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeCursor:
+    """Posição no feed de alterações: ``(updated_at, id)`` do último item."""
+
+    updated_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        return _encode(self.updated_at, self.id)
+
+    @classmethod
+    def decode(cls, token: str) -> "ChangeCursor":
+        return cls(*_decode(token))
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerFilter:
+    active: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    name_prefix: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return all(getattr(self, f) is None for f in self.__slots__)
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[Union[PageCursor, ChangeCursor]] = None
+    total_estimate: Optional[int] = None
@@ -0,0 +1,350 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+from app.domain.entities.customer import Customer
+from app.domain.ports.customer_change_listener import CustomerChange
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+CUSTOMER_CACHE_ENABLED = os.getenv("CUSTOMER_CACHE_ENABLED", "false").lower() == "true"
+CUSTOMER_CACHE_BACKEND = os.getenv("CUSTOMER_CACHE_BACKEND", "memory")
+CUSTOMER_CACHE_MAXSIZE = int(os.getenv("CUSTOMER_CACHE_MAXSIZE", "10000"))
+CUSTOMER_CACHE_TTL_SECONDS = float(os.getenv("CUSTOMER_CACHE_TTL_SECONDS", "60"))
+# misses vivem pouco: um cadastro novo aparece no máximo após este prazo
+CUSTOMER_CACHE_NEGATIVE_TTL_SECONDS = float(
+    os.getenv("CUSTOMER_CACHE_NEGATIVE_TTL_SECONDS", "5")
+)
+CUSTOMER_CACHE_REDIS_URL = os.getenv(
+    "CUSTOMER_CACHE_REDIS_URL", "redis://localhost:6379/0"
+)
+
+# marcador de "não existe" (cache negativo); vai ao Redis como string JSON
+MISS = "__customer_cache_miss__"
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[Any]: ...
+    def set(self, key: str, value: Any, ttl: float) -> None: ...
+    def delete(self, *keys: str) -> None: ...
+    def clear(self) -> None: ...
+    def drop_local_state(self) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class InMemoryCacheBackend:
+    """LRU com TTL por entrada, neste processo."""
+
+    def __init__(self, maxsize: int = CUSTOMER_CACHE_MAXSIZE, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.evictions = self.expirations = 0
+
+    def drop_local_state(self) -> None:
+        # reconexão: só as entradas; as métricas continuam valendo
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _encode_value(value: Any) -> bytes:
+    """
+    JSON com campos explícitos; nada de pickle, que executaria código vindo
+    da rede no ``loads``. ``password_hash`` vai junto porque o login lê o
+    cliente do cache.
+    """
+    if isinstance(value, Customer):
+        value = {
+            "id": value.id,
+            "name": value.name,
+            "cpf": value.cpf.value,
+            "email": value.email.value,
+            "password_hash": value.password_hash,
+            "active": value.active,
+            "token_version": value.token_version,
+            "created_at": _isoformat(value.created_at),
+            "updated_at": _isoformat(value.updated_at),
+        }
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _decode_value(raw: bytes) -> Any:
+    value = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if not isinstance(value, dict):
+        return value  # id (ponteiro cpf/email) ou MISS
+    return Customer(
+        id=value["id"],
+        name=value["name"],
+        # validados antes de gravar; revalidar custaria a cada hit
+        cpf=CPF.trusted(value["cpf"]),
+        email=Email.trusted(value["email"]),
+        password_hash=value["password_hash"],
+        active=value["active"],
+        token_version=value["token_version"],
+        created_at=_parse_datetime(value["created_at"]),
+        updated_at=_parse_datetime(value["updated_at"]),
+    )
+
+
+class RedisCacheBackend:
+    """
+    Qualquer servidor que fale o protocolo Redis (Redis, Valkey, KeyDB...).
+    TTL e evicção (``maxmemory-policy allkeys-lru``) ficam com o servidor.
+    Valores em JSON (``_encode_value``/``_decode_value``).
+    """
+
+    def __init__(self, client, prefix: str = "customer:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str = CUSTOMER_CACHE_REDIS_URL) -> "RedisCacheBackend":
+        import redis  # opcional: só exigido com CUSTOMER_CACHE_BACKEND=redis
+
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return _decode_value(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(
+            self.prefix + key, _encode_value(value), px=max(1, int(ttl * 1000))
+        )
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def drop_local_state(self) -> None:
+        # chaves compartilhadas: quem altera o cliente as invalida e os outros
+        # workers seguem ouvindo; o TTL curto cobre o que escapar
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        info = self.client.info("stats")
+        return {"backend": "redis", "evictions": info.get("evicted_keys")}
+
+
+def build_backend(name: str = CUSTOMER_CACHE_BACKEND) -> CacheBackend:
+    if name == "redis":
+        return RedisCacheBackend.from_url()
+    if name == "memory":
+        return InMemoryCacheBackend()
+    raise ValueError(f"Backend de cache desconhecido: {name}")
+
+
+class CustomerCache:
+    """
+    Entradas do ``CachingCustomerRepository``:
+
+    - ``id:<id>`` guarda o ``Customer``;
+    - ``cpf:<dígitos>`` e ``email:<e-mail>`` guardam apenas o id (conferido na
+      leitura, então um ponteiro antigo vira miss em vez de resposta errada);
+    - ``MISS`` em qualquer chave = "não existe" (cache negativo).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float = CUSTOMER_CACHE_TTL_SECONDS,
+        negative_ttl: float = CUSTOMER_CACHE_NEGATIVE_TTL_SECONDS,
+        enabled: bool = CUSTOMER_CACHE_ENABLED,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # ---------- chaves ----------
+    @staticmethod
+    def id_key(customer_id: int) -> str:
+        return f"id:{customer_id}"
+
+    @staticmethod
+    def cpf_key(cpf: str) -> str:
+        return f"cpf:{cpf}"
+
+    @staticmethod
+    def email_key(email: str) -> str:
+        return f"email:{email}"
+
+    def keys_for(self, customer: Customer) -> Tuple[str, str, str]:
+        return (
+            self.id_key(customer.id),
+            self.cpf_key(customer.cpf.value),
+            self.email_key(customer.email.value),
+        )
+
+    # ---------- leitura ----------
+    def _count(self, value: Any) -> Any:
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            elif value == MISS:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _resolve(self, key: str, matches: Callable[[Customer], bool]) -> Any:
+        value = self.backend.get(key)
+        if isinstance(value, int):
+            # ponteiro cpf/email -> id, conferido contra o cliente guardado
+            customer = self.backend.get(self.id_key(value))
+            value = (
+                customer
+                if isinstance(customer, Customer) and matches(customer)
+                else None
+            )
+        if isinstance(value, Customer):
+            # quem chamou pode alterar o objeto; o cacheado fica intacto
+            value = replace(value)
+        return self._count(value)
+
+    def find_by_id(self, customer_id: int) -> Any:
+        """``Customer``, ``MISS`` (sabidamente não existe) ou ``None`` (consultar)."""
+        return self._resolve(self.id_key(customer_id), lambda _: True)
+
+    def find_by_cpf(self, cpf: str) -> Any:
+        return self._resolve(self.cpf_key(cpf), lambda c: c.cpf.value == cpf)
+
+    def find_by_email(self, email: str) -> Any:
+        return self._resolve(self.email_key(email), lambda c: c.email.value == email)
+
+    # ---------- escrita ----------
+    def put(self, customer: Customer) -> None:
+        id_key, cpf_key, email_key = self.keys_for(customer)
+        self.backend.set(id_key, replace(customer), self.ttl)
+        self.backend.set(cpf_key, customer.id, self.ttl)
+        self.backend.set(email_key, customer.id, self.ttl)
+
+    def put_missing(self, key: str) -> None:
+        self.backend.set(key, MISS, self.negative_ttl)
+
+    def invalidate(self, *keys: str) -> None:
+        self.backend.delete(*keys)
+        with self._lock:
+            self.invalidations += 1
+
+    # ---------- listeners ----------
+    def customer_changed(self, customer: Customer) -> None:
+        self.invalidate(*self.keys_for(customer))
+
+    def customer_change_notified(self, change: CustomerChange) -> None:
+        keys = {
+            self.id_key(change.id),
+            self.cpf_key(change.cpf),
+            self.email_key(change.email),
+        }
+        if change.old_cpf:
+            keys.add(self.cpf_key(change.old_cpf))
+        if change.old_email:
+            keys.add(self.email_key(change.old_email))
+        self.invalidate(*keys)
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera as métricas (``drop_local_state`` não zera)."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.negative_hits = self.misses = self.invalidations = 0
+
+    def drop_local_state(self) -> None:
+        self.backend.drop_local_state()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            stats = {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl,
+                "negative_ttl_seconds": self.negative_ttl,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4)
+                if lookups
+                else 0.0,
+            }
+        stats.update(self.backend.stats())
+        return stats
+
+
+customer_cache = CustomerCache(
+    build_backend() if CUSTOMER_CACHE_ENABLED else InMemoryCacheBackend()
+)
@@ -0,0 +1,80 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+
+from app.domain.ports.customer_change_listener import (
+    CustomerChange,
+    CustomerChangeSubscriber,
+)
+from app.shared.handles.customer_cache import customer_cache
+from app.shared.handles.token_cache import token_cache
+from app.shared.handles.token_revocation import token_revocations
+
+# true = cada worker escuta o canal do Postgres (ver migração do trigger)
+CUSTOMER_CHANGES_LISTEN = (
+    os.getenv("CUSTOMER_CHANGES_LISTEN", "false").lower() == "true"
+)
+CUSTOMER_CHANGES_CHANNEL = "customer_changes"
+
+logger = logging.getLogger(__name__)
+
+
+def parse_change(payload: str) -> CustomerChange:
+    data = json.loads(payload)
+    return CustomerChange(
+        op=data["op"],
+        id=int(data["id"]),
+        cpf=data["cpf"],
+        email=data["email"],
+        active=bool(data["active"]),
+        token_version=int(data["token_version"]),
+        old_cpf=data.get("old_cpf"),
+        old_email=data.get("old_email"),
+    )
+
+
+class CustomerChangeHub:
+    """
+    Distribui as alterações de clientes feitas por *outros* processos para o
+    estado local deste worker (caches e mapa de revogação).
+    """
+
+    def __init__(self, subscribers: List[CustomerChangeSubscriber] = ()):
+        self.subscribers = list(subscribers)
+        self._lock = threading.Lock()
+        self.received = 0
+        self.invalid = 0
+        self.resyncs = 0
+
+    def publish(self, payload: str) -> None:
+        try:
+            change = parse_change(payload)
+        except (ValueError, KeyError, TypeError):
+            with self._lock:
+                self.invalid += 1
+            logger.warning("Notificação de cliente inválida: %.200s", payload)
+            return
+        with self._lock:
+            self.received += 1
+        for subscriber in self.subscribers:
+            subscriber.customer_change_notified(change)
+
+    def resync(self) -> None:
+        """Chamado ao (re)conectar: o que chegou enquanto offline se perdeu."""
+        with self._lock:
+            self.resyncs += 1
+        for subscriber in self.subscribers:
+            subscriber.drop_local_state()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "received": self.received,
+                "invalid": self.invalid,
+                "resyncs": self.resyncs,
+            }
+
+
+customer_changes = CustomerChangeHub([token_cache, token_revocations, customer_cache])
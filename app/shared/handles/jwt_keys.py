@@ -0,0 +1,129 @@
+import base64
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import jwt
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "EdDSA"}
+JWKS_MAX_AGE_SECONDS = int(os.getenv("JWKS_MAX_AGE_SECONDS", "300"))
+
+
+def _key_id(public_key) -> str:
+    """kid estável derivado da chave pública (SHA-256 do DER, base64url)."""
+    from cryptography.hazmat.primitives import serialization
+
+    der = public_key.public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    digest = hashlib.sha256(der).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+class KeyRing:
+    """
+    Chaves usadas para assinar/validar os JWTs.
+
+    - HS*: um único segredo compartilhado, nada é publicado no JWKS.
+    - RS*/ES*/EdDSA: assina com a chave privada atual e aceita também as chaves
+      públicas aposentadas (rotação), todas publicadas em ``/.well-known/jwks.json``.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: Optional[str] = None,
+        private_key=None,
+        kid: Optional[str] = None,
+        retired_public_keys: Optional[Dict[str, Any]] = None,
+    ):
+        self.algorithm = algorithm
+        self.asymmetric = algorithm in ASYMMETRIC_ALGORITHMS
+        self._secret = secret
+        self._private_key = private_key
+        self._public_keys: Dict[str, Any] = {}
+
+        if self.asymmetric:
+            if private_key is None:
+                raise ValueError(f"{algorithm} exige JWT_PRIVATE_KEY")
+            public_key = private_key.public_key()
+            self.kid = kid or _key_id(public_key)
+            self._public_keys[self.kid] = public_key
+            for old_kid, key in (retired_public_keys or {}).items():
+                self._public_keys.setdefault(old_kid, key)
+        else:
+            self.kid = None
+
+    # ---------- assinatura ----------
+    @property
+    def signing_key(self):
+        return self._private_key if self.asymmetric else self._secret
+
+    @property
+    def headers(self) -> Optional[dict]:
+        return {"kid": self.kid} if self.kid else None
+
+    # ---------- validação ----------
+    def verification_key(self, kid: Optional[str]):
+        if not self.asymmetric:
+            return self._secret
+        if kid is None:
+            return self._public_keys.get(self.kid)
+        return self._public_keys.get(kid)
+
+    # ---------- publicação ----------
+    def jwks(self) -> dict:
+        if not self.asymmetric:
+            return {"keys": []}
+        algo = jwt.get_algorithm_by_name(self.algorithm)
+        keys = []
+        for kid, public_key in self._public_keys.items():
+            jwk = algo.to_jwk(public_key, as_dict=True)
+            jwk.update({"kid": kid, "alg": self.algorithm, "use": "sig"})
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+def _load_private_key(pem: bytes):
+    from cryptography.hazmat.primitives import serialization
+
+    password = os.getenv("JWT_PRIVATE_KEY_PASSWORD")
+    return serialization.load_pem_private_key(
+        pem, password=password.encode() if password else None
+    )
+
+
+def _load_retired_public_keys(directory: Optional[str]) -> Dict[str, Any]:
+    """Lê ``<kid>.pem`` do diretório de chaves aposentadas."""
+    if not directory:
+        return {}
+    from cryptography.hazmat.primitives import serialization
+
+    keys = {}
+    for path in sorted(Path(directory).glob("*.pem")):
+        keys[path.stem] = serialization.load_pem_public_key(path.read_bytes())
+    return keys
+
+
+def keyring_from_env() -> KeyRing:
+    algorithm = os.getenv("ALGORITHM", "HS256")
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        return KeyRing(algorithm, secret=os.getenv("SECRET_KEY", "your_secret_key"))
+
+    pem = os.getenv("JWT_PRIVATE_KEY")
+    path = os.getenv("JWT_PRIVATE_KEY_PATH")
+    if not pem and path:
+        pem = Path(path).read_text()
+    return KeyRing(
+        algorithm,
+        private_key=_load_private_key(pem.encode()) if pem else None,
+        kid=os.getenv("JWT_KEY_ID"),
+        retired_public_keys=_load_retired_public_keys(
+            os.getenv("JWT_RETIRED_KEYS_DIR")
+        ),
+    )
@@ -5,15 +5,17 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dotenv import load_dotenv
 from jwt import ExpiredSignatureError, InvalidTokenError
-from passlib.context import CryptContext
+
+from app.domain.ports.password_hasher import PasswordHasher
+from app.shared.handles.jwt_keys import keyring_from_env
 
 load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "your_secret_key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
 
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+keyring = keyring_from_env()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -23,17 +25,24 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(
+        to_encode,
+        keyring.signing_key,
+        algorithm=keyring.algorithm,
+        headers=keyring.headers,
+    )
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifica se a senha está correta."""
-    return pwd_context.verify(plain_password, hashed_password)
+def verify_password(
+    plain_password: str, hashed_password: str, hasher: PasswordHasher
+) -> bool:
+    """Verifica se a senha está correta com o hasher injetado (o mesmo do serviço)."""
+    return hasher.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    """Gera o hash da senha."""
-    return pwd_context.hash(password)
+def get_password_hash(password: str, hasher: PasswordHasher) -> str:
+    """Gera o hash da senha com o hasher injetado (o mesmo do serviço)."""
+    return hasher.hash(password)
 
 
 def verify_jwt(token: str) -> dict:
@@ -42,7 +51,11 @@ def verify_jwt(token: str) -> dict:
     Retorna o payload se válido; caso contrário, lança uma exceção.
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = keyring.verification_key(kid)
+        if key is None:
+            raise InvalidTokenError("kid desconhecido")
+        payload = jwt.decode(token, key, algorithms=[keyring.algorithm])
         return payload
     except ExpiredSignatureError:
         raise ValueError("Token expirado")
@@ -0,0 +1,253 @@
+import hashlib
+import ipaddress
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+LOGIN_THROTTLE_ENABLED = os.getenv("LOGIN_THROTTLE_ENABLED", "true").lower() == "true"
+LOGIN_THROTTLE_BACKEND = os.getenv("LOGIN_THROTTLE_BACKEND", "memory")
+LOGIN_THROTTLE_ID_CAPACITY = float(os.getenv("LOGIN_THROTTLE_ID_CAPACITY", "10"))
+LOGIN_THROTTLE_ID_PER_MINUTE = float(os.getenv("LOGIN_THROTTLE_ID_PER_MINUTE", "5"))
+LOGIN_THROTTLE_IP_CAPACITY = float(os.getenv("LOGIN_THROTTLE_IP_CAPACITY", "50"))
+LOGIN_THROTTLE_IP_PER_MINUTE = float(os.getenv("LOGIN_THROTTLE_IP_PER_MINUTE", "60"))
+LOGIN_THROTTLE_MAX_KEYS = int(os.getenv("LOGIN_THROTTLE_MAX_KEYS", "100000"))
+# Balde parado há mais que isso já encheu e pode sair da tabela; precisa passar
+# do tempo de recarga do balde mais lento (capacity / taxa).
+LOGIN_THROTTLE_BUCKET_TTL_SECONDS = float(
+    os.getenv("LOGIN_THROTTLE_BUCKET_TTL_SECONDS", "3600")
+)
+LOGIN_THROTTLE_PRUNE_EVERY = int(os.getenv("LOGIN_THROTTLE_PRUNE_EVERY", "1000"))
+# Proxies (IPs ou redes CIDR, separados por vírgula) cujo X-Forwarded-For é
+# confiável. Vazio: vale o IP da conexão.
+TRUSTED_PROXIES = os.getenv("TRUSTED_PROXIES", "")
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_networks(value: str) -> Tuple[Network, ...]:
+    return tuple(
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    )
+
+
+def _is_trusted(address: str, trusted: Tuple[Network, ...]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def resolve_client_ip(
+    peer: str,
+    forwarded_for: Optional[str],
+    trusted: Tuple[Network, ...],
+) -> str:
+    """
+    IP do cliente para o balde por origem.
+
+    Só lê ``X-Forwarded-For`` quando a conexão vem de um proxy confiável, e
+    percorre a lista da direita para a esquerda até o primeiro endereço que
+    não é proxy: o que vem antes disso o próprio cliente pode forjar.
+    """
+    if not forwarded_for or not _is_trusted(peer, trusted):
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted):
+            return hop
+    return hops[0] if hops else peer
+
+
+trusted_proxies = parse_networks(TRUSTED_PROXIES)
+
+
+def refill(
+    tokens: float, refilled_at: float, now: float, capacity: float, rate: float
+) -> float:
+    """Tokens disponíveis em ``now`` (balde enche ``rate`` tokens/s até ``capacity``)."""
+    return min(capacity, tokens + max(0.0, now - refilled_at) * rate)
+
+
+def _wait(tokens: float, rate: float) -> float:
+    """Segundos até o balde ter um token inteiro (0 se já tem)."""
+    if tokens >= 1:
+        return 0.0
+    return (1 - tokens) / rate if rate > 0 else float("inf")
+
+
+BucketState = Tuple[float, float]
+# (chave, capacity, rate) de cada balde cobrado numa tentativa
+BucketRequest = Tuple[str, float, float]
+
+
+def take_tokens(
+    states: Sequence[Optional[BucketState]],
+    now: float,
+    limits: Sequence[Tuple[float, float]],
+) -> Tuple[List[BucketState], List[float]]:
+    """
+    Consome um token de cada balde, tudo ou nada: se algum balde está vazio,
+    nenhum é cobrado. Devolve os novos estados ``(tokens, refilled_at)`` e o
+    ``retry_after`` de cada balde (0 = esse balde tinha token).
+    """
+    tokens = [
+        capacity if state is None else refill(*state, now, capacity, rate)
+        for state, (capacity, rate) in zip(states, limits)
+    ]
+    waits = [_wait(available, rate) for available, (_, rate) in zip(tokens, limits)]
+    spent = 0 if any(waits) else 1
+    return [(available - spent, now) for available in tokens], waits
+
+
+def take_token(
+    state: Optional[BucketState], now: float, capacity: float, rate: float
+) -> Tuple[BucketState, float]:
+    """
+    Consome um token. Devolve o novo estado ``(tokens, refilled_at)`` e o
+    ``retry_after`` em segundos (0 = permitido).
+    """
+    states, waits = take_tokens([state], now, [(capacity, rate)])
+    return states[0], waits[0]
+
+
+class BucketStore(Protocol):
+    def take(self, key: str, capacity: float, rate: float) -> float: ...
+
+    def take_many(self, requests: Sequence[BucketRequest]) -> List[float]: ...
+
+
+class InMemoryBucketStore:
+    """Baldes por chave neste processo, com limite de chaves (LRU)."""
+
+    def __init__(
+        self,
+        max_keys: int = LOGIN_THROTTLE_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, rate: float) -> float:
+        return self.take_many([(key, capacity, rate)])[0]
+
+    def take_many(self, requests: Sequence[BucketRequest]) -> List[float]:
+        with self._lock:
+            keys = [key for key, _, _ in requests]
+            states, waits = take_tokens(
+                [self._buckets.get(key) for key in keys],
+                self.clock(),
+                [(capacity, rate) for _, capacity, rate in requests],
+            )
+            for key, state in zip(keys, states):
+                self._buckets[key] = state
+                self._buckets.move_to_end(key)
+            # descartar o balde mais antigo equivale a devolvê-lo cheio
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return waits
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class LoginThrottle:
+    """
+    Token bucket por identificador (CPF/e-mail) e por IP de origem.
+
+    Roda antes do hasher: cada tentativa rejeitada aqui é um bcrypt a menos.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        id_capacity: float = LOGIN_THROTTLE_ID_CAPACITY,
+        id_per_minute: float = LOGIN_THROTTLE_ID_PER_MINUTE,
+        ip_capacity: float = LOGIN_THROTTLE_IP_CAPACITY,
+        ip_per_minute: float = LOGIN_THROTTLE_IP_PER_MINUTE,
+        enabled: bool = LOGIN_THROTTLE_ENABLED,
+    ):
+        self.store = store
+        self.id_limit = (id_capacity, id_per_minute / 60)
+        self.ip_limit = (ip_capacity, ip_per_minute / 60)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected_identifier = 0
+        self.rejected_ip = 0
+
+    @staticmethod
+    def _key(kind: str, value: str) -> str:
+        normalized = value.strip().lower()
+        if kind == "id" and "@" not in normalized:
+            normalized = "".join(ch for ch in normalized if ch.isdigit()) or normalized
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+        return f"{kind}:{digest}"
+
+    def check(
+        self, identifier: str, client_ip: str, store: Optional[BucketStore] = None
+    ) -> float:
+        """``0`` se a tentativa pode seguir; senão, segundos até a próxima."""
+        if not self.enabled:
+            return 0.0
+        store = store or self.store
+
+        # os dois baldes são cobrados juntos: rejeitada pelo IP, a tentativa
+        # não gasta o balde do identificador (e vice-versa)
+        id_wait, ip_wait = store.take_many(
+            [
+                (self._key("id", identifier), *self.id_limit),
+                (self._key("ip", client_ip or "-"), *self.ip_limit),
+            ]
+        )
+        with self._lock:
+            if id_wait:
+                self.rejected_identifier += 1
+            elif ip_wait:
+                self.rejected_ip += 1
+            else:
+                self.allowed += 1
+        return max(id_wait, ip_wait)
+
+    def reset(self) -> None:
+        if hasattr(self.store, "clear"):
+            self.store.clear()
+        with self._lock:
+            self.allowed = self.rejected_identifier = self.rejected_ip = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "backend": LOGIN_THROTTLE_BACKEND,
+                "allowed": self.allowed,
+                "rejected": self.rejected_identifier + self.rejected_ip,
+                "rejected_identifier": self.rejected_identifier,
+                "rejected_ip": self.rejected_ip,
+                "tracked_keys": len(self.store)
+                if hasattr(self.store, "__len__")
+                else None,
+            }
+
+
+login_throttle = LoginThrottle(InMemoryBucketStore())
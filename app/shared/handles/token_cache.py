@@ -0,0 +1,114 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+from app.domain.entities.customer import Customer
+from app.domain.ports.customer_change_listener import CustomerChange
+
+TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+
+
+class TokenVerificationCache:
+    """
+    Cache LRU em memória para tokens já verificados.
+
+    A chave é o SHA-256 do token (o token em si não fica guardado) e o TTL de
+    cada entrada é limitado pelo ``exp`` do próprio JWT.
+    """
+
+    def __init__(
+        self, maxsize: int = TOKEN_CACHE_MAXSIZE, ttl: int = TOKEN_CACHE_TTL_SECONDS
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # digest -> (expira_em, customer_id, resultado)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._by_customer: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- helpers ----------
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _drop(self, key: str) -> None:
+        _, customer_id, _ = self._entries.pop(key)
+        keys = self._by_customer.get(customer_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_customer[customer_id]
+
+    # ---------- API ----------
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[2])
+
+    def put(self, token: str, exp: Optional[float], result: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        key = self._digest(token)
+        customer_id = result["id"]
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires_at, customer_id, dict(result))
+            self._by_customer.setdefault(customer_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_customer(self, customer_id: int) -> None:
+        """Remove todos os tokens já verificados de um cliente."""
+        with self._lock:
+            for key in list(self._by_customer.get(customer_id, ())):
+                self._drop(key)
+
+    def customer_changed(self, customer: Customer) -> None:
+        self.invalidate_customer(customer.id)
+
+    def customer_change_notified(self, change: CustomerChange) -> None:
+        self.invalidate_customer(change.id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_customer.clear()
+
+    def drop_local_state(self) -> None:
+        self.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+token_cache = TokenVerificationCache()
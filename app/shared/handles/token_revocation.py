@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from app.domain.entities.customer import Customer
+from app.domain.ports.customer_change_listener import CustomerChange
+
+TOKEN_REVOCATION_REFRESH_SECONDS = float(
+    os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "5")
+)
+# Margem para pegar linhas cujo updated_at ficou "no passado" (transações longas)
+TOKEN_REVOCATION_OVERLAP_SECONDS = float(
+    os.getenv("TOKEN_REVOCATION_OVERLAP_SECONDS", "30")
+)
+
+Row = Tuple[int, int, bool, Optional[datetime]]
+Loader = Callable[[Optional[datetime]], Iterable[Row]]
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite devolve sem fuso; o banco grava em UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class TokenRevocationMap:
+    """
+    Mapa compacto ``customer_id -> (token_version, active)``.
+
+    Só guarda clientes que já tiveram tokens revogados ou estão inativos; os
+    demais valem ``(0, True)``. É recarregado de forma incremental pelo
+    ``updated_at`` a cada ``refresh_seconds``, e atualizado na hora quando
+    este worker altera um cliente (``customer_changed``).
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float = TOKEN_REVOCATION_REFRESH_SECONDS,
+        overlap_seconds: float = TOKEN_REVOCATION_OVERLAP_SECONDS,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self._versions: Dict[int, Tuple[int, bool]] = {}
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.refreshes = 0
+        self.claims_hits = 0
+
+    # ---------- carga ----------
+    def _apply(self, customer_id: int, version: int, active: bool) -> None:
+        if version == 0 and active:
+            self._versions.pop(customer_id, None)
+        else:
+            self._versions[customer_id] = (version, active)
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self.refresh_seconds
+        )
+
+    def refresh_if_stale(self, loader: Loader) -> None:
+        if self.is_fresh:
+            return
+        since = self._watermark - self.overlap if self._watermark else None
+        # a marca avança a cada carga, mesmo vazia; senão a carga completa
+        # (sem índice para o filtro) se repetiria até a primeira revogação
+        watermark = datetime.now(timezone.utc)
+        rows = list(loader(since))
+        with self._lock:
+            for customer_id, version, active, updated_at in rows:
+                self._apply(customer_id, version, active)
+                if updated_at:
+                    # relógio do banco adiantado: não deixa a marca voltar
+                    watermark = max(watermark, _utc(updated_at))
+            self._watermark = watermark
+            self._refreshed_at = time.monotonic()
+            self.refreshes += 1
+
+    # ---------- consulta ----------
+    def lookup(self, customer_id: int) -> Tuple[int, bool]:
+        with self._lock:
+            return self._versions.get(customer_id, (0, True))
+
+    def record_claims_hit(self) -> None:
+        with self._lock:
+            self.claims_hits += 1
+
+    # ---------- listeners ----------
+    def customer_changed(self, customer: Customer) -> None:
+        with self._lock:
+            self._apply(customer.id, customer.token_version, customer.active)
+
+    def customer_change_notified(self, change: CustomerChange) -> None:
+        # cliente removido: tokens dele não valem mais
+        active = change.active and change.op != "DELETE"
+        with self._lock:
+            self._apply(change.id, change.token_version, active)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+            self._watermark = None
+            self._refreshed_at = None
+
+    def drop_local_state(self) -> None:
+        # o banco é a fonte: a próxima consulta recarrega desde a marca d'água,
+        # o que cobre as notificações perdidas sem refazer a carga completa
+        with self._lock:
+            self._refreshed_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._versions),
+                "refreshes": self.refreshes,
+                "claims_hits": self.claims_hits,
+                "watermark": self._watermark.isoformat() if self._watermark else None,
+            }
+
+
+token_revocations = TokenRevocationMap()
@@ -0,0 +1,85 @@
+"""
+Custo por linha para hidratar ``Customer`` a partir do banco.
+
+    python -m benchmarks.bench_hydration --rows 50000
+
+Compara a construção validando (``CPF(...)``/``Email(...)``, como antes) com
+``CPF.trusted``/``Email.trusted`` usados por ``CustomerRepository._to_domain``.
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.domain.entities.customer import Customer
+from app.domain.value_objects.cpf import CPF, _calc_digit
+from app.domain.value_objects.email import Email
+
+
+def _rows(count: int, distinct: int):
+    now = datetime.now()
+    rng = random.Random(42)
+    pool = []
+    for i in range(distinct):
+        base = f"{rng.randrange(10**8, 10**9):09d}"
+        digits = base + _calc_digit(base)
+        digits += _calc_digit(digits)
+        pool.append(
+            SimpleNamespace(
+                id=i,
+                name=f"Cliente {i}",
+                cpf=digits,
+                email=f"cliente{i}@mail.com",
+                active=True,
+                token_version=0,
+                created_at=now,
+                updated_at=now,
+                password_hash="x",
+            )
+        )
+    return [pool[i % distinct] for i in range(count)]
+
+
+def _validating_to_domain(model) -> Customer:
+    return Customer(
+        id=model.id,
+        name=model.name,
+        cpf=CPF(model.cpf),
+        email=Email(model.email),
+        active=model.active,
+        token_version=model.token_version,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        password_hash=model.password_hash,
+    )
+
+
+def _per_row_us(fn, rows, repeat: int) -> float:
+    best = min(timeit.repeat(lambda: [fn(r) for r in rows], number=1, repeat=repeat))
+    return best / len(rows) * 1e6
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        ("linhas distintas (export)", args.rows),
+        ("mesmos 100 clientes (leituras repetidas)", 100),
+    ]
+    for label, distinct in scenarios:
+        rows = _rows(args.rows, min(distinct, args.rows))
+        before = _per_row_us(_validating_to_domain, rows, args.repeat)
+        after = _per_row_us(CustomerRepository._to_domain, rows, args.repeat)
+        print(f"{label}:")
+        print(f"  validando  {before:6.2f} µs/linha")
+        print(f"  trusted    {after:6.2f} µs/linha  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
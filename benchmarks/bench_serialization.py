@@ -0,0 +1,111 @@
+"""
+Serialização do corpo de ``GET /api/client`` (10k linhas por padrão).
+
+    python -m benchmarks.bench_serialization --rows 10000
+
+Compara o caminho antigo, em que cada linha vira ``CustomersOut`` e o
+FastAPI valida de novo contra ``List[CustomersOut]`` antes do ``json.dumps``,
+com ``fast_json`` (dicts direto do ``CustomerView``, sem ``response_model``),
+com e sem ``orjson``.
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.adapters.driver.controllers import fast_json
+from app.adapters.driver.controllers.schemas import CustomersOut
+from app.domain.entities.customer_view import CustomerView
+from app.domain.value_objects.cpf import _calc_digit
+
+
+def _views(count: int) -> List[CustomerView]:
+    now = datetime.now(timezone.utc)
+    views = []
+    for i in range(count):
+        base = f"{100000000 + i:09d}"
+        digits = base + _calc_digit(base)
+        digits += _calc_digit(digits)
+        views.append(
+            CustomerView(
+                id=i,
+                name=f"Cliente {i}",
+                cpf=digits,
+                email=f"cliente{i}@mail.com",
+                active=True,
+                token_version=0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return views
+
+
+_LIST_ADAPTER = TypeAdapter(List[CustomersOut])
+
+
+def _pydantic_body(views: List[CustomerView]) -> bytes:
+    # o que a rota fazia: modelo por linha + serialize_response do FastAPI
+    items = [
+        CustomersOut(
+            id=v.id,
+            name=v.name,
+            cpf=v.formatted_cpf,
+            email=v.email,
+            active=v.active,
+            created_at=v.created_at,
+            updated_at=v.updated_at,
+        )
+        for v in views
+    ]
+    validated = _LIST_ADAPTER.validate_python(items, from_attributes=True)
+    content = _LIST_ADAPTER.dump_python(validated, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def _fast_body(views: List[CustomerView]) -> bytes:
+    return fast_json.dumps([fast_json.customer_item(v) for v in views])
+
+
+def _best_ms(fn, views, repeat: int) -> float:
+    return min(timeit.repeat(lambda: fn(views), number=1, repeat=repeat)) * 1000
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    views = _views(args.rows)
+    assert json.loads(_pydantic_body(views)) == json.loads(_fast_body(views))
+
+    results = [
+        ("pydantic + response_model", _best_ms(_pydantic_body, views, args.repeat))
+    ]
+    if fast_json.orjson is not None:
+        results.append(("fast_json (orjson)", _best_ms(_fast_body, views, args.repeat)))
+    orjson, fast_json.orjson = fast_json.orjson, None
+    try:
+        results.append(("fast_json (json)", _best_ms(_fast_body, views, args.repeat)))
+    finally:
+        fast_json.orjson = orjson
+
+    baseline = results[0][1]
+    print(f"{args.rows} linhas:")
+    for label, ms in results:
+        rows_per_s = args.rows / (ms / 1000)
+        print(
+            f"  {label:27} {ms:8.2f} ms  {rows_per_s:10,.0f} linhas/s"
+            f"  ({baseline / ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,75 @@
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
+
+from app.shared.handles.pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
 
 DB_HOST = os.getenv("DB_HOST", "clientservice-db")
 DB_PORT = os.getenv("DB_PORT", "5432")
 DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "mysecretpassword")
 DB_NAME = os.getenv("DB_NAME", "client_service")
+# true = endpoints de clientes usam o engine asyncio (asyncpg)
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+# Pool por processo: some (pool_size + max_overflow) x workers x tasks e
+# compare com o max_connections do Postgres.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# PgBouncer em transaction pooling: sem pool local e sem prepared statements
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
 
 SQLALCHEMY_DATABASE_URL = (
     f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
+ASYNC_SQLALCHEMY_DATABASE_URL = (
+    f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
+
+
+def engine_options(asyncio: bool = False) -> dict:
+    """Argumentos de pool para ``create_engine``/``create_async_engine``."""
+    if DB_PGBOUNCER:
+        options = {"poolclass": NullPool, "pool_pre_ping": DB_POOL_PRE_PING}
+        if asyncio:
+            # asyncpg prepara statements por padrão; no PgBouncer isso quebra
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if asyncio else TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=False, pool_pre_ping=True)
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=False, **engine_options())
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
+
+async_engine = None
+_async_session_factory = None
+
+
+def get_async_session_factory():
+    """Cria o engine asyncio sob demanda (asyncpg só é exigido com DB_ASYNC)."""
+    global async_engine, _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_engine = create_async_engine(
+            ASYNC_SQLALCHEMY_DATABASE_URL, echo=False, **engine_options(asyncio=True)
+        )
+        _async_session_factory = async_sessionmaker(
+            bind=async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
@@ -1,16 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from app.adapters.driver.controllers.customer_controller import router as client_router
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer
 from app.adapters.driver.controllers.auth_controller import router as auth_router
+from app.adapters.driver.controllers.jwks_controller import router as jwks_router
+from app.adapters.driver.controllers.metrics_controller import router as metrics_router
+from app.adapters.driver.dependencies import (
+    change_listener,
+    outbox_relay,
+    password_hasher,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 bearer_scheme = HTTPBearer()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if change_listener is not None:
+        change_listener.start()
+    if outbox_relay is not None:
+        outbox_relay.start()
+    yield
+    if outbox_relay is not None:
+        outbox_relay.stop()
+    if change_listener is not None:
+        change_listener.stop()
+    if hasattr(password_hasher, "shutdown"):
+        password_hasher.shutdown()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="Client-Service")
+    app = FastAPI(title="Client-Service", lifespan=lifespan)
     app.include_router(client_router, prefix="/api/client", tags=["clients"])
     app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
+    app.include_router(jwks_router, tags=["auth"])
+    app.include_router(metrics_router, prefix="/api/metrics", tags=["metrics"])
     return app
 
 
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 
-from app.adapters.driven.models import customer_model
+from app.adapters.driven.models import customer_model, refresh_token_model  # noqa: F401
 # 1) Importa o seu Base e models, para o Alembic saber quais tabelas existem
 
 # 3) Obtemos a configuração do Alembic
@@ -0,0 +1,67 @@
+"""add customer change notify trigger
+
+Revision ID: 4c8d2b7e9f13
+Revises: e2f4a8c61d07
+Create Date: 2025-08-13 16:45:09.281734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c8d2b7e9f13"
+down_revision: Union[str, None] = "e2f4a8c61d07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_customer_change() RETURNS trigger AS $$
+DECLARE
+    payload json;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        payload := json_build_object(
+            'op', TG_OP, 'id', OLD.id, 'cpf', OLD.cpf, 'email', OLD.email,
+            'active', false, 'token_version', OLD.token_version
+        );
+    ELSIF TG_OP = 'UPDATE' THEN
+        payload := json_build_object(
+            'op', TG_OP, 'id', NEW.id, 'cpf', NEW.cpf, 'email', NEW.email,
+            'active', NEW.active, 'token_version', NEW.token_version,
+            'old_cpf', NULLIF(OLD.cpf, NEW.cpf),
+            'old_email', NULLIF(OLD.email, NEW.email)
+        );
+    ELSE
+        payload := json_build_object(
+            'op', TG_OP, 'id', NEW.id, 'cpf', NEW.cpf, 'email', NEW.email,
+            'active', NEW.active, 'token_version', NEW.token_version
+        );
+    END IF;
+    -- entregue só no commit; transação desfeita não notifica
+    PERFORM pg_notify('customer_changes', payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(NOTIFY_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER customers_notify_change "
+        "AFTER INSERT OR UPDATE OR DELETE ON customers "
+        "FOR EACH ROW EXECUTE FUNCTION notify_customer_change()"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP TRIGGER IF EXISTS customers_notify_change ON customers")
+    op.execute("DROP FUNCTION IF EXISTS notify_customer_change()")
@@ -0,0 +1,33 @@
+"""create login_throttle_buckets
+
+Revision ID: 7a9c2e4f1b36
+Revises: d51f08a6c2e9
+Create Date: 2025-08-08 09:21:55.104377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a9c2e4f1b36"
+down_revision: Union[str, None] = "d51f08a6c2e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_throttle_buckets",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("refilled_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("login_throttle_buckets")
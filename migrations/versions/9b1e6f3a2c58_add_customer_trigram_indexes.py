@@ -0,0 +1,50 @@
+"""add customer trigram indexes
+
+Revision ID: 9b1e6f3a2c58
+Revises: 4c8d2b7e9f13
+Create Date: 2025-08-15 10:21:44.602917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1e6f3a2c58"
+down_revision: Union[str, None] = "4c8d2b7e9f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GET /api/client/search: ILIKE '%trecho%' e similaridade de trigramas
+INDEXES = {
+    "ix_customers_name_trgm": "name",
+    "ix_customers_email_trgm": "email",
+}
+
+
+def upgrade() -> None:
+    # fora do PostgreSQL a busca cai no LIKE sem índice
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES.items():
+            op.create_index(
+                name,
+                "customers",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(name, "customers", postgresql_concurrently=True)
+    # a extensão fica: outros objetos do banco podem depender dela
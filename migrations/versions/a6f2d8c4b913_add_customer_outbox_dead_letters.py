@@ -0,0 +1,66 @@
+"""add customer outbox dead letters and available_at index
+
+Revision ID: a6f2d8c4b913
+Revises: e8a4b2f61c93
+Create Date: 2025-08-22 10:04:37.582914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6f2d8c4b913"
+down_revision: Union[str, None] = "e8a4b2f61c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "customer_outbox_dead_letters",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=False,
+            primary_key=True,
+        ),
+        sa.Column("event_type", sa.String(length=40), nullable=False),
+        sa.Column("customer_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "failed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customer_outbox_available_at_id",
+            "customer_outbox",
+            ["available_at", "id"],
+            postgresql_concurrently=postgres,
+        )
+
+
+def downgrade() -> None:
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_customer_outbox_available_at_id",
+            "customer_outbox",
+            postgresql_concurrently=postgres,
+        )
+    op.drop_table("customer_outbox_dead_letters")
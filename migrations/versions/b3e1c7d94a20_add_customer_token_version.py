@@ -0,0 +1,30 @@
+"""add customer token_version
+
+Revision ID: b3e1c7d94a20
+Revises: 6fd9a550ad05
+Create Date: 2025-08-04 10:12:41.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e1c7d94a20"
+down_revision: Union[str, None] = "6fd9a550ad05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "customers",
+        sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("customers", "token_version")
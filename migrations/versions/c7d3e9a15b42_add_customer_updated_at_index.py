@@ -0,0 +1,43 @@
+"""add customer updated_at index
+
+Revision ID: c7d3e9a15b42
+Revises: 9b1e6f3a2c58
+Create Date: 2025-08-18 09:12:03.447190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d3e9a15b42"
+down_revision: Union[str, None] = "9b1e6f3a2c58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customers_updated_at_id",
+            "customers",
+            ["updated_at", "id"],
+            postgresql_concurrently=postgres,
+        )
+
+
+def downgrade() -> None:
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_customers_updated_at_id",
+            "customers",
+            postgresql_concurrently=postgres,
+        )
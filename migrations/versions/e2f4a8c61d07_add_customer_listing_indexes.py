@@ -0,0 +1,58 @@
+"""add customer listing indexes
+
+Revision ID: e2f4a8c61d07
+Revises: 7a9c2e4f1b36
+Create Date: 2025-08-11 14:02:37.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f4a8c61d07"
+down_revision: Union[str, None] = "7a9c2e4f1b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY não bloqueia escrita em customers, mas não roda em transação
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customers_created_at_id",
+            "customers",
+            ["created_at", "id"],
+            postgresql_concurrently=postgres,
+        )
+        op.create_index(
+            "ix_customers_active_created_at_id",
+            "customers",
+            ["active", "created_at", "id"],
+            postgresql_concurrently=postgres,
+        )
+        op.create_index(
+            "ix_customers_lower_name",
+            "customers",
+            [sa.text("lower(name) text_pattern_ops" if postgres else "lower(name)")],
+            postgresql_concurrently=postgres,
+        )
+
+
+def downgrade() -> None:
+    postgres = _is_postgres()
+    with op.get_context().autocommit_block():
+        for name in (
+            "ix_customers_lower_name",
+            "ix_customers_active_created_at_id",
+            "ix_customers_created_at_id",
+        ):
+            op.drop_index(name, "customers", postgresql_concurrently=postgres)
@@ -1,6 +1,11 @@
+import json
+
 from fastapi.testclient import TestClient
 from main import app
 
+from app.adapters.driver.controllers import customer_controller
+from tests.unit.test_repository import _valid_cpf
+
 client = TestClient(app)
 
 
@@ -21,3 +26,225 @@ def test_post_customer_and_list():
     r = client.get("api/client")
     assert r.status_code == 200
     assert len(r.json()) == 1
+
+
+def test_list_paginates_with_cursor_headers():
+    for i, cpf in enumerate(["52998224725", "11144477735", "39053344705"]):
+        r = client.post(
+            "api/client",
+            json={
+                "name": f"Paginado {i}",
+                "cpf": cpf,
+                "email": f"paginado{i}@mail.com",
+                "password": "teste12345",
+            },
+        )
+        assert r.status_code == 201
+
+    r = client.get(
+        "api/client",
+        params={"name_prefix": "paginado", "limit": 2, "include_total": True},
+    )
+    assert r.status_code == 200
+    assert [c["name"] for c in r.json()] == ["Paginado 0", "Paginado 1"]
+    assert r.headers["X-Total-Count-Estimate"] == "3"
+    cursor = r.headers["X-Next-Cursor"]
+    assert f"cursor={cursor}" in r.headers["Link"]
+
+    r = client.get(
+        "api/client", params={"name_prefix": "paginado", "limit": 2, "cursor": cursor}
+    )
+    assert [c["name"] for c in r.json()] == ["Paginado 2"]
+    assert "X-Next-Cursor" not in r.headers
+    assert "X-Total-Count-Estimate" not in r.headers
+
+
+def test_list_rejects_invalid_cursor():
+    r = client.get("api/client", params={"cursor": "lixo"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Cursor inválido"
+
+
+def test_export_streams_ndjson_and_csv():
+    r = client.post(
+        "api/client",
+        json={
+            "name": "Exportado",
+            "cpf": "86288366757",
+            "email": "exportado@mail.com",
+            "password": "teste12345",
+        },
+    )
+    assert r.status_code == 201
+
+    r = client.get("api/client/export", params={"name_prefix": "export"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = r.text.splitlines()
+    assert len(lines) == 1
+    row = json.loads(lines[0])
+    assert row["cpf"] == "862.883.667-57"
+    assert "password_hash" not in row
+
+    r = client.get(
+        "api/client/export", params={"format": "csv", "name_prefix": "export"}
+    )
+    assert r.headers["content-disposition"] == 'attachment; filename="customers.csv"'
+    header, line = r.text.splitlines()
+    assert header == "id,name,cpf,email,active,created_at,updated_at"
+    assert ",Exportado,862.883.667-57,exportado@mail.com,True," in line
+
+
+def test_export_csv_neutralizes_formulas():
+    from app.adapters.driver.controllers.customer_export import (
+        csv_chunks,
+        ndjson_chunks,
+    )
+
+    row = (1, '=HYPERLINK("http://x")', "12345678909", "@a@mail.com", True, None, None)
+    _, body = list(csv_chunks([[row]]))
+    assert body.decode().startswith(
+        '1,"\'=HYPERLINK(""http://x"")",123.456.789-09,\'@a@mail.com,'
+    )
+    # NDJSON não vai para planilha: sai como gravado
+    (line,) = list(ndjson_chunks([[row]]))
+    assert json.loads(line)["name"] == '=HYPERLINK("http://x")'
+
+
+def test_batch_get_keeps_request_order_and_reports_misses():
+    ids = []
+    for name, cpf in [("Lote A", "52601815906"), ("Lote B", "08301661305")]:
+        r = client.post(
+            "api/client",
+            json={
+                "name": name,
+                "cpf": cpf,
+                "email": f"{cpf}@mail.com",
+                "password": "teste12345",
+            },
+        )
+        assert r.status_code == 201
+        ids.append(r.json()["id"])
+
+    r = client.post("api/client/batch-get", json={"ids": [ids[1], 999999, ids[0]]})
+    assert r.status_code == 200
+    assert [(i["key"], i["found"]) for i in r.json()] == [
+        (str(ids[1]), True),
+        ("999999", False),
+        (str(ids[0]), True),
+    ]
+    assert r.json()[0]["customer"]["name"] == "Lote B"
+    assert r.json()[1]["customer"] is None
+
+    r = client.post(
+        "api/client/batch-get",
+        json={"cpfs": ["526.018.159-06", "11111111111", "08301661305"]},
+    )
+    assert [i["customer"] and i["customer"]["name"] for i in r.json()] == [
+        "Lote A",
+        None,
+        "Lote B",
+    ]
+    assert r.json()[0]["key"] == "526.018.159-06"
+
+    assert client.post("api/client/batch-get", json={}).status_code == 422
+    r = client.post("api/client/batch-get", json={"ids": [1], "cpfs": ["11111111111"]})
+    assert r.status_code == 422
+
+
+def test_search_by_partial_name_or_email():
+    r = client.post(
+        "api/client",
+        json={
+            "name": "Buscável Silva",
+            "cpf": "34687126855",
+            "email": "buscavel@mail.com",
+            "password": "teste12345",
+        },
+    )
+    assert r.status_code == 201
+
+    r = client.get("api/client/search", params={"q": "vel sil"})
+    assert r.status_code == 200
+    assert [c["email"] for c in r.json()] == ["buscavel@mail.com"]
+    r = client.get("api/client/search", params={"q": "BUSCAVEL@"})
+    assert [c["name"] for c in r.json()] == ["Buscável Silva"]
+    assert client.get("api/client/search", params={"q": "x"}).status_code == 422
+
+
+def test_changes_feed_returns_cursor_and_tombstones(monkeypatch):
+    monkeypatch.setattr(customer_controller, "CHANGES_SAFETY_LAG_SECONDS", 0)
+    cpf = _valid_cpf(731904562)
+    r = client.post(
+        "api/client",
+        json={
+            "name": "Replicado",
+            "cpf": cpf,
+            "email": "replicado@mail.com",
+            "password": "teste12345",
+        },
+    )
+    customer_id = r.json()["id"]
+
+    items, since = [], None
+    while True:  # réplica vazia: percorre o feed desde o início
+        params = {"limit": 2, **({"since": since} if since else {})}
+        r = client.get("api/client/changes", params=params)
+        assert r.status_code == 200
+        items.extend(r.json())
+        since = r.headers["X-Next-Cursor"]
+        if r.headers["X-Has-More"] == "false":
+            break
+    (mine,) = [i for i in items if i["id"] == customer_id]
+    assert (mine["deleted"], mine["customer"]["name"]) == (False, "Replicado")
+
+    r = client.get("api/client/changes", params={"since": since})
+    assert (r.json(), r.headers["X-Next-Cursor"]) == ([], since)
+
+    assert client.delete(f"api/client/{cpf}").status_code == 204
+    r = client.get("api/client/changes", params={"limit": 1000})
+    (mine,) = [i for i in r.json() if i["id"] == customer_id]
+    assert (mine["deleted"], mine["customer"]) == (True, None)
+    assert client.get("api/client/changes", params={"since": "x"}).status_code == 400
+
+
+def test_conditional_get_returns_304_for_matching_etag():
+    r = client.post(
+        "api/client",
+        json={
+            "name": "Condicional",
+            "cpf": _valid_cpf(582016437),
+            "email": "condicional@mail.com",
+            "password": "teste12345",
+        },
+    )
+    customer_id = r.json()["id"]
+
+    r = client.get(f"api/client/{customer_id}")
+    etag = r.headers["ETag"]
+    assert r.headers["Cache-Control"] == "private, no-cache"
+
+    r = client.get(f"api/client/{customer_id}", headers={"If-None-Match": etag})
+    assert (r.status_code, r.content, r.headers["ETag"]) == (304, b"", etag)
+    r = client.get(
+        f"api/client/{customer_id}", headers={"If-None-Match": f'"x", W/{etag}'}
+    )
+    assert r.status_code == 304
+    r = client.get(f"api/client/{customer_id}", headers={"If-None-Match": '"x"'})
+    assert (r.status_code, r.json()["name"]) == (200, "Condicional")
+    r = client.get("api/client/999999", headers={"If-None-Match": etag})
+    assert r.status_code == 404
+
+    page = client.get("api/client", params={"name_prefix": "condicional"})
+    r = client.get(
+        "api/client",
+        params={"name_prefix": "condicional"},
+        headers={"If-None-Match": page.headers["ETag"]},
+    )
+    assert r.status_code == 304
+    r = client.get(
+        "api/client",
+        params={"name_prefix": "condicional", "active": False},
+        headers={"If-None-Match": page.headers["ETag"]},
+    )
+    assert r.status_code == 200
@@ -11,7 +11,13 @@ from sqlalchemy.pool import StaticPool
 
 from database import Base
 from app.adapters.driven.repositories.customer import CustomerRepository
-from app.adapters.driver.dependencies import get_db
+from app.adapters.driver.dependencies import get_db, get_session_factory
+from app.domain.entities.customer import Customer
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+from app.shared.handles.rate_limiter import login_throttle
+from app.shared.handles.token_cache import token_cache
+from app.shared.handles.token_revocation import token_revocations
 from main import app
 
 
@@ -37,11 +43,23 @@ def _override_app_db():
             db.close()
 
     app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSession
     yield
     app.dependency_overrides.clear()
     engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _clear_token_state():
+    token_cache.clear()
+    token_revocations.clear()
+    login_throttle.reset()
+    yield
+    token_cache.clear()
+    token_revocations.clear()
+    login_throttle.reset()
+
+
 # ------------------------------------------------------------------
 # 2) Fixtures p/ testes unitários (isolados por função)
 # ------------------------------------------------------------------
@@ -63,3 +81,19 @@ def in_memory_session():
 @pytest.fixture
 def fake_repo(in_memory_session):
     return CustomerRepository(in_memory_session)
+
+
+@pytest.fixture
+def new_customer():
+    """Fábrica de ``Customer`` ainda não gravado; e-mail derivado do nome."""
+
+    def _new(name="Ana", cpf="12345678909", email=None):
+        return Customer(
+            id=None,
+            name=name,
+            cpf=CPF(cpf),
+            email=Email(email or f"{name.lower()}@mail.com"),
+            password_hash="<PASSWORD>",
+        )
+
+    return _new
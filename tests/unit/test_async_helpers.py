@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+from app.domain.services._async import call, hash_password, verify_password
+
+
+class ThreadRecordingHasher:
+    def __init__(self):
+        self.threads = []
+
+    def hash(self, plain):
+        self.threads.append(threading.current_thread().name)
+        return "h:" + plain
+
+    def verify(self, plain, hashed):
+        self.threads.append(threading.current_thread().name)
+        return hashed == "h:" + plain
+
+
+def test_inline_hashing_uses_anyio_threadpool():
+    hasher = ThreadRecordingHasher()
+
+    async def run():
+        hashed = await hash_password(hasher, "segredo123")
+        return await verify_password(hasher, "segredo123", hashed)
+
+    assert asyncio.run(run()) is True
+    assert hasher.threads == ["AnyIO worker thread"] * 2
+
+
+def test_sync_repository_calls_use_anyio_threadpool():
+    async def native():
+        return threading.current_thread().name
+
+    def blocking(x):
+        return threading.current_thread().name, x
+
+    async def run():
+        return await call(blocking, 1), await call(native)
+
+    offloaded, inline = asyncio.run(run())
+    assert offloaded == ("AnyIO worker thread", 1)
+    assert inline == "MainThread"
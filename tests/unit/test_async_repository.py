@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.pool import NullPool
+
+from app.adapters.driven.models.customer_outbox_model import CustomerOutboxModel
+from app.adapters.driven.repositories.async_customer import AsyncCustomerRepository
+from app.adapters.driver.dependencies import get_customer_repository
+from app.domain.services.update_customer_service import UpdateCustomerService
+from app.domain.value_objects.page import CustomerFilter
+from database import Base
+from main import app
+
+asyncio_ext = pytest.importorskip("sqlalchemy.ext.asyncio")
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # arquivo + NullPool: cada event loop abre a sua própria conexão
+    engine = asyncio_ext.create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", poolclass=NullPool
+    )
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create())
+    yield asyncio_ext.async_sessionmaker(bind=engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+def test_crud_roundtrip(session_factory, new_customer):
+    async def run():
+        async with session_factory() as session:
+            repo = AsyncCustomerRepository(session, outbox=True)
+            created = await repo.create(new_customer())
+            assert (await repo.find_by_id(created.id)).name == "Ana"
+            assert (await repo.find_by_cpf("123.456.789-09")).id == created.id
+            assert (await repo.find_by_email("ana@mail.com")).id == created.id
+            assert await repo.find_by_email("x@mail.com") is None
+
+            created.name = "Ana Maria"
+            assert (await repo.update(created)).name == "Ana Maria"
+            await repo.update_password_hash(created.id, "novo")
+            assert (await repo.find_by_id(created.id)).password_hash == "novo"
+
+            await repo.create(new_customer("Bia", "52998224725"))
+            assert len(await repo.list_all()) == 2
+            assert len(await repo.find_many_by_cpfs(["52998224725"])) == 1
+
+            await repo.delete(created.id)
+            assert await repo.find_by_id(created.id) is None
+
+            events = await session.scalars(
+                select(CustomerOutboxModel.event_type).order_by(CustomerOutboxModel.id)
+            )
+            assert list(events) == [
+                "customer.created",
+                "customer.updated",
+                "customer.created",
+                "customer.deleted",
+            ]
+
+    asyncio.run(run())
+
+
+def test_update_service_async_path(session_factory, new_customer):
+    async def run():
+        async with session_factory() as session:
+            repo = AsyncCustomerRepository(session)
+            await repo.create(new_customer())
+            await repo.create(new_customer("Bia", "52998224725"))
+            service = UpdateCustomerService(repo)
+
+            with pytest.raises(ValueError, match="CPF já cadastrado."):
+                await service.execute_async("12345678909", {"cpf": "52998224725"})
+            updated = await service.execute_async("12345678909", {"active": False})
+            assert updated.active is False
+            assert updated.token_version == 1
+
+    asyncio.run(run())
+
+
+def test_endpoints_with_async_repository(session_factory):
+    async def _repo():
+        async with session_factory() as session:
+            yield AsyncCustomerRepository(session)
+
+    app.dependency_overrides[get_customer_repository] = _repo
+    try:
+        client = TestClient(app)
+        r = client.post(
+            "/api/client",
+            json={
+                "name": "Ana",
+                "cpf": "123.456.789-09",
+                "email": "ana@mail.com",
+                "password": "segredo123",
+            },
+        )
+        assert r.status_code == 201
+        user_id = r.json()["id"]
+
+        assert client.get(f"/api/client/{user_id}").json()["name"] == "Ana"
+        assert [c["id"] for c in client.get("/api/client").json()] == [user_id]
+        r = client.put("/api/client/12345678909", json={"name": "Ana Maria"})
+        assert r.json()["name"] == "Ana Maria"
+        assert client.delete("/api/client/12345678909").status_code == 204
+    finally:
+        del app.dependency_overrides[get_customer_repository]
+
+
+def test_list_page_and_estimate(session_factory, new_customer):
+    async def run():
+        async with session_factory() as session:
+            repo = AsyncCustomerRepository(session)
+            for name, cpf in [("Ana", "12345678909"), ("Bia", "52998224725")]:
+                await repo.create(new_customer(name, cpf))
+
+            first = await repo.list_page(CustomerFilter(), limit=1)
+            assert [c.name for c in first.items] == ["Ana"]
+            rest = await repo.list_page(CustomerFilter(), 1, first.next_cursor)
+            assert [c.name for c in rest.items] == ["Bia"]
+            assert rest.next_cursor is None
+            assert await repo.estimate_count(CustomerFilter(name_prefix="b")) == 1
+
+            view = await repo.get_view(first.items[0].id)
+            assert (view.cpf, view.formatted_cpf) == ("12345678909", "123.456.789-09")
+            assert (await repo.get_view_by_cpf("529.982.247-25")).name == "Bia"
+            views = await repo.find_views_by_cpfs(["12345678909", "52998224725"])
+            assert sorted(v.name for v in views) == ["Ana", "Bia"]
+
+    asyncio.run(run())
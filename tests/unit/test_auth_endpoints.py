@@ -37,9 +37,12 @@ def override_db():
         finally:
             db.close()
 
+    previous = dict(app.dependency_overrides)
     app.dependency_overrides[get_db] = _get_db
     yield
+    # restaura o override global do conftest
     app.dependency_overrides.clear()
+    app.dependency_overrides.update(previous)
     engine.dispose()
 
 
@@ -105,3 +108,225 @@ def test_verify_token_success():
     assert body["cpf"] == "123.456.789-09"
     assert body["email"] == "ana@mail.com"
     assert body["name"] == "Ana"
+
+
+def test_verify_token_cached_until_deactivation():
+    cr = client.post(
+        "/api/client",
+        json={
+            "name": "Bia",
+            "cpf": "529.982.247-25",
+            "email": "bia@mail.com",
+            "password": "<PASSWORD123>",
+        },
+    )
+    assert cr.status_code == 201
+    tok = create_access_token({"cpf": "52998224725"})
+    before = client.get("/api/metrics").json()["token_cache"]["hits"]
+
+    assert client.post("/api/auth", json={"token": tok}).status_code == 200
+    assert client.post("/api/auth", json={"token": tok}).status_code == 200
+    stats = client.get("/api/metrics").json()["token_cache"]
+    assert stats["hits"] == before + 1
+
+    # desativar invalida o cache
+    assert client.delete("/api/client/52998224725").status_code == 204
+    r = client.post("/api/auth", json={"token": tok})
+    assert r.status_code == 404
+
+
+def test_verify_batch_mixed_results():
+    for name, cpf, email in [
+        ("Ana", "123.456.789-09", "ana@mail.com"),
+        ("Bia", "529.982.247-25", "bia@mail.com"),
+    ]:
+        r = client.post(
+            "/api/client",
+            json={"name": name, "cpf": cpf, "email": email, "password": "segredo123"},
+        )
+        assert r.status_code == 201
+
+    tokens = [
+        create_access_token({"cpf": "12345678909"}),
+        "",
+        "not.a.jwt",
+        create_access_token({"cpf": "52998224725"}),
+        create_access_token({"cpf": "84835416023"}),
+    ]
+    r = client.post("/api/auth/batch", json={"tokens": tokens})
+    assert r.status_code == 200
+
+    body = r.json()
+    assert [item["ok"] for item in body] == [True, False, False, True, False]
+    assert body[0]["customer"]["email"] == "ana@mail.com"
+    assert body[1]["status_code"] == 400
+    assert body[2]["status_code"] == 401
+    assert body[3]["customer"]["cpf"] == "529.982.247-25"
+    assert body[4] == {
+        "ok": False,
+        "customer": None,
+        "status_code": 404,
+        "detail": "Cliente não encontrado ou inativo",
+    }
+
+
+def test_verify_batch_rejects_empty_list():
+    r = client.post("/api/auth/batch", json={"tokens": []})
+    assert r.status_code == 422
+
+
+def _login(identifier, password):
+    r = client.post(
+        "/api/client/auth/login", json={"identifier": identifier, "password": password}
+    )
+    assert r.status_code == 200
+    return r.json()["jwt"]
+
+
+def test_versioned_token_verified_from_claims_until_revoked():
+    cr = client.post(
+        "/api/client",
+        json={
+            "name": "Caio",
+            "cpf": "848.354.160-23",
+            "email": "caio@mail.com",
+            "password": "segredo123",
+        },
+    )
+    assert cr.status_code == 201
+    tok = _login("caio@mail.com", "segredo123")
+    before = client.get("/api/metrics").json()["token_revocations"]["claims_hits"]
+
+    r = client.post("/api/auth", json={"token": tok})
+    assert r.status_code == 200
+    assert r.json()["cpf"] == "848.354.160-23"
+    metrics = client.get("/api/metrics").json()
+    assert metrics["token_revocations"]["claims_hits"] == before + 1
+
+    # trocar o e-mail revoga os tokens emitidos antes
+    r = client.put("/api/client/84835416023", json={"email": "caio2@mail.com"})
+    assert r.status_code == 200
+    r = client.post("/api/auth", json={"token": tok})
+    assert r.status_code == 401
+    assert r.json()["detail"] == "Token revogado"
+
+    # novo login recebe a nova versão
+    tok = _login("caio2@mail.com", "segredo123")
+    assert client.post("/api/auth", json={"token": tok}).status_code == 200
+
+
+def test_revocation_map_loaded_from_database():
+    from app.shared.handles.token_revocation import token_revocations
+
+    cr = client.post(
+        "/api/client",
+        json={
+            "name": "Duda",
+            "cpf": "529.982.247-25",
+            "email": "duda@mail.com",
+            "password": "segredo123",
+        },
+    )
+    assert cr.status_code == 201
+    tok = _login("duda@mail.com", "segredo123")
+    assert client.delete("/api/client/52998224725").status_code == 204
+
+    # outro worker: mapa vazio, precisa carregar do banco
+    token_revocations.clear()
+    r = client.post("/api/auth", json={"token": tok})
+    assert r.status_code == 404
+    assert token_revocations.stats()["size"] == 1
+
+
+def test_newer_token_than_stale_map_goes_to_database():
+    from app.shared.handles.token_revocation import token_revocations
+
+    client.post(
+        "/api/client",
+        json={
+            "name": "Eva",
+            "cpf": "111.444.777-35",
+            "email": "eva@mail.com",
+            "password": "segredo123",
+        },
+    )
+    assert client.put("/api/client/11144477735", json={"name": "Eva Maria"}).json()
+    tok = _login("eva@mail.com", "segredo123")  # ver = 1
+
+    # outro worker: mapa carregado antes da troca, ainda dentro do refresh
+    token_revocations.clear()
+    token_revocations.refresh_if_stale(lambda since: [])
+    claims_hits = token_revocations.stats()["claims_hits"]
+    r = client.post("/api/auth", json={"token": tok})
+    assert r.status_code == 200
+    assert r.json()["name"] == "Eva Maria"
+    assert token_revocations.stats()["claims_hits"] == claims_hits
+
+
+def test_name_change_revokes_claims_with_old_name():
+    client.post(
+        "/api/client",
+        json={
+            "name": "Gil",
+            "cpf": "390.533.447-05",
+            "email": "gil@mail.com",
+            "password": "segredo123",
+        },
+    )
+    tok = _login("gil@mail.com", "segredo123")
+    assert client.post("/api/auth", json={"token": tok}).json()["name"] == "Gil"
+
+    assert client.put("/api/client/39053344705", json={"name": "Gilberto"}).json()
+    r = client.post("/api/auth", json={"token": tok})
+    assert (r.status_code, r.json()["detail"]) == (401, "Token revogado")
+
+
+def test_login_returns_refresh_token_and_refresh_rotates():
+    client.post(
+        "/api/client",
+        json={
+            "name": "Eva",
+            "cpf": "123.456.789-09",
+            "email": "eva@mail.com",
+            "password": "segredo123",
+        },
+    )
+    r = client.post(
+        "/api/client/auth/login",
+        json={"identifier": "eva@mail.com", "password": "segredo123"},
+    )
+    first = r.json()["refresh_token"]
+    assert first
+
+    r = client.post("/api/client/auth/refresh", json={"refresh_token": first})
+    assert r.status_code == 200
+    assert client.post("/api/auth", json={"token": r.json()["jwt"]}).status_code == 200
+
+    r = client.post("/api/client/auth/refresh", json={"refresh_token": first})
+    assert r.status_code == 401
+
+
+def test_credential_change_ends_refresh_sessions():
+    client.post(
+        "/api/client",
+        json={
+            "name": "Ivo",
+            "cpf": "935.411.347-80",
+            "email": "ivo@mail.com",
+            "password": "segredo123",
+        },
+    )
+    login = {"identifier": "ivo@mail.com", "password": "segredo123"}
+    refresh = client.post("/api/client/auth/login", json=login).json()["refresh_token"]
+
+    # nome só revoga o access token; a sessão de refresh continua
+    assert client.put("/api/client/93541134780", json={"name": "Ivo Lima"}).json()
+    r = client.post("/api/client/auth/refresh", json={"refresh_token": refresh})
+    assert r.status_code == 200
+    refresh = r.json()["refresh_token"]
+
+    # e-mail é credencial: a sessão cai junto com o token_version
+    r = client.put("/api/client/93541134780", json={"email": "ivo2@mail.com"})
+    assert r.status_code == 200
+    r = client.post("/api/client/auth/refresh", json={"refresh_token": refresh})
+    assert r.status_code == 401
@@ -0,0 +1,172 @@
+import fnmatch
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from app.adapters.driven.repositories.cached_customer import (
+    CachingCustomerRepository,
+)
+from app.domain.entities.customer import Customer
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+from app.shared.handles.customer_cache import (
+    MISS,
+    CustomerCache,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cached(fake_repo, backend=None):
+    inner = MagicMock(wraps=fake_repo)
+    cache = CustomerCache(backend or InMemoryCacheBackend(), ttl=60, negative_ttl=5)
+    return CachingCustomerRepository(inner, cache), inner, cache
+
+
+def test_memory_backend_lru_and_ttl():
+    clock = FakeClock()
+    backend = InMemoryCacheBackend(maxsize=2, clock=clock)
+    backend.set("a", 1, ttl=10)
+    backend.set("b", 2, ttl=10)
+    assert backend.get("a") == 1  # "b" vira o menos recente
+    backend.set("c", 3, ttl=1)
+
+    assert backend.get("b") is None
+    clock.now = 2
+    assert backend.get("c") is None
+    assert backend.get("a") == 1
+    assert backend.stats()["evictions"] == 1
+    assert backend.stats()["expirations"] == 1
+
+
+def test_read_through_and_hit_ratio(fake_repo, new_customer):
+    repo, inner, cache = _cached(fake_repo)
+    created = repo.create(new_customer())
+
+    assert repo.find_by_cpf("123.456.789-09").id == created.id
+    assert repo.find_by_cpf("12345678909").id == created.id
+    assert repo.find_by_id(created.id).name == "Ana"
+    assert repo.find_by_email("ana@mail.com").id == created.id
+
+    assert inner.find_by_cpf.call_count == 1
+    inner.find_by_id.assert_not_called()
+    inner.find_by_email.assert_not_called()
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["hit_ratio"] == 0.75
+
+
+def test_negative_cache_is_dropped_on_create(fake_repo, new_customer):
+    repo, inner, cache = _cached(fake_repo)
+
+    assert repo.find_by_cpf("12345678909") is None
+    assert repo.find_by_cpf("12345678909") is None
+    assert inner.find_by_cpf.call_count == 1
+    assert cache.stats()["negative_hits"] == 1
+
+    repo.create(new_customer())
+    assert repo.find_by_cpf("12345678909").name == "Ana"
+
+
+def test_update_fields_invalidates_old_and_new_keys(fake_repo, new_customer):
+    repo, inner, _ = _cached(fake_repo)
+    created = repo.create(new_customer())
+    assert repo.find_by_email("ana@mail.com") is not None
+    assert repo.find_by_email("nova@mail.com") is None  # cache negativo
+
+    repo.update_fields("12345678909", {"email": "nova@mail.com", "active": False})
+
+    assert repo.find_by_email("ana@mail.com") is None
+    assert repo.find_by_email("nova@mail.com").id == created.id
+    assert repo.find_by_id(created.id).active is False
+
+
+def test_cached_customer_is_not_shared_with_callers(fake_repo, new_customer):
+    repo, _, _ = _cached(fake_repo)
+    repo.create(new_customer())
+    repo.find_by_cpf("12345678909").name = "Alterado"
+    assert repo.find_by_cpf("12345678909").name == "Ana"
+
+
+class FakeRedis:
+    """Só o necessário do cliente redis-py."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [k for k in self.data if fnmatch.fnmatch(k, match)]
+
+    def info(self, section):
+        return {"evicted_keys": 0}
+
+
+def test_redis_backend_roundtrip(fake_repo, new_customer):
+    client = FakeRedis()
+    repo, inner, cache = _cached(fake_repo, RedisCacheBackend(client))
+    created = repo.create(new_customer())
+
+    assert repo.find_by_id(created.id).cpf.value == "12345678909"
+    assert repo.find_by_id(created.id).cpf.value == "12345678909"
+    assert inner.find_by_id.call_count == 1
+    assert repo.find_by_id(999) is None
+    assert cache.backend.get("id:999") == MISS
+    assert all(key.startswith("customer:") for key in client.data)
+
+    cache.clear()
+    assert client.data == {}
+
+
+def test_redis_backend_stores_plain_json():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client)
+    ana = Customer(
+        7,
+        "Ana",
+        CPF("12345678909"),
+        Email("ana@mail.com"),
+        "hash",
+        active=False,
+        token_version=2,
+        created_at=datetime(2025, 8, 1, 12, 30, tzinfo=timezone.utc),
+    )
+    backend.set("id:7", ana, 60)
+    backend.set("cpf:12345678909", 7, 60)
+    backend.set("email:x@mail.com", MISS, 5)
+
+    assert json.loads(client.data["customer:id:7"])["cpf"] == "12345678909"
+    assert backend.get("id:7") == ana
+    assert backend.get("cpf:12345678909") == 7
+    assert backend.get("email:x@mail.com") == MISS
+
+
+def test_clear_resets_metrics_but_drop_local_state_keeps_them(fake_repo, new_customer):
+    repo, _, cache = _cached(fake_repo)
+    repo.create(new_customer())
+    repo.find_by_cpf("12345678909")
+    repo.find_by_cpf("12345678909")
+
+    cache.drop_local_state()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["size"] == 0
+
+    cache.clear()
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (0, 0, 0)
@@ -0,0 +1,123 @@
+import json
+from types import SimpleNamespace
+
+from app.adapters.driven.notifications.pg_listener import PgNotificationListener
+from app.domain.entities.customer import Customer
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+from app.shared.handles.customer_cache import (
+    CustomerCache,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+from app.shared.handles.customer_changes import CustomerChangeHub
+from app.shared.handles.token_cache import TokenVerificationCache
+from app.shared.handles.token_revocation import TokenRevocationMap
+from tests.unit.test_customer_cache import FakeRedis
+
+
+def _payload(**overrides):
+    data = {
+        "op": "UPDATE",
+        "id": 7,
+        "cpf": "12345678909",
+        "email": "nova@mail.com",
+        "active": False,
+        "token_version": 3,
+        "old_email": "ana@mail.com",
+    }
+    data.update(overrides)
+    return json.dumps(data)
+
+
+def _subscribers():
+    tokens = TokenVerificationCache()
+    revocations = TokenRevocationMap()
+    customers = CustomerCache(InMemoryCacheBackend())
+    return tokens, revocations, customers
+
+
+def test_hub_evicts_local_state():
+    tokens, revocations, customers = _subscribers()
+    hub = CustomerChangeHub([tokens, revocations, customers])
+
+    tokens.put("tok", None, {"id": 7, "name": "Ana"})
+    ana = Customer(7, "Ana", CPF("12345678909"), Email("ana@mail.com"), "h")
+    customers.put(ana)
+
+    hub.publish(_payload())
+
+    assert tokens.get("tok") is None
+    assert revocations.lookup(7) == (3, False)
+    assert customers.find_by_id(7) is None
+    assert customers.backend.get("email:ana@mail.com") is None
+    assert hub.stats()["received"] == 1
+
+
+def test_hub_delete_marks_inactive_and_ignores_garbage():
+    tokens, revocations, customers = _subscribers()
+    hub = CustomerChangeHub([tokens, revocations, customers])
+
+    hub.publish(_payload(op="DELETE", active=True, token_version=0))
+    hub.publish("{nada")
+    hub.publish(json.dumps({"op": "UPDATE"}))
+
+    assert revocations.lookup(7) == (0, False)
+    assert hub.stats() == {"received": 1, "invalid": 2, "resyncs": 0}
+
+
+def test_hub_resync_drops_only_local_state():
+    tokens, revocations, customers = _subscribers()
+    tokens.put("tok", None, {"id": 1})
+    tokens.get("tok")
+    revocations.refresh_if_stale(lambda since: [(1, 2, True, None)])
+    client = FakeRedis()
+    shared = CustomerCache(RedisCacheBackend(client))
+    shared.put(Customer(7, "Ana", CPF("12345678909"), Email("ana@mail.com"), "h"))
+    hub = CustomerChangeHub([tokens, revocations, customers, shared])
+
+    hub.resync()
+
+    assert tokens.stats()["size"] == 0
+    assert tokens.stats()["hits"] == 1  # métricas sobrevivem
+    assert not revocations.is_fresh
+    assert revocations.lookup(1) == (2, True)
+    assert len(client.data) == 3  # keyspace compartilhado intacto
+    assert hub.stats()["resyncs"] == 1
+
+
+def test_listener_drains_pending_notifications():
+    seen = []
+
+    def on_payload(payload):
+        if payload == "boom":
+            raise RuntimeError("falha do assinante")
+        seen.append(payload)
+
+    listener = PgNotificationListener("dsn", "customer_changes", on_payload)
+    conn = SimpleNamespace(
+        poll=lambda: None,
+        notifies=[SimpleNamespace(payload=p) for p in ("a", "boom", "b")],
+    )
+    listener._drain(conn)
+
+    assert seen == ["a", "b"]
+    assert listener.stats()["notifications"] == 3
+
+
+def test_revocation_refresh_is_incremental_after_empty_load():
+    revocations = TokenRevocationMap(refresh_seconds=0, overlap_seconds=30)
+    calls = []
+
+    def loader(since):
+        calls.append(since)
+        return []
+
+    revocations.refresh_if_stale(loader)
+    revocations.refresh_if_stale(loader)
+    revocations.refresh_if_stale(loader)
+
+    assert calls[0] is None
+    assert all(since is not None for since in calls[1:])
+    assert calls[2] >= calls[1]
+    assert revocations.stats()["watermark"] is not None
@@ -0,0 +1,203 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.adapters.driven.models.customer_outbox_model import (
+    CustomerOutboxDeadLetterModel,
+    CustomerOutboxModel,
+)
+from app.adapters.driven.outbox.relay import OutboxRelay
+from app.adapters.driven.outbox.sinks import FileSink, InMemoryBrokerSink, build_sink
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.domain.ports import DuplicateCustomerError
+from database import Base
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    engine.dispose()
+
+
+def _events(session):
+    return [
+        (r.event_type, r.customer_id)
+        for r in session.scalars(
+            select(CustomerOutboxModel).order_by(CustomerOutboxModel.id)
+        )
+    ]
+
+
+class FlakySink:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.delivered = []
+
+    def publish(self, events):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("webhook fora do ar")
+        self.delivered.extend(events)
+
+
+def test_writes_record_events_in_the_same_transaction(Session, new_customer):
+    with Session() as session:
+        repo = CustomerRepository(session, outbox=True)
+        ana = repo.create(new_customer())
+        with pytest.raises(DuplicateCustomerError):
+            repo.create(new_customer(email="outra@mail.com"))
+        repo.update_fields(ana.cpf.value, {"name": "Ana Maria"})
+        repo.update_fields(ana.cpf.value, {"active": False})
+        repo.bulk_create([new_customer("Bia", "52998224725")])
+        repo.delete(ana.id)
+
+        events = _events(session)
+        assert events[:3] == [
+            ("customer.created", ana.id),
+            ("customer.updated", ana.id),
+            ("customer.deactivated", ana.id),
+        ]
+        assert [e[0] for e in events[3:]] == ["customer.created", "customer.deleted"]
+        payload = session.scalars(select(CustomerOutboxModel.payload)).first()
+        assert payload["cpf"] == "12345678909" and "password_hash" not in payload
+
+
+def test_repeated_deactivation_emits_one_deactivated_event(Session, new_customer):
+    with Session() as session:
+        repo = CustomerRepository(session, outbox=True)
+        ana = repo.create(new_customer())
+        repo.update_fields(ana.cpf.value, {"active": False})
+        repo.update_fields(ana.cpf.value, {"active": False, "name": "Ana Maria"})
+
+        assert _events(session) == [
+            ("customer.created", ana.id),
+            ("customer.deactivated", ana.id),
+            ("customer.updated", ana.id),
+        ]
+
+
+def test_outbox_disabled_writes_nothing(Session, new_customer):
+    with Session() as session:
+        CustomerRepository(session, outbox=False).create(new_customer())
+        assert _events(session) == []
+
+
+def test_relay_delivers_in_order_and_deletes(Session, new_customer):
+    with Session() as session:
+        repo = CustomerRepository(session, outbox=True)
+        ana = repo.create(new_customer())
+        repo.update_fields(ana.cpf.value, {"name": "Ana Maria"})
+
+    sink = InMemoryBrokerSink()
+    relay = OutboxRelay(Session, sink, batch_size=1)
+    assert relay.drain_once() == 1
+    assert relay.drain_once() == 1
+    assert relay.drain_once() == 0
+
+    assert [m["type"] for m in sink.messages] == [
+        "customer.created",
+        "customer.updated",
+    ]
+    assert sink.messages[1]["data"]["name"] == "Ana Maria"
+    with Session() as session:
+        assert _events(session) == []
+    stats = relay.stats()
+    assert (stats["published"], stats["batches"]) == (2, 2)
+    assert stats["last_lag_seconds"] is not None
+
+
+def test_relay_backs_off_after_sink_failure(Session, new_customer):
+    with Session() as session:
+        CustomerRepository(session, outbox=True).create(new_customer())
+
+    now = datetime.now(timezone.utc)
+    sink = FlakySink(failures=1)
+    relay = OutboxRelay(Session, sink, clock=lambda: now)
+    assert relay.drain_once() == 0
+    with Session() as session:
+        row = session.scalars(select(CustomerOutboxModel)).one()
+        assert (row.attempts, row.last_error) == (1, "webhook fora do ar")
+
+    # ainda dentro do backoff
+    assert relay.drain_once() == 0
+    assert sink.delivered == []
+
+    relay.clock = lambda: now + timedelta(seconds=2)
+    assert relay.drain_once() == 1
+    assert sink.delivered[0].attempts == 1
+    stats = relay.stats()
+    assert (stats["failed_batches"], stats["retried_events"]) == (1, 1)
+
+
+class PoisonSink:
+    """Recusa qualquer lote que contenha o cliente ``poison``."""
+
+    def __init__(self, poison: int):
+        self.poison = poison
+        self.delivered = []
+
+    def publish(self, events):
+        if any(e.customer_id == self.poison for e in events):
+            raise ValueError("payload rejeitado")
+        self.delivered.extend(events)
+
+
+def test_relay_isolates_poison_event_and_dead_letters_it(Session, new_customer):
+    with Session() as session:
+        repo = CustomerRepository(session, outbox=True)
+        ana = repo.create(new_customer())
+        bia = repo.create(new_customer("Bia", "52998224725"))
+        caio = repo.create(new_customer("Caio", "11144477735"))
+
+    now = datetime.now(timezone.utc)
+    sink = PoisonSink(poison=bia.id)
+    relay = OutboxRelay(Session, sink, max_attempts=2, clock=lambda: now)
+
+    # Ana sai; Bia falha e Caio, não tentado, espera o backoff sem gastar tentativa
+    assert relay.drain_once() == 1
+    with Session() as session:
+        rows = session.scalars(
+            select(CustomerOutboxModel).order_by(CustomerOutboxModel.id)
+        ).all()
+        assert [(r.customer_id, r.attempts) for r in rows] == [
+            (bia.id, 1),
+            (caio.id, 0),
+        ]
+
+    relay.clock = lambda: now + timedelta(seconds=2)
+    assert relay.drain_once() == 0
+    assert relay.drain_once() == 1
+
+    assert [e.customer_id for e in sink.delivered] == [ana.id, caio.id]
+    with Session() as session:
+        assert _events(session) == []
+        dead = session.scalars(select(CustomerOutboxDeadLetterModel)).one()
+        assert (dead.customer_id, dead.attempts) == (bia.id, 2)
+        assert dead.last_error == "payload rejeitado"
+    stats = relay.stats()
+    assert (stats["published"], stats["dead_lettered"]) == (2, 1)
+
+
+def test_relay_requires_explicit_sink():
+    with pytest.raises(ValueError, match="OUTBOX_SINK"):
+        build_sink("")
+
+
+def test_file_sink_appends_ndjson(Session, tmp_path, new_customer):
+    with Session() as session:
+        CustomerRepository(session, outbox=True).create(new_customer())
+    path = tmp_path / "events.ndjson"
+    OutboxRelay(Session, FileSink(str(path))).drain_once()
+
+    (line,) = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["type"] == "customer.created"
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import Response
+
+from app.adapters.driver.controllers import fast_json
+from app.adapters.driver.controllers.schemas import CustomersOut
+from app.domain.entities.customer_view import CustomerView
+
+
+def _view(created_at):
+    return CustomerView(
+        id=7,
+        name="Ana Ção",
+        cpf="12345678909",
+        email="ana@mail.com",
+        active=True,
+        token_version=0,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2025, 8, 20, 12, 0, 0),
+        datetime(2025, 8, 20, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        datetime(2025, 8, 20, 9, 0, 0, tzinfo=timezone(timedelta(hours=-3))),
+    ],
+)
+def test_matches_pydantic_serialization(monkeypatch, use_orjson, created_at):
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson não instalado")
+
+    item = fast_json.customer_item(_view(created_at))
+    expected = CustomersOut(**item).model_dump(mode="json")
+    assert json.loads(fast_json.dumps([item])) == [expected]
+
+
+def test_respond_keeps_route_headers():
+    sub = Response()
+    del sub.headers["content-length"]
+    sub.headers["X-Next-Cursor"] = "abc"
+    r = fast_json.respond({"ok": True}, sub, status_code=201)
+    assert (r.status_code, r.headers["x-next-cursor"]) == (201, "abc")
+    assert r.headers["content-type"] == "application/json"
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -31,6 +33,7 @@ def repo_mock(fake_customer):
 def hasher_mock():
     hasher = MagicMock()
     hasher.verify.return_value = True
+    hasher.needs_rehash.return_value = False
     return hasher
 
 
@@ -57,6 +60,7 @@ def test_identify_success(repo_mock, hasher_mock, fake_customer):
         assert payload["email"] == fake_customer.email.value
         assert payload["name"] == fake_customer.name
         assert payload["role"] == "customer"
+        assert payload["ver"] == fake_customer.token_version
 
 
 def test_identify_success_with_email(repo_mock, hasher_mock, fake_customer):
@@ -96,3 +100,47 @@ def test_invalid_password(repo_mock, hasher_mock, fake_customer):
     service = IdentifyCustomerService(repo_mock, hasher_mock)
     with pytest.raises(ValueError, match="Credenciais inválidas."):
         service.execute(fake_customer.cpf.value, "wrong-password")
+
+
+def test_authenticate_async_awaits_hasher(repo_mock, fake_customer):
+    class AsyncHasher:
+        def __init__(self):
+            self.calls = []
+
+        async def verify_async(self, plain, hashed):
+            self.calls.append((plain, hashed))
+            return True
+
+        def needs_rehash(self, hashed):
+            return False
+
+    hasher = AsyncHasher()
+    service = IdentifyCustomerService(repo_mock, hasher)
+    customer = asyncio.run(
+        service.authenticate_async(fake_customer.cpf.value, "plain-password")
+    )
+
+    assert customer is fake_customer
+    assert hasher.calls == [("plain-password", fake_customer.password_hash)]
+
+
+def test_rehash_on_login_when_policy_changed(repo_mock, hasher_mock, fake_customer):
+    hasher_mock.needs_rehash.return_value = True
+    hasher_mock.hash.return_value = "novo-hash"
+    service = IdentifyCustomerService(repo_mock, hasher_mock)
+
+    customer = service.authenticate(fake_customer.cpf.value, "plain-password")
+
+    hasher_mock.hash.assert_called_once_with("plain-password")
+    repo_mock.update_password_hash.assert_called_once_with(1, "novo-hash")
+    assert customer.password_hash == "novo-hash"
+
+
+def test_no_rehash_on_failed_login(repo_mock, hasher_mock, fake_customer):
+    hasher_mock.verify.return_value = False
+    hasher_mock.needs_rehash.return_value = True
+    service = IdentifyCustomerService(repo_mock, hasher_mock)
+
+    with pytest.raises(ValueError):
+        service.authenticate(fake_customer.cpf.value, "wrong")
+    repo_mock.update_password_hash.assert_not_called()
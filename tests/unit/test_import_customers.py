@@ -0,0 +1,197 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.driver.cli import import_customers
+from app.adapters.driver.cli.import_customers import main, read_csv, read_ndjson
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.domain.entities.customer import Customer
+from app.domain.ports import DuplicateCustomerError
+from app.domain.services.import_customers_service import (
+    ImportCustomersService,
+    ImportRow,
+)
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+
+
+class FakeHasher:
+    def hash(self, plain: str) -> str:
+        return f"hash:{plain}"
+
+
+def _row(line, name="Ana", cpf="12345678909", email=None, password="segredo123"):
+    return ImportRow(line, name, cpf, email or f"{name.lower()}@mail.com", password)
+
+
+def test_import_reports_invalid_and_duplicate_rows(fake_repo):
+    fake_repo.create(
+        Customer(
+            id=None,
+            name="Já Existe",
+            cpf=CPF("52998224725"),
+            email=Email("existe@mail.com"),
+            password_hash="x",
+        )
+    )
+    rows = [
+        _row(1),
+        _row(2, "Bia", cpf="111.444.777-35"),
+        _row(3, "Cris", cpf="123"),
+        _row(4, "Dani", cpf="12345678909"),  # repetido no arquivo
+        _row(5, "Edu", cpf="52998224725"),  # já no banco
+        _row(6, "Fabi", cpf="39053344705", email="existe@mail.com"),
+        _row(7, "Gabi", cpf="86288366757", password="curta"),
+        ImportRow(8, error="JSON inválido."),
+    ]
+
+    with ThreadPoolExecutor(2) as pool:
+        service = ImportCustomersService(fake_repo, FakeHasher(), pool, chunk_size=4)
+        report = service.execute(rows)
+
+    assert (report.total, report.imported, report.failed) == (8, 2, 6)
+    assert [(e.line, e.detail) for e in report.errors] == [
+        (3, "CPF inválido (tamanho)"),
+        (4, "CPF duplicado no arquivo."),
+        (5, "CPF já cadastrado no sistema."),
+        (6, "E-mail já cadastrado no sistema."),
+        (7, "Senha muito curta (mínimo 8 caracteres)."),
+        (8, "JSON inválido."),
+    ]
+    bia = fake_repo.find_by_cpf("11144477735")
+    assert bia.password_hash == "hash:segredo123"
+    assert bia.active is True
+
+
+def test_import_retries_chunk_when_bulk_insert_conflicts(fake_repo):
+    class RacingRepo:
+        """Outro processo grava o CPF entre a checagem e o insert."""
+
+        def __init__(self, inner):
+            self.inner = inner
+            self.raced = False
+
+        def __getattr__(self, name):
+            return getattr(self.inner, name)
+
+        def bulk_create(self, customers):
+            if not self.raced:
+                self.raced = True
+                self.inner.create(
+                    Customer(
+                        None, "Outro", CPF("12345678909"), Email("o@mail.com"), "x"
+                    )
+                )
+            return self.inner.bulk_create(customers)
+
+    service = ImportCustomersService(RacingRepo(fake_repo), FakeHasher())
+    report = service.execute([_row(1), _row(2, "Bia", cpf="11144477735")])
+
+    assert report.imported == 1
+    assert [(e.line, e.detail) for e in report.errors] == [
+        (1, "CPF já cadastrado no sistema.")
+    ]
+
+
+@pytest.mark.parametrize(
+    "error", [DuplicateCustomerError("cpf"), ValueError("Lote rejeitado pelo banco")]
+)
+def test_import_reports_chunk_when_insert_keeps_failing(fake_repo, error):
+    class FailingRepo:
+        def __init__(self, inner):
+            self.inner = inner
+
+        def __getattr__(self, name):
+            return getattr(self.inner, name)
+
+        def bulk_create(self, customers):
+            raise error
+
+    service = ImportCustomersService(FailingRepo(fake_repo), FakeHasher(), chunk_size=2)
+    report = service.execute(
+        [_row(1), _row(2, "Bia", cpf="11144477735"), _row(3, "Caio", cpf="52998224725")]
+    )
+
+    # cada lote que falha entra no relatório e a importação segue
+    assert (report.total, report.imported, report.failed) == (3, 0, 3)
+    assert all(e.detail.startswith("Lote não gravado:") for e in report.errors)
+    # mesmo formato dos erros por linha: o CPF como veio no arquivo
+    assert [e.cpf for e in report.errors] == [
+        "12345678909",
+        "11144477735",
+        "52998224725",
+    ]
+
+
+def test_readers():
+    ndjson = io.StringIO(
+        '{"name": "Ana", "cpf": "1", "email": "a@b.c", "password": "p"}\n'
+        "\n"
+        "{quebrado\n"
+        '{"name": "Ana"}\n'
+    )
+    rows = list(read_ndjson(ndjson))
+    assert [(r.line, r.name, r.error) for r in rows] == [
+        (1, "Ana", None),
+        (3, None, "JSON inválido."),
+        (4, None, "Campos obrigatórios: name, cpf, email, password."),
+    ]
+
+    rows = list(read_csv(io.StringIO("name,cpf,email,password\nAna,1,a@b.c,p\n")))
+    assert [(r.line, r.cpf) for r in rows] == [(2, "1")]
+
+    with pytest.raises(ValueError, match="password"):
+        list(read_csv(io.StringIO("name,cpf,email\n")))
+
+
+@pytest.fixture
+def cli_db(in_memory_session, monkeypatch):
+    """``main`` abre a própria sessão: aponta para o banco em memória."""
+    monkeypatch.setattr(
+        "database.SessionLocal", sessionmaker(bind=in_memory_session.get_bind())
+    )
+    monkeypatch.setattr(import_customers, "default_hasher", FakeHasher)
+    return in_memory_session
+
+
+def test_cli_imports_csv_and_writes_report(cli_db, tmp_path, capsys):
+    source = tmp_path / "clientes.csv"
+    source.write_text(
+        "name,cpf,email,password\n"
+        "Ana,123.456.789-09,ana@mail.com,segredo123\n"
+        "Bia,123,bia@mail.com,segredo123\n",
+        encoding="utf-8",
+    )
+    report = tmp_path / "relatorio.ndjson"
+
+    code = main([str(source), "--workers", "0", "--report", str(report)])
+
+    assert code == 1
+    assert capsys.readouterr().out.strip() == "total=2 importados=1 falhas=1"
+    assert report.read_text(encoding="utf-8").splitlines() == [
+        '{"line": 3, "cpf": "123", "detail": "CPF inválido (tamanho)"}'
+    ]
+    assert CustomerRepository(cli_db).find_by_cpf("12345678909").name == "Ana"
+
+
+def test_cli_reports_to_stderr_and_honors_format(cli_db, tmp_path, capsys):
+    source = tmp_path / "clientes.txt"
+    source.write_text(
+        '{"name": "Ana", "cpf": "12345678909", "email": "ana@mail.com", '
+        '"password": "segredo123"}\n',
+        encoding="utf-8",
+    )
+
+    assert main([str(source), "--format", "ndjson", "--workers", "0"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "total=1 importados=1 falhas=0"
+    assert captured.err == ""
+
+    # cabeçalho incompleto: erro de uso do argparse (exit 2) no stderr
+    source.write_text("name,cpf\nAna,1\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main([str(source), "--format", "csv", "--workers", "0"])
+    assert exc.value.code == 2
+    assert "Cabeçalho sem as colunas: email, password" in capsys.readouterr().err
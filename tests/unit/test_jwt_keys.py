@@ -0,0 +1,76 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.shared.handles import jwt_user
+from app.shared.handles.jwt_keys import KeyRing
+from main import app
+
+ed25519 = pytest.importorskip(
+    "cryptography.hazmat.primitives.asymmetric.ed25519", reason="cryptography"
+)
+rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def rsa_keyring(monkeypatch):
+    old = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    new = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ring = KeyRing(
+        "RS256",
+        private_key=new,
+        kid="2025-08",
+        retired_public_keys={"2025-07": old.public_key()},
+    )
+    monkeypatch.setattr(jwt_user, "keyring", ring)
+    return ring, old
+
+
+def test_hs256_publishes_no_keys():
+    ring = KeyRing("HS256", secret="s3cr3t")
+    assert ring.jwks() == {"keys": []}
+    assert ring.headers is None
+
+
+def test_rs256_roundtrip_with_kid(rsa_keyring):
+    token = jwt_user.create_access_token({"cpf": "12345678909"})
+    assert jwt_user.jwt.get_unverified_header(token)["kid"] == "2025-08"
+    assert jwt_user.verify_jwt(token)["cpf"] == "12345678909"
+
+
+def test_rs256_accepts_retired_key(rsa_keyring):
+    _, old = rsa_keyring
+    token = jwt_user.jwt.encode(
+        {"cpf": "12345678909"}, old, algorithm="RS256", headers={"kid": "2025-07"}
+    )
+    assert jwt_user.verify_jwt(token)["cpf"] == "12345678909"
+
+
+def test_unknown_kid_is_invalid(rsa_keyring):
+    other = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt_user.jwt.encode(
+        {"cpf": "12345678909"}, other, algorithm="RS256", headers={"kid": "x"}
+    )
+    with pytest.raises(ValueError, match="Token inválido"):
+        jwt_user.verify_jwt(token)
+
+
+def test_eddsa_roundtrip(monkeypatch):
+    ring = KeyRing("EdDSA", private_key=ed25519.Ed25519PrivateKey.generate())
+    monkeypatch.setattr(jwt_user, "keyring", ring)
+
+    token = jwt_user.create_access_token({"cpf": "12345678909"})
+    assert jwt_user.verify_jwt(token)["cpf"] == "12345678909"
+    [jwk] = ring.jwks()["keys"]
+    assert jwk["kty"] == "OKP"
+    assert jwk["kid"] == ring.kid
+
+
+def test_jwks_endpoint(rsa_keyring):
+    r = client.get("/.well-known/jwks.json")
+    assert r.status_code == 200
+    assert "max-age" in r.headers["cache-control"]
+    kids = {k["kid"] for k in r.json()["keys"]}
+    assert kids == {"2025-08", "2025-07"}
+    assert all("d" not in k for k in r.json()["keys"])  # nada privado
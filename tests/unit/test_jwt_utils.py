@@ -3,6 +3,7 @@ from datetime import timedelta, datetime
 import pytest
 import jwt
 
+from app.adapters.driven.security.policy_hasher import default_hasher
 from app.shared.handles.jwt_user import (
     create_access_token,
     verify_jwt,
@@ -49,8 +50,9 @@ def test_jwt_invalid_signature():
 
 def test_password_hash_and_verify():
     raw = "Secr3t!"
-    hashed = get_password_hash(raw)
+    hasher = default_hasher()
+    hashed = get_password_hash(raw, hasher)
 
     assert hashed != raw  # de fato foi hasheado
-    assert verify_password(raw, hashed) is True
-    assert verify_password("wrong-pass", hashed) is False
+    assert verify_password(raw, hashed, hasher) is True
+    assert verify_password("wrong-pass", hashed, hasher) is False
@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from app.adapters.driven.security.calibrate import calibrate
+from app.adapters.driven.security.policy_hasher import HashPolicy, PolicyPasswordHasher
+
+
+def test_hash_and_verify():
+    hasher = PolicyPasswordHasher(HashPolicy(rounds=4))
+    hashed = hasher.hash("segredo123")
+    assert hashed.startswith("$2b$04$")
+    assert hasher.verify("segredo123", hashed)
+    assert not hasher.verify("outra", hashed)
+    assert not hasher.needs_rehash(hashed)
+
+
+def test_needs_rehash_when_cost_changes():
+    old = PolicyPasswordHasher(HashPolicy(rounds=4)).hash("segredo123")
+    new_policy = PolicyPasswordHasher(HashPolicy(rounds=5))
+
+    assert new_policy.verify("segredo123", old)  # hash antigo continua aceito
+    assert new_policy.needs_rehash(old)
+
+
+def test_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        HashPolicy(scheme="md5")
+
+
+def test_picklable_for_process_pool():
+    hasher = pickle.loads(pickle.dumps(PolicyPasswordHasher(HashPolicy(rounds=4))))
+    assert hasher.policy.rounds == 4
+    assert hasher.verify("x" * 8, hasher.hash("x" * 8))
+
+
+def test_calibrate_stops_above_target():
+    chosen, measured = calibrate("bcrypt", target_ms=5, samples=1)
+    assert measured[-1][1] > 5
+    # escolhe o último custo medido abaixo do alvo (ou o mínimo)
+    expected = measured[-2][0] if len(measured) > 1 else measured[0][0]
+    assert chosen == expected
+
+
+def test_argon2_hash_verify_and_rehash():
+    policy = HashPolicy(scheme="argon2", time_cost=1, memory_cost=1024, parallelism=1)
+    hasher = PolicyPasswordHasher(policy)
+    hashed = hasher.hash("segredo123")
+
+    assert hashed.startswith("$argon2id$")
+    assert hasher.verify("segredo123", hashed)
+    assert not hasher.verify("outra", hashed)
+    assert not hasher.needs_rehash(hashed)
+    # custo maior, ou troca de algoritmo, pede rehash no próximo login
+    stronger = PolicyPasswordHasher(
+        HashPolicy(scheme="argon2", time_cost=2, memory_cost=1024, parallelism=1)
+    )
+    assert stronger.needs_rehash(hashed)
+    bcrypt_hash = PolicyPasswordHasher(HashPolicy(rounds=4)).hash("segredo123")
+    assert hasher.verify("segredo123", bcrypt_hash)
+    assert hasher.needs_rehash(bcrypt_hash)
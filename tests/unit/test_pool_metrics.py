@@ -0,0 +1,49 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.shared.handles.pool_metrics import TimedQueuePool, pool_stats
+from main import app
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_reports_checked_out_connections(engine):
+    with engine.connect() as conn:
+        conn.execute(text("select 1"))
+        stats = pool_stats(engine)
+        assert stats["pool_class"] == "TimedQueuePool"
+        assert stats["checked_out"] == 1
+        assert stats["size"] == 1
+
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["checkout_wait_max_ms"] >= 0
+
+
+def test_counts_checkout_timeouts(engine):
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["checkout_timeouts"] == 1
+    assert stats["checkout_wait_max_ms"] >= 50
+
+
+def test_metrics_endpoint_exposes_pool():
+    body = TestClient(app).get("/api/metrics").json()
+    assert body["db_pool"]["sync"]["pool_class"] == "TimedQueuePool"
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from app.adapters.driven.security.process_pool_hasher import (
+    HasherBusyError,
+    HasherTimeoutError,
+    ProcessPoolPasswordHasher,
+)
+
+
+class ReverseHasher:
+    """Hasher barato e picklable para rodar nos processos filhos."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def hash(self, plain: str) -> str:
+        time.sleep(self.delay)
+        return plain[::-1]
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        time.sleep(self.delay)
+        return plain[::-1] == hashed
+
+
+class BrokenHasher:
+    def hash(self, plain: str) -> str:
+        raise ValueError("hash corrompido")
+
+
+@pytest.fixture
+def make_hasher():
+    created = []
+
+    def _make(**kwargs):
+        hasher = ProcessPoolPasswordHasher(**kwargs)
+        created.append(hasher)
+        return hasher
+
+    yield _make
+    for hasher in created:
+        hasher.shutdown()
+
+
+def test_sync_roundtrip(make_hasher):
+    hasher = make_hasher(inner=ReverseHasher(), max_workers=1)
+    hashed = hasher.hash("segredo")
+    assert hashed == "oderges"
+    assert hasher.verify("segredo", hashed) is True
+    assert hasher.metrics()["completed"] == 2
+
+
+def test_async_roundtrip(make_hasher):
+    hasher = make_hasher(inner=ReverseHasher(), max_workers=1)
+
+    async def run():
+        hashed = await hasher.hash_async("segredo")
+        return await hasher.verify_async("segredo", hashed)
+
+    assert asyncio.run(run()) is True
+
+
+def test_rejects_when_queue_full(make_hasher):
+    hasher = make_hasher(inner=ReverseHasher(delay=0.5), max_workers=1, max_pending=1)
+    hasher.hash("aquece")  # sobe o processo filho
+
+    async def run():
+        first = asyncio.ensure_future(hasher.hash_async("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(HasherBusyError):
+            await hasher.hash_async("b")
+        return await first
+
+    assert asyncio.run(run()) == "a"
+    metrics = hasher.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["peak_pending"] == 1
+
+
+def test_timeout(make_hasher):
+    hasher = make_hasher(inner=ReverseHasher(delay=1), max_workers=1, timeout=0.05)
+    with pytest.raises(HasherTimeoutError):
+        hasher.hash("lento")
+    assert hasher.metrics()["timeouts"] == 1
+
+
+def test_failed_and_cancelled_are_not_completed(make_hasher):
+    hasher = make_hasher(inner=BrokenHasher(), max_workers=1)
+    with pytest.raises(ValueError):
+        hasher.hash("segredo")
+
+    # future cancelada no shutdown também passa pelo callback
+    cancelled = Future()
+    hasher.pending += 1
+    cancelled.add_done_callback(hasher._done)
+    cancelled.cancel()
+
+    metrics = hasher.metrics()
+    assert (metrics["completed"], metrics["failed"], metrics["cancelled"]) == (0, 1, 1)
+    assert metrics["pending"] == 0
@@ -0,0 +1,135 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.driven.models.login_throttle_model import LoginThrottleBucketModel
+from app.adapters.driven.repositories.throttle_bucket import DatabaseBucketStore
+from app.shared.handles import rate_limiter
+from app.shared.handles.rate_limiter import (
+    InMemoryBucketStore,
+    LoginThrottle,
+    parse_networks,
+    resolve_client_ip,
+)
+from main import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    store = InMemoryBucketStore(clock=clock)
+
+    assert [store.take("k", 2, 1.0) for _ in range(3)] == [0.0, 0.0, 1.0]
+    clock.now += 1
+    assert store.take("k", 2, 1.0) == 0.0
+
+
+def test_in_memory_store_is_bounded():
+    store = InMemoryBucketStore(max_keys=2)
+    for key in "abc":
+        store.take(key, 5, 1)
+    assert len(store) == 2
+
+
+def test_throttle_by_identifier_normalizes_cpf():
+    throttle = LoginThrottle(InMemoryBucketStore(), id_capacity=1, id_per_minute=1)
+
+    assert throttle.check("123.456.789-09", "10.0.0.1") == 0
+    assert throttle.check("12345678909", "10.0.0.2") > 0
+    assert throttle.stats()["rejected_identifier"] == 1
+
+
+def test_throttle_by_ip():
+    throttle = LoginThrottle(InMemoryBucketStore(), ip_capacity=1, ip_per_minute=1)
+
+    assert throttle.check("a@mail.com", "10.0.0.1") == 0
+    assert throttle.check("b@mail.com", "10.0.0.1") > 0
+    assert throttle.check("b@mail.com", "10.0.0.2") == 0
+    assert throttle.stats()["rejected_ip"] == 1
+
+
+def test_disabled_throttle_allows_everything():
+    throttle = LoginThrottle(InMemoryBucketStore(), id_capacity=0, enabled=False)
+    assert throttle.check("a@mail.com", "10.0.0.1") == 0
+
+
+def test_database_store_shares_state(in_memory_session):
+    clock = FakeClock()
+    worker_a = DatabaseBucketStore(in_memory_session, clock=clock)
+    worker_b = DatabaseBucketStore(in_memory_session, clock=clock)
+
+    assert worker_a.take("id:x", 1, 0.5) == 0
+    assert worker_b.take("id:x", 1, 0.5) == pytest.approx(2.0)
+    clock.now += 2
+    assert worker_a.take("id:x", 1, 0.5) == 0
+
+
+def test_login_endpoint_returns_429_before_hashing(monkeypatch):
+    throttle = LoginThrottle(InMemoryBucketStore(), id_capacity=2, id_per_minute=1)
+    monkeypatch.setattr(
+        "app.adapters.driver.controllers.customer_controller.login_throttle", throttle
+    )
+    client = TestClient(app)
+    body = {"identifier": "ninguem@mail.com", "password": "errada123"}
+
+    assert client.post("/api/client/auth/login", json=body).status_code == 400
+    assert client.post("/api/client/auth/login", json=body).status_code == 400
+    r = client.post("/api/client/auth/login", json=body)
+    assert r.status_code == 429
+    assert int(r.headers["retry-after"]) >= 1
+    assert rate_limiter.login_throttle is not throttle  # só o controller foi trocado
+
+
+def test_client_ip_uses_forwarded_for_only_from_trusted_proxies():
+    trusted = parse_networks("10.0.0.0/8, 172.16.0.1")
+
+    assert resolve_client_ip("203.0.113.9", "1.2.3.4", trusted) == "203.0.113.9"
+    assert resolve_client_ip("10.0.0.5", None, trusted) == "10.0.0.5"
+    assert resolve_client_ip("10.0.0.5", "198.51.100.7", trusted) == "198.51.100.7"
+    # o primeiro item veio do cliente e pode ser forjado
+    assert (
+        resolve_client_ip("10.0.0.5", "6.6.6.6, 198.51.100.7, 172.16.0.1", trusted)
+        == "198.51.100.7"
+    )
+
+
+def test_database_store_prunes_idle_buckets(in_memory_session):
+    clock = FakeClock()
+    store = DatabaseBucketStore(
+        in_memory_session, clock=clock, ttl_seconds=60, prune_every=0
+    )
+    store.take("ip:velho", 5, 1)
+    clock.now += 120
+    store.take("ip:novo", 5, 1)
+
+    assert store.prune() == 1
+    assert in_memory_session.get(LoginThrottleBucketModel, "ip:velho") is None
+    assert in_memory_session.get(LoginThrottleBucketModel, "ip:novo") is not None
+
+
+def test_ip_rejection_does_not_spend_identifier_tokens():
+    store = InMemoryBucketStore()
+    throttle = LoginThrottle(store, id_capacity=1, ip_capacity=1, ip_per_minute=1)
+
+    assert throttle.check("a@mail.com", "10.0.0.1") == 0
+    # IP esgotado: a tentativa com outro identificador não toca no balde dele
+    assert throttle.check("b@mail.com", "10.0.0.1") > 0
+    assert throttle.check("b@mail.com", "10.0.0.2") == 0
+    assert throttle.stats()["rejected_ip"] == 1
+    assert throttle.stats()["rejected_identifier"] == 0
+
+
+def test_database_store_charges_buckets_all_or_nothing(in_memory_session):
+    store = DatabaseBucketStore(in_memory_session, clock=FakeClock(), prune_every=0)
+
+    assert store.take_many([("id:x", 2, 0.1), ("ip:y", 1, 0.1)]) == [0, 0]
+    waits = store.take_many([("id:x", 2, 0.1), ("ip:y", 1, 0.1)])
+    assert waits[0] == 0 and waits[1] > 0
+    tokens = in_memory_session.get(LoginThrottleBucketModel, "id:x").tokens
+    assert tokens == pytest.approx(1)
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+
+from app.adapters.driven.repositories.customer import CustomerRepository
+from app.adapters.driven.repositories.refresh_token import RefreshTokenRepository
+from app.domain.entities.customer import Customer
+from app.domain.services.refresh_session_service import RefreshSessionService
+from app.domain.value_objects.cpf import CPF
+from app.domain.value_objects.email import Email
+from app.shared.handles.jwt_user import verify_jwt
+
+
+@pytest.fixture
+def customer(fake_repo):
+    return fake_repo.create(
+        Customer(
+            id=None,
+            name="Ana",
+            cpf=CPF("12345678909"),
+            email=Email("ana@mail.com"),
+            password_hash="<PASSWORD>",
+        )
+    )
+
+
+@pytest.fixture
+def service(in_memory_session):
+    return RefreshSessionService(
+        RefreshTokenRepository(in_memory_session),
+        CustomerRepository(in_memory_session),
+    )
+
+
+def test_rotate_issues_new_pair(service, customer):
+    first = service.start(customer)
+    access, second = service.rotate(first)
+
+    assert second != first
+    assert verify_jwt(access)["id"] == customer.id
+    # o novo token também funciona
+    service.rotate(second)
+
+
+def test_reuse_revokes_whole_family(service, customer):
+    first = service.start(customer)
+    _, second = service.rotate(first)
+
+    with pytest.raises(ValueError, match="reutilizado"):
+        service.rotate(first)
+    # o token legítimo mais recente também morreu
+    with pytest.raises(ValueError, match="reutilizado"):
+        service.rotate(second)
+
+
+def test_unknown_token(service):
+    with pytest.raises(ValueError, match="Refresh token inválido."):
+        service.rotate("nao-existe")
+
+
+def test_expired_token(in_memory_session, customer):
+    service = RefreshSessionService(
+        RefreshTokenRepository(in_memory_session),
+        CustomerRepository(in_memory_session),
+        ttl=timedelta(seconds=-1),
+    )
+    with pytest.raises(ValueError, match="expirado"):
+        service.rotate(service.start(customer))
+
+
+def test_inactive_customer(service, customer, fake_repo):
+    token = service.start(customer)
+    customer.active = False
+    fake_repo.update(customer)
+
+    with pytest.raises(ValueError, match="inativo"):
+        service.rotate(token)
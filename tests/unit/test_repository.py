@@ -1,13 +1,18 @@
+from datetime import datetime
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
+from app.domain.value_objects.page import ChangeCursor, CustomerFilter
 from database import Base
 from app.adapters.driven.repositories.customer import CustomerRepository
 from app.domain.entities.customer import Customer
+from app.domain.entities.customer_view import CustomerView
+from app.domain.ports import DuplicateCustomerError
 
 
 @pytest.fixture
@@ -101,3 +106,225 @@ def test_delete(repo):
 
     # deve sumir
     assert repo.find_by_id(created.id) is None
+
+
+def test_find_many_by_cpfs(repo):
+    for name, cpf in [("Ana", "12345678909"), ("Bia", "52998224725")]:
+        repo.create(
+            Customer(
+                id=None,
+                name=name,
+                cpf=CPF(cpf),
+                email=Email(f"{name.lower()}@mail.com"),
+                password_hash="<PASSWORD>",
+            )
+        )
+
+    found = repo.find_many_by_cpfs(["123.456.789-09", "52998224725", "84835416023"])
+    assert sorted(c.name for c in found) == ["Ana", "Bia"]
+    assert repo.find_many_by_cpfs([]) == []
+
+
+def _valid_cpf(base: int) -> str:
+    digits = [int(d) for d in f"{base:09d}"]
+    for size in (9, 10):
+        total = sum(d * (size + 1 - i) for i, d in enumerate(digits))
+        digits.append((total * 10 % 11) % 10)
+    return "".join(map(str, digits))
+
+
+def _seed(repo, names):
+    return [
+        repo.create(
+            Customer(
+                id=None,
+                name=name,
+                cpf=CPF(_valid_cpf(100000000 + i)),
+                email=Email(f"c{i}@mail.com"),
+                password_hash="<PASSWORD>",
+            )
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def test_list_page_walks_all_rows_with_same_timestamp(repo):
+    created = _seed(repo, [f"Cliente {i}" for i in range(7)])
+
+    seen, cursor = [], None
+    while True:
+        page = repo.list_page(CustomerFilter(), limit=3, after=cursor)
+        seen.extend(c.id for c in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+        assert len(page.items) == 3
+
+    assert seen == [c.id for c in created]
+
+
+def test_list_page_filters(repo):
+    created = _seed(repo, ["Ana", "ANAlice", "Bia", "an_a"])
+    created[1].active = False
+    repo.update(created[1])
+
+    def names(**kw):
+        page = repo.list_page(CustomerFilter(**kw), limit=10)
+        return [c.name for c in page.items]
+
+    assert names(name_prefix="an") == ["Ana", "ANAlice", "an_a"]
+    assert names(name_prefix="an_") == ["an_a"]
+    assert names(name_prefix="an", active=True) == ["Ana", "an_a"]
+    assert names(created_to=datetime(2000, 1, 1)) == []
+    assert len(names(created_from=datetime(2000, 1, 1))) == 4
+    assert repo.estimate_count(CustomerFilter(active=True)) == 3
+    assert repo.estimate_count(CustomerFilter()) == 4
+
+
+def test_stream_export_yields_batches_without_password(repo):
+    created = _seed(repo, ["Ana", "Bia", "Cris"])
+
+    batches = list(repo.stream_export(CustomerFilter(), batch_size=2))
+    assert [len(b) for b in batches] == [2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row[0] for row in rows] == [c.id for c in created]
+    assert all("<PASSWORD>" not in row for row in rows)
+
+
+def test_create_maps_unique_violation(repo):
+    _seed(repo, ["Ana"])
+    duplicate = Customer(
+        id=None,
+        name="Outra",
+        cpf=CPF(_valid_cpf(100000000)),
+        email=Email("nova@mail.com"),
+        password_hash="<PASSWORD>",
+    )
+    with pytest.raises(DuplicateCustomerError) as exc:
+        repo.create(duplicate)
+    assert exc.value.field == "cpf"
+
+
+def test_update_fields_is_one_update(repo, session):
+    ana, bia = _seed(repo, ["Ana", "Bia"])
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    updated = repo.update_fields(
+        ana.cpf.formatted(), {"name": "Ana Maria", "email": ana.email.value}
+    )
+    # SQLite: estado anterior num SELECT antes; no PostgreSQL vem no RETURNING
+    assert [s.split()[0] for s in statements] == ["SELECT", "UPDATE"]
+    # o nome sobe a versão (vai nas claims); o e-mail igual não
+    assert (updated.name, updated.token_version) == ("Ana Maria", 1)
+
+    updated = repo.update_fields(
+        ana.cpf.value, {"email": "nova@mail.com", "active": False}
+    )
+    assert (updated.email.value, updated.active, updated.token_version) == (
+        "nova@mail.com",
+        False,
+        3,
+    )
+    # desativar de novo não revoga outra vez
+    assert repo.update_fields(ana.cpf.value, {"active": False}).token_version == 3
+
+    with pytest.raises(DuplicateCustomerError) as exc:
+        repo.update_fields(ana.cpf.value, {"cpf": bia.cpf.value})
+    assert exc.value.field == "cpf"
+    assert repo.update_fields(_valid_cpf(999999999), {"name": "X"}) is None
+
+
+def test_views_select_only_projected_columns(repo, session):
+    ana, bia = _seed(repo, ["Ana", "Bia"])
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    view = repo.get_view(ana.id)
+    assert isinstance(view, CustomerView)
+    assert (view.name, view.cpf, view.email) == ("Ana", ana.cpf.value, ana.email.value)
+    assert view.formatted_cpf == ana.cpf.formatted()
+    assert repo.get_view_by_cpf(bia.cpf.formatted()).id == bia.id
+    assert repo.get_view(9999) is None
+    views = repo.find_views_by_cpfs([ana.cpf.value, bia.cpf.formatted(), "000"])
+    assert sorted(v.id for v in views) == [ana.id, bia.id]
+    assert repo.find_views_by_cpfs([]) == []
+    assert all("password_hash" not in s for s in statements)
+
+    page = repo.list_page(CustomerFilter(), limit=10)
+    assert all(isinstance(v, CustomerView) for v in page.items)
+
+
+def test_find_many_by_ids(repo):
+    ana, bia = _seed(repo, ["Ana", "Bia"])
+    found = repo.find_many_by_ids([bia.id, ana.id, 9999])
+    assert sorted(c.name for c in found) == ["Ana", "Bia"]
+    assert [v.name for v in repo.find_views_by_ids([bia.id])] == ["Bia"]
+    assert repo.find_many_by_ids([]) == []
+
+
+def test_search_ranks_prefix_first_and_escapes_wildcards(repo):
+    _seed(repo, ["Mariana", "Ana Paula", "Luana", "Bia_1"])
+
+    def names(term, limit=10):
+        return [v.name for v in repo.search(term, limit)]
+
+    assert names("ANA") == ["Ana Paula", "Luana", "Mariana"]
+    assert names("ana", limit=1) == ["Ana Paula"]
+    assert names("c3@mail") == ["Bia_1"]
+    assert names("a_1") == ["Bia_1"]
+    assert names("%") == []
+
+
+def test_list_changes_walks_feed_with_tombstones(repo):
+    ana, bia, cris = _seed(repo, ["Ana", "Bia", "Cris"])
+    repo.update_fields(ana.cpf.value, {"active": False})
+
+    seen, cursor = [], None
+    while True:
+        page = repo.list_changes(cursor, limit=2)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(v.id for v in seen) == [ana.id, bia.id, cris.id]
+    assert [v.active for v in seen if v.id == ana.id] == [False]
+    last = seen[-1]
+    assert repo.list_changes(ChangeCursor(last.updated_at, last.id), 10).items == []
+    assert repo.list_changes(None, 10, until=datetime(2000, 1, 1)).items == []
+
+
+def test_bulk_create_wraps_other_constraint_errors(repo):
+    broken = Customer(None, None, CPF("12345678909"), Email("a@mail.com"), "x")
+
+    with pytest.raises(ValueError, match="Lote rejeitado") as info:
+        repo.bulk_create([broken])
+    assert not isinstance(info.value, DuplicateCustomerError)
+    assert repo.find_by_cpf("12345678909") is None
+
+
+def test_update_fields_statement_reads_previous_state_in_postgres():
+    from sqlalchemy.dialects import postgresql
+
+    from app.adapters.driven.repositories.customer_queries import (
+        update_fields_statements,
+    )
+
+    previous, statement = update_fields_statements(
+        "12345678909", {"active": False}, "postgresql"
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert previous is None
+    assert "FOR UPDATE" in sql
+    assert "previous.active AS was_active" in sql
+    assert sql.rstrip().endswith("previous.email AS was_email")
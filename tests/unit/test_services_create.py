@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from app.adapters.driven.security.bcrypt_hasher import BcryptPasswordHasher
@@ -40,3 +42,29 @@ def test_create_customer_repeated_cpf(fake_repo):
     svc.execute(cust1, "password1234")
     with pytest.raises(ValueError, match="CPF já cadastrado"):
         svc.execute(cust2, "password1234")
+
+
+def test_create_customer_repeated_email_uses_constraint(fake_repo):
+    svc = CreateCustomerService(fake_repo, BcryptPasswordHasher(rounds=4))
+    svc.execute(
+        Customer(None, "Ana", CPF("12345678909"), Email("ana@mail.com"), ""),
+        "password1234",
+    )
+    with pytest.raises(ValueError, match="E-mail já cadastrado no sistema."):
+        svc.execute(
+            Customer(None, "Bia", CPF("52998224725"), Email("ana@mail.com"), ""),
+            "password1234",
+        )
+    # a sessão continua utilizável depois do rollback
+    assert len(fake_repo.list_all()) == 1
+
+
+def test_create_customer_short_password_skips_hash(fake_repo):
+    hasher = MagicMock()
+    svc = CreateCustomerService(fake_repo, hasher)
+    with pytest.raises(ValueError, match="Senha muito curta"):
+        svc.execute(
+            Customer(None, "Ana", CPF("12345678909"), Email("ana@mail.com"), ""),
+            "curta",
+        )
+    hasher.hash.assert_not_called()
@@ -0,0 +1,50 @@
+import time
+
+from app.shared.handles.token_cache import TokenVerificationCache
+
+RESULT = {"id": 1, "name": "Ana", "cpf": "123.456.789-09", "email": "ana@mail.com"}
+
+
+def test_miss_then_hit():
+    cache = TokenVerificationCache(maxsize=10, ttl=60)
+    assert cache.get("tok") is None
+
+    cache.put("tok", None, RESULT)
+    assert cache.get("tok") == RESULT
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_ttl_capped_by_exp():
+    cache = TokenVerificationCache(maxsize=10, ttl=60)
+    cache.put("tok", time.time() - 1, RESULT)
+    assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    cache = TokenVerificationCache(maxsize=2, ttl=60)
+    cache.put("a", None, RESULT)
+    cache.put("b", None, {**RESULT, "id": 2})
+    cache.get("a")  # "a" passa a ser o mais recente
+    cache.put("c", None, {**RESULT, "id": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULT
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_customer():
+    cache = TokenVerificationCache(maxsize=10, ttl=60)
+    cache.put("a", None, RESULT)
+    cache.put("b", None, RESULT)
+    cache.put("c", None, {**RESULT, "id": 2})
+
+    cache.invalidate_customer(1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
@@ -1,5 +1,6 @@
 import pytest
 from app.domain.entities.customer import Customer
+from app.domain.ports import DuplicateCustomerError
 from app.domain.services.update_customer_service import UpdateCustomerService
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
@@ -12,16 +13,37 @@ class FakeRepo:
         self.mapping_by_email = mapping_by_email or {}
         self.updated = None
 
-    def find_by_cpf(self, cpf: str):
-        return self.mapping_by_cpf.get(cpf)
-
-    def find_by_email(self, email: str):
-        return self.mapping_by_email.get(email)
-
-    def update(self, customer: Customer) -> Customer:
-        # armazena o cliente recebido e retorna
-        self.updated = customer
-        return customer
+    def update_fields(self, cpf: str, changes: dict):
+        # mesmo contrato do UPDATE ... RETURNING do repositório real
+        cust = self.mapping_by_cpf.get(cpf)
+        if not cust:
+            return None
+        cpf_owner = self.mapping_by_cpf.get(changes.get("cpf"))
+        if cpf_owner and cpf_owner is not cust:
+            raise DuplicateCustomerError("cpf")
+        email_owner = self.mapping_by_email.get(changes.get("email"))
+        if email_owner and email_owner is not cust:
+            raise DuplicateCustomerError("email")
+
+        # token_version + CASE ... (ver update_fields_statement), contra a linha antiga
+        revocations = 0
+        if "cpf" in changes:
+            revocations += changes["cpf"] != cust.cpf.value
+            cust.cpf = CPF(changes["cpf"])
+        if "email" in changes:
+            revocations += changes["email"] != cust.email.value
+            cust.email = Email(changes["email"])
+        if "name" in changes:
+            revocations += changes["name"] != cust.name
+            cust.name = changes["name"]
+        if "active" in changes:
+            revocations += cust.active and not changes["active"]
+            cust.active = changes["active"]
+        cust.token_version += revocations
+
+        # armazena o cliente alterado e retorna
+        self.updated = cust
+        return cust
 
 
 def make_customer(
@@ -123,3 +145,30 @@ def test_success_update_cpf_and_email():
     assert updated.email.value == new_email
     assert repo.updated.cpf.value == "52998224725"
     assert repo.updated.email.value == new_email
+
+
+def test_revokes_tokens_on_deactivation_and_identity_change():
+    existing = make_customer()
+    repo = FakeRepo(
+        mapping_by_cpf={"12345678909": existing},
+        mapping_by_email={"orig@mail.com": existing},
+    )
+    svc = UpdateCustomerService(repo)
+
+    assert svc.execute("12345678909", {"name": "Original"}).token_version == 0
+    assert svc.execute("12345678909", {"name": "Outro"}).token_version == 1
+    assert svc.execute("12345678909", {"email": "new@mail.com"}).token_version == 2
+    assert svc.execute("12345678909", {"active": False}).token_version == 3
+
+
+def test_notifies_listeners():
+    existing = make_customer()
+    repo = FakeRepo(mapping_by_cpf={"12345678909": existing})
+    seen = []
+
+    class Listener:
+        def customer_changed(self, customer):
+            seen.append(customer.id)
+
+    UpdateCustomerService(repo, [Listener()]).execute("12345678909", {"name": "X"})
+    assert seen == [1]
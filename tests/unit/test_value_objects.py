@@ -1,7 +1,10 @@
+from datetime import datetime
+
 import pytest
 
 from app.domain.value_objects.cpf import CPF
 from app.domain.value_objects.email import Email
+from app.domain.value_objects.page import PageCursor
 
 
 @pytest.mark.parametrize("cpf", ["12345678909", "123.456.789-09"])
@@ -26,3 +29,23 @@ def test_email_ok():
 def test_email_fail(invalid):
     with pytest.raises(ValueError):
         Email(invalid)
+
+
+def test_page_cursor_roundtrip():
+    cursor = PageCursor(datetime(2025, 8, 1, 12, 30, 5, 123), 42)
+    assert PageCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "abc", "W10", "WyJ4IiwgMV0"])
+def test_page_cursor_invalid(token):
+    with pytest.raises(ValueError, match="Cursor inválido"):
+        PageCursor.decode(token)
+
+
+def test_trusted_constructors_skip_validation_and_intern():
+    assert CPF.trusted("12345678909") == CPF("123.456.789-09")
+    assert CPF.trusted("12345678909") is CPF.trusted("12345678909")
+    assert Email.trusted("ana@mail.com") == Email("ana@mail.com")
+    assert Email.trusted("ana@mail.com") is Email.trusted("ana@mail.com")
+    # sem revalidação: só para dados que já passaram pelo construtor normal
+    assert CPF.trusted("00000000000").formatted() == "000.000.000-00"